@@ -1,9 +1,10 @@
 """AI layer: assistive policy, explainability."""
 
 from ai_arb_lab.ai.explain import explain_suggestion
-from ai_arb_lab.ai.policy import PolicyModule
+from ai_arb_lab.ai.policy import PolicyModule, PolicySuggestion
 
 __all__ = [
     "PolicyModule",
+    "PolicySuggestion",
     "explain_suggestion",
 ]
@@ -5,9 +5,13 @@ from ai_arb_lab.ai.policy import PolicySuggestion
 
 def explain_suggestion(suggestion: PolicySuggestion) -> str:
     """Produce a human-readable explanation for a policy suggestion."""
-    return (
+    text = (
         f"Parameter: {suggestion.parameter}\n"
         f"Suggested value: {suggestion.value}\n"
         f"Rationale: {suggestion.rationale}\n"
         f"Confidence: {suggestion.confidence:.0%}"
     )
+    if suggestion.bounds is not None:
+        low, high = suggestion.bounds
+        text += f"\nRange: {low:g} to {high:g}"
+    return text
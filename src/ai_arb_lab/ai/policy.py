@@ -3,51 +3,183 @@
 This is NOT predictive. It proposes parameters (e.g., min spread) based on
 historical synthetic data. Humans make final decisions. Deterministic fallback
 when AI is disabled.
+
+History is consumed as a stream into mergeable quantile sketches (see
+`ai_arb_lab.core.sketch`), one per observed quantity:
+
+| Sketch | Observed | Suggests |
+|--------|----------|----------|
+| `spread_bps` | best cross-venue spread per window | `min_spread_bps` (75th pct) |
+| `half_spread_bps` | each venue's own half bid-ask spread | `slippage_bps` (90th pct) |
+| `top_size` | smaller of best bid and best ask size | `max_order_size` (25th pct) |
+
+Memory is a few KB per sketch however much history is fed, and modules
+trained on different venues, days or worker processes combine with
+`merge`. Confidence reflects both the sample size and the sketch error.
 """
 
-from dataclasses import dataclass
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from ai_arb_lab.core.sketch import QuantileSketch
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# z-score of the two-sided 95% band around a sample quantile's rank
+_Z95 = 1.96
 
 
 @dataclass
 class PolicySuggestion:
-    """A suggested parameter from the policy module."""
+    """A suggested parameter from the policy module.
+
+    `bounds` is the range the value could take given the sample size and
+    sketch error (None for deterministic fallbacks).
+    """
 
     parameter: str
     value: float
     rationale: str
     confidence: float = 1.0  # 0-1, 1 = deterministic
+    bounds: tuple[float, float] | None = None
 
 
+@dataclass(frozen=True)
+class _Rule:
+    """Which sketch and quantile a parameter is suggested from."""
+
+    sketch: str
+    quantile: float
+    description: str
+
+
+RULES: dict[str, _Rule] = {
+    "min_spread_bps": _Rule("spread_bps", 0.75, "historical cross-venue spreads (bps)"),
+    "slippage_bps": _Rule("half_spread_bps", 0.90, "venue half-spreads (bps)"),
+    "max_order_size": _Rule("top_size", 0.25, "top-of-book sizes"),
+}
+
+
+def _new_sketches(k: int) -> dict[str, QuantileSketch]:
+    return {name: QuantileSketch(k) for name in ("spread_bps", "half_spread_bps", "top_size")}
+
+
+@dataclass
 class PolicyModule:
     """Offline policy that suggests strategy parameters. Assistive only."""
 
-    def __init__(self, enabled: bool = True, default_min_spread_bps: float = 20.0) -> None:
-        self.enabled = enabled
-        self.default_min_spread_bps = default_min_spread_bps
+    enabled: bool = True
+    default_min_spread_bps: float = 20.0
+    default_slippage_bps: float = 5.0
+    default_max_order_size: float = 0.01
+    k: int = 200
+    sketches: dict[str, QuantileSketch] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.sketches = {**_new_sketches(self.k), **self.sketches}
+
+    def observe_spreads(self, spreads_bps: npt.ArrayLike | Iterable[float]) -> None:
+        """Add cross-venue spreads in basis points."""
+        self.sketches["spread_bps"].update_many(spreads_bps)
+
+    def observe_orderbook(self, orderbook: "pd.DataFrame", window: str = "min") -> None:
+        """Add one orderbook frame (e.g. one venue or day) to every sketch.
+
+        Spreads are the best cross-venue spread per window, as scanned by the
+        backtest; half-spreads and sizes come from every snapshot.
+        """
+        from ai_arb_lab.backtest.engine import compute_window_quotes
+
+        spreads = compute_window_quotes(orderbook, window=window).spreads()
+        self.observe_spreads(spreads.spread_bps[spreads.valid])
+        bid = orderbook["bid_price"].to_numpy(dtype=np.float64)
+        ask = orderbook["ask_price"].to_numpy(dtype=np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            half = (ask - bid) / (ask + bid) * 10000
+        self.sketches["half_spread_bps"].update_many(half)
+        self.sketches["top_size"].update_many(
+            np.minimum(
+                orderbook["bid_size"].to_numpy(dtype=np.float64),
+                orderbook["ask_size"].to_numpy(dtype=np.float64),
+            )
+        )
+
+    def merge(self, other: "PolicyModule") -> None:
+        """Add another module's observations (e.g. another venue, day or worker)."""
+        for name, sketch in other.sketches.items():
+            if name in self.sketches:
+                self.sketches[name].merge(sketch)
+            else:
+                self.sketches[name] = sketch
+
+    def suggest(self, parameter: str, quantile: float | None = None) -> PolicySuggestion:
+        """Suggest `parameter` (a key of `RULES`) from its sketch.
+
+        The value is the rule's quantile (or `quantile`) of the observed
+        distribution. Its rank is uncertain by the 95% sampling band
+        `1.96 * sqrt(q(1 - q) / n)` plus the sketch's rank error; confidence
+        is the share of the distance from `q` to the nearer tail (0 or 1)
+        that this uncertainty leaves, and `bounds` are the values at its ends.
+        """
+        rule = RULES.get(parameter)
+        if rule is None:
+            raise ValueError(f"Unknown parameter {parameter!r} (expected {list(RULES)})")
+        sketch = self.sketches[rule.sketch]
+        if not self.enabled or sketch.count == 0:
+            return self._fallback(parameter)
+        q = rule.quantile if quantile is None else quantile
+        n = sketch.count
+        uncertainty = _Z95 * math.sqrt(q * (1 - q) / n) + sketch.rank_error
+        margin = min(q, 1 - q)
+        confidence = max(0.0, 1.0 - uncertainty / margin) if margin > 0 else 0.0
+        value, low, high = sketch.quantiles(
+            [q, max(0.0, q - uncertainty), min(1.0, q + uncertainty)]
+        )
+        error = f", sketch error {sketch.rank_error:.1%}" if sketch.rank_error else ""
+        return PolicySuggestion(
+            parameter=parameter,
+            value=value,
+            rationale=(
+                f"Based on p{q * 100:g} of {n} {rule.description} "
+                f"(rank uncertainty +/-{uncertainty:.1%}{error})"
+            ),
+            confidence=confidence,
+            bounds=(low, high),
+        )
+
+    def suggest_all(self) -> list[PolicySuggestion]:
+        """One suggestion per parameter in `RULES`."""
+        return [self.suggest(parameter) for parameter in RULES]
 
     def suggest_min_spread(
         self,
-        historical_spreads: list[float] | None = None,
+        historical_spreads: npt.ArrayLike | Iterable[float] | None = None,
     ) -> PolicySuggestion:
-        """Suggest min_spread_bps. Uses historical data if provided and enabled."""
-        if not self.enabled or not historical_spreads:
-            return PolicySuggestion(
-                parameter="min_spread_bps",
-                value=self.default_min_spread_bps,
-                rationale="Deterministic fallback: using default threshold",
-                confidence=1.0,
-            )
+        """Suggest min_spread_bps. Uses historical data if provided and enabled.
 
-        # Simple heuristic: use 75th percentile of historical spreads as threshold
-        sorted_spreads = sorted(historical_spreads)
-        idx = int(len(sorted_spreads) * 0.75)
-        suggested = (
-            sorted_spreads[idx] if idx < len(sorted_spreads) else self.default_min_spread_bps
-        )
+        `historical_spreads` is added to the spread sketch first, so
+        repeated calls accumulate; without it, the spreads observed so far
+        are used.
+        """
+        if historical_spreads is not None and self.enabled:
+            self.observe_spreads(historical_spreads)
+        return self.suggest("min_spread_bps")
 
+    def _fallback(self, parameter: str) -> PolicySuggestion:
+        defaults = {
+            "min_spread_bps": self.default_min_spread_bps,
+            "slippage_bps": self.default_slippage_bps,
+            "max_order_size": self.default_max_order_size,
+        }
         return PolicySuggestion(
-            parameter="min_spread_bps",
-            value=float(suggested),
-            rationale=f"Based on 75th percentile of {len(historical_spreads)} historical spreads",
-            confidence=0.8,
+            parameter=parameter,
+            value=defaults[parameter],
+            rationale="Deterministic fallback: using default threshold",
+            confidence=1.0,
         )
@@ -0,0 +1,50 @@
+"""Backtesting: vectorized signal scan, execution replay, sweeps, walk-forward, stress tests."""
+
+from ai_arb_lab.backtest.engine import (
+    BacktestResult,
+    SpreadSeries,
+    WindowQuotes,
+    compute_spreads,
+    compute_window_quotes,
+    run_backtest,
+    run_backtest_quotes,
+    scan_spreads,
+)
+from ai_arb_lab.backtest.event_driven import (
+    MultiBacktestResult,
+    parse_strategy,
+    run_event_backtest,
+    run_multi_backtest,
+)
+from ai_arb_lab.backtest.montecarlo import MonteCarloResult, StressScenario, stress_test
+from ai_arb_lab.backtest.sweep import expand_grid, run_sweep
+from ai_arb_lab.backtest.walkforward import (
+    WalkForwardResult,
+    WalkForwardSplit,
+    run_walk_forward,
+    walk_forward_splits,
+)
+
+__all__ = [
+    "BacktestResult",
+    "SpreadSeries",
+    "WindowQuotes",
+    "compute_spreads",
+    "compute_window_quotes",
+    "scan_spreads",
+    "run_backtest",
+    "run_backtest_quotes",
+    "run_event_backtest",
+    "run_multi_backtest",
+    "MultiBacktestResult",
+    "parse_strategy",
+    "expand_grid",
+    "run_sweep",
+    "WalkForwardResult",
+    "WalkForwardSplit",
+    "run_walk_forward",
+    "walk_forward_splits",
+    "MonteCarloResult",
+    "StressScenario",
+    "stress_test",
+]
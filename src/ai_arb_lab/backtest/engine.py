@@ -0,0 +1,448 @@
+"""Vectorized backtest engine.
+
+Signal detection runs as whole-array passes over the orderbook: per-window
+best bid/ask per venue, cross-venue spreads, cost-adjusted net spreads and
+signal masks. Only the stateful parts (risk, kill switch, broker) iterate,
+and only over the rows that produced a signal. With many signals the
+broker simulates every fill in one batch and only the risk checks loop.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ai_arb_lab.core.clock import SimClock
+from ai_arb_lab.core.events import FillEvent
+from ai_arb_lab.core.telemetry import STRATEGY_EVALUATE, TELEMETRY
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.reporting.metrics import BacktestMetrics, MetricsAccumulator
+from ai_arb_lab.risk.kill_switch import KillSwitch
+from ai_arb_lab.risk.limits import RiskLimits
+from ai_arb_lab.strategies.base import Signal
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYMBOL = "BTC-USD"
+
+# Signal count from which fills are simulated as one batch
+BATCH_MIN_SIGNALS = 32
+
+_EVALUATE = TELEMETRY.stage(STRATEGY_EVALUATE)
+
+
+@dataclass
+class SpreadSeries:
+    """Per-window best cross-venue spread, independent of strategy parameters.
+
+    `buy_idx`/`sell_idx` index into `WindowQuotes.venues`. `valid` marks
+    windows where at least two venues quote and the best ask and best bid
+    sit on different venues.
+    """
+
+    buy_idx: npt.NDArray[np.intp]
+    sell_idx: npt.NDArray[np.intp]
+    price_buy: npt.NDArray[np.float64]
+    price_sell: npt.NDArray[np.float64]
+    spread_bps: npt.NDArray[np.float64]
+    valid: npt.NDArray[np.bool_]
+
+    def slice(self, lo: int, hi: int) -> "SpreadSeries":
+        """Rows [lo, hi) as views."""
+        return SpreadSeries(
+            buy_idx=self.buy_idx[lo:hi],
+            sell_idx=self.sell_idx[lo:hi],
+            price_buy=self.price_buy[lo:hi],
+            price_sell=self.price_sell[lo:hi],
+            spread_bps=self.spread_bps[lo:hi],
+            valid=self.valid[lo:hi],
+        )
+
+
+@dataclass
+class WindowQuotes:
+    """Per-window best bid/ask per venue as dense (windows x venues) arrays.
+
+    Rows are sorted by (window, symbol). Cells are NaN where a venue has no
+    snapshot in that window. The derived spread series is computed on first
+    use and cached; slices share it, so parameter candidates and
+    overlapping time ranges never recompute it.
+    """
+
+    windows: pd.DatetimeIndex
+    symbols: npt.NDArray[np.object_]
+    venues: list[str]
+    best_bid: npt.NDArray[np.float64]
+    best_ask: npt.NDArray[np.float64]
+    present: npt.NDArray[np.bool_]
+    row_count: npt.NDArray[np.int64]
+    _spreads: SpreadSeries | None = field(default=None, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.windows)
+
+    def spreads(self) -> SpreadSeries:
+        """Best cross-venue spread per window (cached)."""
+        if self._spreads is None:
+            self._spreads = compute_spreads(self)
+        return self._spreads
+
+    def slice(self, lo: int, hi: int) -> "WindowQuotes":
+        """Rows [lo, hi) as views, carrying over any cached spread series."""
+        return WindowQuotes(
+            windows=self.windows[lo:hi],
+            symbols=self.symbols[lo:hi],
+            venues=self.venues,
+            best_bid=self.best_bid[lo:hi],
+            best_ask=self.best_ask[lo:hi],
+            present=self.present[lo:hi],
+            row_count=self.row_count[lo:hi],
+            _spreads=self._spreads.slice(lo, hi) if self._spreads is not None else None,
+        )
+
+    def between(self, start: datetime | None, end: datetime | None) -> "WindowQuotes":
+        """Windows in [start, end) as views."""
+        lo = 0 if start is None else int(self.windows.searchsorted(start, side="left"))
+        hi = len(self) if end is None else int(self.windows.searchsorted(end, side="left"))
+        return self.slice(lo, max(lo, hi))
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of a backtest run.
+
+    `signals` has one row per detected signal, with its order `size` and
+    whether it passed risk checks and was sent to the broker (`executed`).
+    `equity_curve` is the run's downsampled equity curve (`timestamp`,
+    `equity`).
+    """
+
+    metrics: BacktestMetrics
+    signals: pd.DataFrame
+    fills: list[FillEvent] = field(default_factory=list)
+    equity_curve: pd.DataFrame | None = None
+
+
+def compute_window_quotes(orderbook: pd.DataFrame, window: str = "min") -> WindowQuotes:
+    """Aggregate orderbook snapshots into per-window, per-venue best quotes."""
+    symbol = orderbook["symbol"] if "symbol" in orderbook.columns else DEFAULT_SYMBOL
+    frame = pd.DataFrame(
+        {
+            "window": orderbook["timestamp"].dt.floor(window),
+            "symbol": symbol,
+            "venue": orderbook["venue"],
+            "bid_price": orderbook["bid_price"],
+            "ask_price": orderbook["ask_price"],
+        }
+    )
+    agg = frame.groupby(["window", "symbol", "venue"], sort=True).agg(
+        best_bid=("bid_price", "max"),
+        best_ask=("ask_price", "min"),
+        rows=("venue", "size"),
+    )
+    wide = agg.unstack("venue")
+    rows = wide["rows"].fillna(0).to_numpy(dtype=np.int64)
+    index = wide.index
+    return WindowQuotes(
+        windows=pd.DatetimeIndex(index.get_level_values("window")),
+        symbols=index.get_level_values("symbol").to_numpy(dtype=object),
+        venues=[str(v) for v in wide["best_bid"].columns],
+        best_bid=wide["best_bid"].to_numpy(dtype=np.float64),
+        best_ask=wide["best_ask"].to_numpy(dtype=np.float64),
+        present=rows > 0,
+        row_count=rows.sum(axis=1),
+    )
+
+
+def compute_spreads(quotes: WindowQuotes) -> SpreadSeries:
+    """Lowest ask, highest bid and their spread for every window.
+
+    Ties resolve to the first venue in sorted order, matching
+    `SimpleSpreadStrategy.evaluate`. Prefer `quotes.spreads()`, which caches.
+    """
+    n_rows = len(quotes)
+    if n_rows == 0 or not quotes.venues:
+        empty = np.empty(0, dtype=np.float64)
+        return SpreadSeries(
+            buy_idx=np.empty(0, dtype=np.intp),
+            sell_idx=np.empty(0, dtype=np.intp),
+            price_buy=empty,
+            price_sell=empty,
+            spread_bps=empty,
+            valid=np.zeros(0, dtype=np.bool_),
+        )
+
+    asks = np.where(np.isnan(quotes.best_ask), np.inf, quotes.best_ask)
+    bids = np.where(np.isnan(quotes.best_bid), -np.inf, quotes.best_bid)
+    buy_idx = asks.argmin(axis=1)
+    sell_idx = bids.argmax(axis=1)
+    rows = np.arange(n_rows)
+    price_buy = asks[rows, buy_idx]
+    price_sell = bids[rows, sell_idx]
+
+    valid = (
+        (quotes.row_count >= 2)
+        & (quotes.present.sum(axis=1) >= 2)
+        & (buy_idx != sell_idx)
+        & np.isfinite(price_buy)
+        & np.isfinite(price_sell)
+    )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        spread_bps = (price_sell - price_buy) / price_buy * 10000
+    return SpreadSeries(
+        buy_idx=buy_idx,
+        sell_idx=sell_idx,
+        price_buy=price_buy,
+        price_sell=price_sell,
+        spread_bps=spread_bps,
+        valid=valid,
+    )
+
+
+def scan_spreads(quotes: WindowQuotes, strategy: SimpleSpreadStrategy) -> pd.DataFrame:
+    """Detect cross-venue opportunities in every window at once.
+
+    Mirrors `SimpleSpreadStrategy.evaluate` applied to each window: a
+    signal fires when the net spread after costs reaches `min_spread_bps`.
+    Only this thresholding depends on the strategy; the spread series
+    itself comes from the quotes' cache. Returns one row per signal.
+    """
+    if len(quotes) == 0 or not quotes.venues:
+        return _empty_signals()
+
+    spreads = quotes.spreads()
+    net_spread_bps = spreads.spread_bps - strategy.cost_bps
+    mask = spreads.valid & (net_spread_bps >= strategy.min_spread_bps)
+
+    venues = np.asarray(quotes.venues, dtype=object)
+    return pd.DataFrame(
+        {
+            "window": quotes.windows[mask],
+            "symbol": quotes.symbols[mask],
+            "venue_buy": venues[spreads.buy_idx[mask]],
+            "venue_sell": venues[spreads.sell_idx[mask]],
+            "price_buy": spreads.price_buy[mask],
+            "price_sell": spreads.price_sell[mask],
+            "spread_bps": spreads.spread_bps[mask],
+            "net_spread_bps": net_spread_bps[mask],
+        }
+    )
+
+
+def _empty_signals() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "window": pd.DatetimeIndex([]),
+            "symbol": pd.Series([], dtype=object),
+            "venue_buy": pd.Series([], dtype=object),
+            "venue_sell": pd.Series([], dtype=object),
+            "price_buy": pd.Series([], dtype=np.float64),
+            "price_sell": pd.Series([], dtype=np.float64),
+            "spread_bps": pd.Series([], dtype=np.float64),
+            "net_spread_bps": pd.Series([], dtype=np.float64),
+        }
+    )
+
+
+def run_backtest(
+    orderbook: pd.DataFrame,
+    strategy: SimpleSpreadStrategy,
+    initial_capital: float,
+    risk_limits: RiskLimits | None = None,
+    kill_switch: KillSwitch | None = None,
+    broker: PaperBroker | None = None,
+    window: str = "min",
+) -> BacktestResult:
+    """Backtest a spread strategy over the full orderbook with no iteration cap."""
+    quotes = compute_window_quotes(orderbook, window=window)
+    return run_backtest_quotes(
+        quotes,
+        strategy,
+        initial_capital,
+        risk_limits=risk_limits,
+        kill_switch=kill_switch,
+        broker=broker,
+    )
+
+
+def _execute_orders(
+    built: list[Signal],
+    executed: npt.NDArray[np.bool_],
+    traded: npt.NDArray[np.bool_],
+    cash: npt.NDArray[np.float64],
+    windows: list[datetime],
+    risk_limits: RiskLimits,
+    kill_switch: KillSwitch,
+    broker: PaperBroker,
+) -> list[FillEvent]:
+    """Risk-check and submit signals one order at a time.
+
+    Marks signals whose buy leg filled in `traded` and records each
+    executed signal's capital change in `cash`.
+    """
+    fills: list[FillEvent] = []
+    for i, signal in enumerate(built):
+        ok, _ = risk_limits.check(signal, broker.capital)
+        if not ok:
+            continue
+        ok, _ = kill_switch.check()
+        if not ok:
+            continue
+        executed[i] = True
+        clock = SimClock()
+        clock.start(windows[i])
+        before = broker.capital
+        _, fill = broker.submit_order(signal, clock)
+        cash[i] = broker.capital - before
+        if fill:
+            traded[i] = True
+            fills.append(fill)
+    return fills
+
+
+def _execute_batch(
+    signals: pd.DataFrame,
+    built: list[Signal],
+    sizes: npt.NDArray[np.float64],
+    executed: npt.NDArray[np.bool_],
+    traded: npt.NDArray[np.bool_],
+    cash: npt.NDArray[np.float64],
+    windows: list[datetime],
+    risk_limits: RiskLimits,
+    kill_switch: KillSwitch,
+    broker: PaperBroker,
+) -> list[FillEvent]:
+    """Simulate every signal's fills in one batch, then risk-check in order.
+
+    Each approved signal is settled before the next check, so capital and
+    ledger state, and therefore approvals, match the per-order path.
+    `traded` and `cash` are filled in as by `_execute_orders`.
+    """
+    pair = broker.simulate_batch(
+        signals["price_buy"].to_numpy(dtype=np.float64),
+        signals["price_sell"].to_numpy(dtype=np.float64),
+        sizes,
+    )
+    fills: list[FillEvent] = []
+    for i, signal in enumerate(built):
+        ok, _ = risk_limits.check(signal, broker.capital)
+        if not ok:
+            continue
+        ok, _ = kill_switch.check()
+        if not ok:
+            continue
+        executed[i] = True
+        fill = broker.settle_signal(
+            pair, i, signal.symbol, signal.venue_buy, signal.venue_sell, windows[i]
+        )
+        if fill is not None:
+            fills.append(fill)
+    cash[executed] = pair.cash[executed]
+    traded[:] = executed & pair.buy.filled
+    return fills
+
+
+def _mark_windows(
+    accumulator: MetricsAccumulator,
+    quotes: WindowQuotes,
+    signals: pd.DataFrame,
+    cash: npt.NDArray[np.float64],
+    start_capital: float,
+) -> None:
+    """Mark equity once per window, after that window's executed signals."""
+    if len(quotes) == 0:
+        return
+    ticks = np.unique(quotes.windows.as_unit("ns").asi8)
+    at = np.searchsorted(ticks, pd.DatetimeIndex(signals["window"]).as_unit("ns").asi8)
+    changes = np.bincount(at, weights=cash, minlength=len(ticks))
+    accumulator.mark_many(start_capital + np.cumsum(changes), ticks)
+
+
+def run_backtest_quotes(
+    quotes: WindowQuotes,
+    strategy: SimpleSpreadStrategy,
+    initial_capital: float,
+    risk_limits: RiskLimits | None = None,
+    kill_switch: KillSwitch | None = None,
+    broker: PaperBroker | None = None,
+) -> BacktestResult:
+    """Backtest on precomputed window quotes.
+
+    Window quotes do not depend on strategy parameters, so callers running
+    many configurations over the same data (e.g. a parameter sweep) compute
+    them once and reuse them here. Equity is marked at every window, so
+    drawdown and Sharpe/Sortino are per-window; win rate is per trade.
+    """
+    risk_limits = risk_limits or RiskLimits(
+        max_exposure=initial_capital * 0.5,
+        initial_capital=initial_capital,
+    )
+    kill_switch = kill_switch or KillSwitch(enabled=True)
+    broker = broker or PaperBroker(initial_capital=initial_capital)
+    if risk_limits.ledger is None:
+        risk_limits.ledger = broker.ledger
+
+    t0 = _EVALUATE.start()
+    signals = scan_spreads(quotes, strategy)
+    _EVALUATE.stop(t0)
+    TELEMETRY.count("events", int(quotes.row_count.sum()))
+    TELEMETRY.count("signals", len(signals))
+    logger.info("Scanned %d windows, %d signals", len(quotes), len(signals))
+
+    windows: list[datetime] = signals["window"].dt.to_pydatetime().tolist()
+    columns = zip(
+        signals["symbol"].to_numpy(),
+        signals["venue_buy"].to_numpy(),
+        signals["venue_sell"].to_numpy(),
+        signals["price_buy"].to_numpy(dtype=np.float64).tolist(),
+        signals["price_sell"].to_numpy(dtype=np.float64).tolist(),
+        signals["spread_bps"].to_numpy(dtype=np.float64).tolist(),
+        signals["net_spread_bps"].to_numpy(dtype=np.float64).tolist(),
+        strict=True,
+    )
+    built = [
+        strategy.build_signal(
+            symbol=str(symbol),
+            venue_buy=str(venue_buy),
+            venue_sell=str(venue_sell),
+            price_buy=price_buy,
+            price_sell=price_sell,
+            spread_bps=spread,
+            net_spread_bps=net,
+        )
+        for symbol, venue_buy, venue_sell, price_buy, price_sell, spread, net in columns
+    ]
+    sizes = np.array([signal.size for signal in built], dtype=np.float64)
+    executed = np.zeros(len(built), dtype=np.bool_)
+    traded = np.zeros(len(built), dtype=np.bool_)
+    cash = np.zeros(len(built), dtype=np.float64)
+    start_capital = broker.capital
+
+    if len(built) >= BATCH_MIN_SIGNALS and broker.can_batch:
+        fills = _execute_batch(
+            signals, built, sizes, executed, traded, cash, windows, risk_limits, kill_switch, broker
+        )
+    else:
+        fills = _execute_orders(
+            built, executed, traded, cash, windows, risk_limits, kill_switch, broker
+        )
+
+    TELEMETRY.count("orders", int(executed.sum()))
+    TELEMETRY.count("fills", len(fills))
+    accumulator = MetricsAccumulator(initial_capital)
+    _mark_windows(accumulator, quotes, signals, cash, start_capital)
+    # A trade is an executed signal whose buy leg filled (one per fill
+    # returned); its realized P&L is the net cash of both legs
+    accumulator.record_trades(cash[traded])
+    metrics = accumulator.to_metrics()
+    signals = signals.assign(size=sizes, executed=executed)
+    return BacktestResult(
+        metrics=metrics,
+        signals=signals,
+        fills=fills,
+        equity_curve=accumulator.curve.to_frame() if accumulator.curve is not None else None,
+    )
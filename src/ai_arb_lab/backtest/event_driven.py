@@ -0,0 +1,431 @@
+"""Event-driven backtest with per-venue latency.
+
+Orderbook snapshots are replayed in time order on an `EventScheduler`. Each
+snapshot updates the broker's book for its venue (the exchange's view) at
+its own timestamp. It reaches the strategy after that venue's market-data
+latency. Orders then take the venue's order-entry latency to arrive and
+fill against the book as it stands on arrival, so stale quotes and legs
+that land at different times both show up in the results.
+
+Snapshots are fed lazily: each one schedules the next. The heap therefore
+holds only in-flight messages, not the whole history, and every event costs
+O(log n) in the number of messages in flight.
+
+Equity is marked on every snapshot and every fill. A signal becomes a trade
+when its buy leg fills, and its realized P&L (both legs' net cash) is
+recorded once both legs have filled, or at the end of the run.
+
+`run_multi_backtest` runs many strategies in the same pass. Each snapshot
+is decoded once, applied once to L2 books shared by every strategy's
+broker, and delivered once (feature stores updated once) to all of them.
+Only the strategy callbacks, risk checks, orders and metrics are per
+strategy, so N configurations cost one replay plus N evaluations.
+"""
+
+import copy
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from ai_arb_lab.backtest.engine import BacktestResult
+from ai_arb_lab.core.book import OrderBookL2, frame_levels, level_arrays
+from ai_arb_lab.core.events import BookDepth, FillEvent, OrderbookEvent
+from ai_arb_lab.core.scheduler import EventScheduler
+from ai_arb_lab.core.telemetry import STRATEGY_EVALUATE, TELEMETRY
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.latency import LatencyModel
+from ai_arb_lab.execution.paper_broker import PaperBroker, fill_cash
+from ai_arb_lab.reporting.metrics import MetricsAccumulator
+from ai_arb_lab.risk.kill_switch import KillSwitch
+from ai_arb_lab.risk.limits import RiskLimits
+from ai_arb_lab.strategies.base import BaseStrategy
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+from ai_arb_lab.strategies.stat_arb import StatArbStrategy
+from ai_arb_lab.strategies.top_of_book import TopOfBookIndex
+from ai_arb_lab.strategies.triangular import TriangularArbStrategy
+
+if TYPE_CHECKING:
+    from ai_arb_lab.data.features import FeatureStore
+
+logger = logging.getLogger(__name__)
+
+_EVALUATE = TELEMETRY.stage(STRATEGY_EVALUATE)
+
+# Strategies `parse_strategy` can build, by `strategy_id`
+STRATEGIES: dict[str, type[BaseStrategy]] = {
+    cls.strategy_id: cls for cls in (SimpleSpreadStrategy, StatArbStrategy, TriangularArbStrategy)
+}
+
+SIGNAL_COLUMNS = [
+    "timestamp",
+    "symbol",
+    "venue_buy",
+    "venue_sell",
+    "price_buy",
+    "price_sell",
+    "net_spread_bps",
+    "size",
+    "executed",
+]
+
+
+@dataclass(eq=False)
+class _OpenTrade:
+    """Fills so far of one signal's two legs."""
+
+    cash: float = 0.0
+    legs: int = 0
+    bought: bool = False
+
+
+def _snapshot_factory(
+    frame: pd.DataFrame,
+) -> tuple[list[datetime], Callable[[int], OrderbookEvent]]:
+    """Build `OrderbookEvent`s for rows of a sorted orderbook frame on demand."""
+    times = frame["timestamp"].dt.to_pydatetime().tolist()
+    venues = frame["venue"].astype(str).tolist()
+    symbols = frame["symbol"].astype(str).tolist()
+    bid_p, bid_s, ask_p, ask_s = level_arrays(frame)
+    with_depth = frame_levels(frame) > 1
+
+    def snapshot(i: int) -> OrderbookEvent:
+        depth = None
+        if with_depth:
+            depth = BookDepth.model_construct(
+                bids=list(zip(bid_p[i].tolist(), bid_s[i].tolist(), strict=True)),
+                asks=list(zip(ask_p[i].tolist(), ask_s[i].tolist(), strict=True)),
+            )
+        # Values come from typed arrays, so skip per-event validation
+        return OrderbookEvent.model_construct(
+            timestamp=times[i],
+            correlation_id=None,
+            venue=venues[i],
+            symbol=symbols[i],
+            bid_price=float(bid_p[i, 0]),
+            ask_price=float(ask_p[i, 0]),
+            bid_size=float(bid_s[i, 0]),
+            ask_size=float(ask_s[i, 0]),
+            depth=depth,
+        )
+
+    return times, snapshot
+
+
+class _Lane:
+    """One strategy's broker, risk checks and results within a replay."""
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        scheduler: EventScheduler,
+        initial_capital: float,
+        latency: LatencyModel,
+        risk_limits: RiskLimits,
+        kill_switch: KillSwitch,
+        broker: PaperBroker,
+        owns_books: bool = True,
+    ) -> None:
+        self.strategy = strategy
+        self.scheduler = scheduler
+        self.latency = latency
+        self.risk_limits = risk_limits
+        self.kill_switch = kill_switch
+        self.broker = broker
+        # Brokers sharing books: one applies each snapshot, the rest only mark
+        self.owns_books = owns_books
+        if risk_limits.ledger is None:
+            risk_limits.ledger = broker.ledger
+        self.records: list[dict[str, Any]] = []
+        self.fills: list[FillEvent] = []
+        self.accumulator = MetricsAccumulator(initial_capital)
+        # Insertion-ordered, so end-of-run closes are deterministic
+        self.open_trades: dict[_OpenTrade, None] = {}
+        strategy.reset()
+
+    def on_snapshot(self, event: OrderbookEvent) -> None:
+        if self.owns_books:
+            self.broker.on_orderbook(event)
+        else:
+            self.broker.mark(event)
+        self.accumulator.mark(self.broker.capital, self.scheduler.clock.now_ns)
+
+    def on_fill(self, trade: _OpenTrade, fill: FillEvent) -> None:
+        self.fills.append(fill)
+        TELEMETRY.count("fills")
+        trade.cash += fill_cash(fill)
+        trade.legs += 1
+        trade.bought = trade.bought or fill.side == "buy"
+        self.accumulator.mark(self.broker.capital, self.scheduler.clock.now_ns)
+        if trade.legs == 2:
+            self.open_trades.pop(trade, None)
+            self.accumulator.record_trade(trade.cash)
+        else:
+            self.open_trades[trade] = None
+
+    def deliver(self, event: OrderbookEvent) -> None:
+        t0 = _EVALUATE.start()
+        signal = self.strategy.on_orderbook(event)
+        _EVALUATE.stop(t0)
+        if signal is None:
+            return
+        TELEMETRY.count("signals")
+        broker = self.broker
+        executed = self.risk_limits.check(signal, broker.capital)[0] and self.kill_switch.check()[0]
+        self.records.append(
+            {
+                "timestamp": self.scheduler.now(),
+                "symbol": signal.symbol,
+                "venue_buy": signal.venue_buy,
+                "venue_sell": signal.venue_sell,
+                "price_buy": signal.price_buy,
+                "price_sell": signal.price_sell,
+                "net_spread_bps": signal.expected_profit_bps,
+                "size": signal.size,
+                "executed": executed,
+            }
+        )
+        if executed:
+            TELEMETRY.count("orders")
+            broker.schedule_order(
+                signal, self.scheduler, self.latency, on_fill=partial(self.on_fill, _OpenTrade())
+            )
+
+    def result(self) -> BacktestResult:
+        # Signals left with one filled leg close at the end of the run
+        for trade in self.open_trades:
+            if trade.bought:
+                self.accumulator.record_trade(trade.cash)
+        signals = pd.DataFrame(self.records, columns=SIGNAL_COLUMNS)
+        signals["executed"] = signals["executed"].to_numpy(dtype=np.bool_)
+        curve = self.accumulator.curve
+        return BacktestResult(
+            metrics=self.accumulator.to_metrics(),
+            signals=signals,
+            fills=self.fills,
+            equity_curve=curve.to_frame() if curve is not None else None,
+        )
+
+
+def _replay(
+    orderbook: pd.DataFrame,
+    scheduler: EventScheduler,
+    lanes: list[_Lane],
+    latency: LatencyModel,
+) -> int:
+    """Feed every snapshot to all lanes; returns the snapshot count.
+
+    Each distinct feature store among the lanes' strategies is reset first
+    and updated once per delivered snapshot, before any strategy sees it.
+    """
+    stores = list({id(s): s for lane in lanes if (s := lane.strategy.features)}.values())
+    for store in stores:
+        store.reset()
+    frame = orderbook.sort_values("timestamp", kind="stable", ignore_index=True)
+    times, snapshot = _snapshot_factory(frame)
+    n = len(frame)
+
+    def deliver(event: OrderbookEvent) -> None:
+        for store in stores:
+            store.update(event)
+        for lane in lanes:
+            lane.deliver(event)
+
+    def feed(i: int) -> None:
+        event = snapshot(i)
+        TELEMETRY.count("events")
+        for lane in lanes:
+            lane.on_snapshot(event)
+        scheduler.schedule_in(latency.market_data_delay(event.venue), deliver, event)
+        if i + 1 < n:
+            scheduler.schedule_at(times[i + 1], feed, i + 1)
+
+    if n:
+        scheduler.clock.start(times[0])
+        scheduler.schedule_at(times[0], feed, 0)
+    scheduler.run()
+    return n
+
+
+def run_event_backtest(
+    orderbook: pd.DataFrame,
+    strategy: BaseStrategy,
+    initial_capital: float,
+    latency: LatencyModel | None = None,
+    risk_limits: RiskLimits | None = None,
+    kill_switch: KillSwitch | None = None,
+    broker: PaperBroker | None = None,
+) -> BacktestResult:
+    """Replay an orderbook through `strategy.on_orderbook` with latency.
+
+    Every signal that passes the risk checks is sent with
+    `PaperBroker.schedule_order`. `fills` holds the fills of both legs;
+    `trade_count` counts filled buy legs, as in `run_backtest`, and
+    `win_count` those trades with positive realized P&L. A strategy's
+    `features` store is reset and then updated with each event just before
+    the strategy sees it.
+    """
+    latency = latency or LatencyModel()
+    scheduler = EventScheduler()
+    lane = _Lane(
+        strategy,
+        scheduler,
+        initial_capital,
+        latency,
+        risk_limits
+        or RiskLimits(max_exposure=initial_capital * 0.5, initial_capital=initial_capital),
+        kill_switch or KillSwitch(enabled=True),
+        broker or PaperBroker(initial_capital=initial_capital),
+    )
+    n = _replay(orderbook, scheduler, [lane], latency)
+    logger.info(
+        "Event backtest: %d snapshots, %d events, %d signals",
+        n,
+        scheduler.processed,
+        len(lane.records),
+    )
+    return lane.result()
+
+
+@dataclass
+class MultiBacktestResult:
+    """Per-strategy results of one `run_multi_backtest` pass, keyed by name."""
+
+    results: dict[str, BacktestResult] = field(default_factory=dict)
+
+    def __getitem__(self, name: str) -> BacktestResult:
+        return self.results[name]
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def summary(self) -> pd.DataFrame:
+        """One row per strategy: `strategy`, `signal_count` and its metrics."""
+        rows = [
+            {"strategy": name, "signal_count": len(result.signals), **result.metrics.to_dict()}
+            for name, result in self.results.items()
+        ]
+        if not rows:
+            return pd.DataFrame(columns=["strategy", "signal_count"])
+        return pd.DataFrame(rows)
+
+
+def _strategy_names(strategies: Sequence[BaseStrategy]) -> list[str]:
+    """`strategy_id` of each strategy, numbered (`stat_arb-1`) where ids repeat."""
+    ids = [strategy.strategy_id for strategy in strategies]
+    seen: dict[str, int] = {}
+    names = []
+    for strategy_id in ids:
+        if ids.count(strategy_id) == 1:
+            names.append(strategy_id)
+            continue
+        seen[strategy_id] = seen.get(strategy_id, 0) + 1
+        names.append(f"{strategy_id}-{seen[strategy_id]}")
+    return names
+
+
+def _parse_value(value: str) -> int | float | str:
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
+
+
+def parse_strategy(spec: str, book: TopOfBookIndex | None = None) -> BaseStrategy:
+    """Build a strategy written as `strategy_id[:name=value,...]`.
+
+    e.g. `simple_spread:min_spread_bps=10` or `stat_arb:window=200,mode=ewm`.
+    Spread strategies get `book`, so one index can serve all of them.
+    """
+    strategy_id, _, params = spec.partition(":")
+    cls = STRATEGIES.get(strategy_id.strip())
+    if cls is None:
+        raise ValueError(f"Unknown strategy {strategy_id!r} (expected {list(STRATEGIES)})")
+    kwargs: dict[str, Any] = {}
+    for item in filter(None, (p.strip() for p in params.split(","))):
+        name, sep, value = item.partition("=")
+        if not sep or not value.strip():
+            raise ValueError(f"Expected name=value but got {item!r} in {spec!r}")
+        kwargs[name.strip()] = _parse_value(value.strip())
+    if cls is SimpleSpreadStrategy and book is not None:
+        kwargs["book"] = book
+    try:
+        return cls(**kwargs)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid strategy {spec!r}: {e}") from e
+
+
+def run_multi_backtest(
+    orderbook: pd.DataFrame,
+    strategies: Mapping[str, BaseStrategy] | Sequence[BaseStrategy],
+    initial_capital: float,
+    latency: LatencyModel | None = None,
+    risk_limits: RiskLimits | None = None,
+    fill_model: FillModel | None = None,
+    features: "FeatureStore | None" = None,
+) -> MultiBacktestResult:
+    """Replay an orderbook once through every strategy, each with its own account.
+
+    `strategies` maps names to strategy instances, or is a list named by
+    `strategy_id` (numbered `stat_arb-1`, `stat_arb-2`, ... where ids repeat). Every strategy gets its own `PaperBroker` (with a
+    copy of `fill_model`), `RiskLimits` (a copy of `risk_limits`, or the
+    `run_event_backtest` default) and kill switch, so one strategy's fills
+    or halt never affect another's. `features`, when given, becomes every
+    strategy's feature store and is updated once per snapshot.
+
+    With fixed latencies each result equals `run_event_backtest` for that
+    strategy alone. With random latencies the market-data delays are drawn
+    once and shared, and each strategy draws order delays from its own copy
+    of `latency`, so a result does not depend on which others run with it.
+    """
+    if isinstance(strategies, Mapping):
+        named = dict(strategies)
+    else:
+        named = dict(zip(_strategy_names(strategies), strategies, strict=True))
+    if len({id(strategy) for strategy in named.values()}) != len(named):
+        raise ValueError("Each strategy instance can only run once per pass")
+    latency = latency or LatencyModel()
+    risk_template = risk_limits or RiskLimits(
+        max_exposure=initial_capital * 0.5, initial_capital=initial_capital
+    )
+    fill_template = fill_model or FillModel()
+
+    scheduler = EventScheduler()
+    books: dict[tuple[str, str], OrderBookL2] = {}
+    lanes = []
+    for i, strategy in enumerate(named.values()):
+        if features is not None:
+            strategy.features = features
+        broker = PaperBroker(initial_capital, fill_model=copy.deepcopy(fill_template))
+        broker.books = books
+        lane_risk = copy.deepcopy(risk_template)
+        lane_risk.ledger = broker.ledger
+        lanes.append(
+            _Lane(
+                strategy,
+                scheduler,
+                initial_capital,
+                copy.deepcopy(latency),
+                lane_risk,
+                KillSwitch(enabled=True),
+                broker,
+                owns_books=i == 0,
+            )
+        )
+    n = _replay(orderbook, scheduler, lanes, latency)
+    logger.info(
+        "Multi-strategy backtest: %d snapshots, %d strategies, %d events",
+        n,
+        len(lanes),
+        scheduler.processed,
+    )
+    return MultiBacktestResult(
+        {name: lane.result() for name, lane in zip(named, lanes, strict=True)}
+    )
@@ -0,0 +1,291 @@
+"""Parallel parameter sweeps over one shared copy of the market data.
+
+Window quotes do not depend on strategy or risk parameters, so they are
+computed once in the parent and copied into a single shared-memory block.
+Worker processes attach to that block when they start and wrap it in
+zero-copy NumPy views, then run backtests for batches of grid points.
+Results stream back as each batch finishes and are collected into one
+tidy table (one row per grid point).
+"""
+
+import itertools
+import logging
+import math
+import os
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ai_arb_lab.backtest.engine import WindowQuotes, compute_window_quotes, run_backtest_quotes
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.risk.kill_switch import KillSwitch
+from ai_arb_lab.risk.limits import RiskLimits
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_PARAMS = ("min_spread_bps", "fee_rate", "slippage_bps")
+RISK_PARAMS = ("max_exposure", "max_drawdown_pct", "max_daily_loss")
+SWEEP_PARAMS = STRATEGY_PARAMS + RISK_PARAMS
+
+_ALIGN = 64
+
+
+def expand_grid(grid: Mapping[str, Sequence[float]]) -> list[dict[str, float]]:
+    """Cartesian product of a parameter grid, in row-major order."""
+    unknown = sorted(set(grid) - set(SWEEP_PARAMS))
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {unknown} (expected {list(SWEEP_PARAMS)})")
+    names = list(grid)
+    return [
+        dict(zip(names, values, strict=True))
+        for values in itertools.product(*(grid[name] for name in names))
+    ]
+
+
+def parse_param(spec: str) -> tuple[str, list[float]]:
+    """Parse a grid axis written as `name=v1,v2,...`."""
+    name, sep, values = spec.partition("=")
+    name = name.strip()
+    if not sep or not values.strip():
+        raise ValueError(f"Expected name=v1,v2,... but got {spec!r}")
+    if name not in SWEEP_PARAMS:
+        raise ValueError(f"Unknown sweep parameter {name!r} (expected {list(SWEEP_PARAMS)})")
+    try:
+        return name, [float(v) for v in values.split(",")]
+    except ValueError as e:
+        raise ValueError(f"Invalid value in {spec!r}: {e}") from e
+
+
+def run_point(
+    quotes: WindowQuotes, params: Mapping[str, float], initial_capital: float
+) -> dict[str, Any]:
+    """Backtest one parameter set, configured like the `backtest` command."""
+    strategy_params: dict[str, Any] = {k: params[k] for k in STRATEGY_PARAMS if k in params}
+    strategy = SimpleSpreadStrategy(**strategy_params)
+    risk_limits = RiskLimits(
+        max_exposure=params.get("max_exposure", initial_capital * 0.5),
+        initial_capital=initial_capital,
+        max_drawdown_pct=params.get("max_drawdown_pct", RiskLimits.max_drawdown_pct),
+        max_daily_loss=params.get("max_daily_loss", RiskLimits.max_daily_loss),
+    )
+    result = run_backtest_quotes(
+        quotes,
+        strategy,
+        initial_capital,
+        risk_limits=risk_limits,
+        kill_switch=KillSwitch(enabled=True),
+        broker=PaperBroker(initial_capital=initial_capital, fill_model=FillModel()),
+    )
+    return {**params, "signal_count": len(result.signals), **result.metrics.to_dict()}
+
+
+@dataclass(frozen=True)
+class SharedQuotesSpec:
+    """Picklable handle describing window quotes held in shared memory."""
+
+    name: str
+    n_windows: int
+    venues: tuple[str, ...]
+    symbols: tuple[str, ...]
+
+
+def _layout(n: int, v: int) -> tuple[list[tuple[str, np.dtype[Any], tuple[int, ...], int]], int]:
+    fields: list[tuple[str, np.dtype[Any], tuple[int, ...]]] = [
+        ("windows", np.dtype(np.int64), (n,)),
+        ("row_count", np.dtype(np.int64), (n,)),
+        ("best_bid", np.dtype(np.float64), (n, v)),
+        ("best_ask", np.dtype(np.float64), (n, v)),
+        ("symbol_codes", np.dtype(np.int32), (n,)),
+        ("present", np.dtype(np.bool_), (n, v)),
+    ]
+    layout = []
+    offset = 0
+    for name, dtype, shape in fields:
+        layout.append((name, dtype, shape, offset))
+        size = dtype.itemsize * math.prod(shape)
+        offset += -(-size // _ALIGN) * _ALIGN
+    return layout, max(offset, 1)
+
+
+class SharedQuotes:
+    """Window quotes stored in one `multiprocessing.shared_memory` block.
+
+    The creating process owns the block and unlinks it on `close()`;
+    attached processes only unmap it.
+    """
+
+    def __init__(
+        self, shm: shared_memory.SharedMemory, spec: SharedQuotesSpec, owner: bool
+    ) -> None:
+        self._shm = shm
+        self.spec = spec
+        self._owner = owner
+        layout, _ = _layout(spec.n_windows, len(spec.venues))
+        self._arrays: dict[str, npt.NDArray[Any]] = {
+            name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, dtype, shape, offset in layout
+        }
+
+    @classmethod
+    def create(cls, quotes: WindowQuotes) -> "SharedQuotes":
+        """Copy window quotes into a new shared-memory block."""
+        codes, symbols = pd.factorize(pd.Index(quotes.symbols, dtype=object))
+        n, v = len(quotes), len(quotes.venues)
+        _, size = _layout(n, v)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        spec = SharedQuotesSpec(
+            name=shm.name,
+            n_windows=n,
+            venues=tuple(quotes.venues),
+            symbols=tuple(str(s) for s in symbols),
+        )
+        shared = cls(shm, spec, owner=True)
+        arrays = shared._arrays
+        arrays["windows"][:] = quotes.windows.as_unit("ns").asi8
+        arrays["row_count"][:] = quotes.row_count
+        arrays["best_bid"][:] = quotes.best_bid
+        arrays["best_ask"][:] = quotes.best_ask
+        arrays["symbol_codes"][:] = codes
+        arrays["present"][:] = quotes.present
+        return shared
+
+    @classmethod
+    def attach(cls, spec: SharedQuotesSpec) -> "SharedQuotes":
+        """Map an existing block created by `create` in another process."""
+        return cls(shared_memory.SharedMemory(name=spec.name), spec, owner=False)
+
+    def quotes(self) -> WindowQuotes:
+        """Window quotes whose numeric arrays are views onto the shared block."""
+        arrays = self._arrays
+        symbols = np.asarray(self.spec.symbols, dtype=object)[arrays["symbol_codes"]]
+        return WindowQuotes(
+            windows=pd.DatetimeIndex(arrays["windows"].view("datetime64[ns]"), copy=False),
+            symbols=symbols,
+            venues=list(self.spec.venues),
+            best_bid=arrays["best_bid"],
+            best_ask=arrays["best_ask"],
+            present=arrays["present"],
+            row_count=arrays["row_count"],
+        )
+
+    def close(self) -> None:
+        """Release this process's mapping (and the block itself, if owned)."""
+        self._arrays.clear()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedQuotes":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+# Per-worker state, set once by the pool initializer
+_worker_shared: SharedQuotes | None = None
+_worker_quotes: WindowQuotes | None = None
+
+
+def _init_worker(spec: SharedQuotesSpec) -> None:
+    global _worker_shared, _worker_quotes
+    _worker_shared = SharedQuotes.attach(spec)
+    _worker_quotes = _worker_shared.quotes()
+
+
+def worker_quotes() -> WindowQuotes:
+    """The shared window quotes inside a `shared_pool` worker."""
+    if _worker_quotes is None:
+        raise RuntimeError("Not running in a shared_pool worker")
+    return _worker_quotes
+
+
+@contextmanager
+def shared_pool(quotes: WindowQuotes, workers: int) -> Iterator[ProcessPoolExecutor]:
+    """Process pool whose workers see `quotes` through `worker_quotes()`.
+
+    The quotes are copied into shared memory once; the block is unlinked and
+    pending tasks are cancelled when the context exits.
+    """
+    with SharedQuotes.create(quotes) as shared:
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(shared.spec,)
+        )
+        try:
+            yield pool
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+
+def _run_batch(
+    batch: list[tuple[int, dict[str, float]]], initial_capital: float
+) -> list[dict[str, Any]]:
+    quotes = worker_quotes()
+    return [{"point": i, **run_point(quotes, params, initial_capital)} for i, params in batch]
+
+
+def iter_sweep(
+    quotes: WindowQuotes,
+    points: Iterable[Mapping[str, float]],
+    initial_capital: float,
+    workers: int | None = None,
+    batch_size: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield one result row per point as runs complete (not in point order).
+
+    `workers=None` uses every core; `workers=1` runs in-process.
+    """
+    indexed = [(i, dict(params)) for i, params in enumerate(points)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(indexed) <= 1:
+        for i, params in indexed:
+            yield {"point": i, **run_point(quotes, params, initial_capital)}
+        return
+
+    batch_size = batch_size or max(1, math.ceil(len(indexed) / (workers * 4)))
+    with shared_pool(quotes, workers) as pool:
+        futures = [
+            pool.submit(_run_batch, indexed[lo : lo + batch_size], initial_capital)
+            for lo in range(0, len(indexed), batch_size)
+        ]
+        logger.info(
+            "Sweeping %d points in %d batches on %d workers", len(indexed), len(futures), workers
+        )
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def run_sweep(
+    data: pd.DataFrame | WindowQuotes,
+    grid: Mapping[str, Sequence[float]] | Iterable[Mapping[str, float]],
+    initial_capital: float,
+    workers: int | None = None,
+    window: str = "min",
+) -> pd.DataFrame:
+    """Run a backtest for every grid point and return one metrics row per point.
+
+    `data` is an orderbook frame or precomputed `WindowQuotes`; `grid` is a
+    mapping of parameter name to values (expanded with `expand_grid`) or an
+    explicit list of parameter dicts. Rows are ordered by `point`.
+    """
+    quotes = data if isinstance(data, WindowQuotes) else compute_window_quotes(data, window)
+    points = expand_grid(grid) if isinstance(grid, Mapping) else [dict(p) for p in grid]
+    rows = list(iter_sweep(quotes, points, initial_capital, workers=workers))
+    if not rows:
+        return pd.DataFrame(columns=["point"])
+    return pd.DataFrame(rows).sort_values("point", ignore_index=True)
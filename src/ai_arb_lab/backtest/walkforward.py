@@ -0,0 +1,217 @@
+"""Walk-forward optimization over rolling or anchored train/test windows.
+
+For each split, every parameter candidate is backtested on the train
+window, the best candidate by `objective` is kept, and it is evaluated
+out-of-sample on the following test window.
+
+The orderbook is reduced to window quotes once for the whole range. Each
+train or test window is a view into those arrays, and the spread series
+cached on the quotes is shared by every window and candidate, so nothing
+upstream of the per-candidate signal threshold is recomputed. Splits run in
+parallel on a `shared_pool`.
+"""
+
+import logging
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Literal
+
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+from ai_arb_lab.backtest.engine import WindowQuotes, compute_window_quotes
+from ai_arb_lab.backtest.sweep import expand_grid, run_point, shared_pool, worker_quotes
+
+logger = logging.getLogger(__name__)
+
+WindowMode = Literal["rolling", "anchored"]
+
+
+@dataclass(frozen=True)
+class WalkForwardSplit:
+    """One train/test pair. Ends are exclusive."""
+
+    index: int
+    train_start: pd.Timestamp
+    train_end: pd.Timestamp
+    test_start: pd.Timestamp
+    test_end: pd.Timestamp
+
+
+@dataclass
+class WalkForwardResult:
+    """Outcome of a walk-forward run.
+
+    `splits` has one row per split: window bounds, the chosen parameters,
+    their in-sample objective and the out-of-sample metrics (prefixed
+    `test_`). `trials` has the in-sample metrics of every candidate.
+    """
+
+    splits: pd.DataFrame
+    trials: pd.DataFrame
+
+    @property
+    def test_return(self) -> float:
+        """Out-of-sample return summed over all test windows."""
+        if self.splits.empty:
+            return 0.0
+        return float(self.splits["test_total_return"].sum())
+
+
+def walk_forward_splits(
+    start: datetime,
+    end: datetime,
+    train: pd.Timedelta | str,
+    test: pd.Timedelta | str,
+    step: pd.Timedelta | str | None = None,
+    mode: WindowMode = "rolling",
+) -> list[WalkForwardSplit]:
+    """Split [start, end) into consecutive train/test windows.
+
+    Test windows start where their train window ends and advance by `step`
+    (default: the test length). `rolling` keeps the train length fixed;
+    `anchored` keeps every train window starting at `start`. Splits whose
+    test window would run past `end` are dropped.
+    """
+    train_td = pd.Timedelta(train)
+    test_td = pd.Timedelta(test)
+    step_td = pd.Timedelta(step) if step is not None else test_td
+    if train_td <= pd.Timedelta(0) or test_td <= pd.Timedelta(0) or step_td <= pd.Timedelta(0):
+        raise ValueError("train, test and step must be positive")
+
+    origin = pd.Timestamp(start)
+    stop = pd.Timestamp(end)
+    splits: list[WalkForwardSplit] = []
+    test_start = origin + train_td
+    while test_start + test_td <= stop:
+        splits.append(
+            WalkForwardSplit(
+                index=len(splits),
+                train_start=origin if mode == "anchored" else test_start - train_td,
+                train_end=test_start,
+                test_start=test_start,
+                test_end=test_start + test_td,
+            )
+        )
+        test_start += step_td
+    return splits
+
+
+def evaluate_split(
+    quotes: WindowQuotes,
+    split: WalkForwardSplit,
+    candidates: Sequence[Mapping[str, float]],
+    initial_capital: float,
+    objective: str = "total_return",
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Optimize on the split's train window and evaluate on its test window.
+
+    Returns the per-candidate train rows and the split summary row. Ties on
+    the objective go to the earliest candidate.
+    """
+    quotes.spreads()  # computed once; the train/test views below share it
+    train = quotes.between(split.train_start, split.train_end)
+    test = quotes.between(split.test_start, split.test_end)
+
+    trials = []
+    best: tuple[float, int] | None = None
+    for i, params in enumerate(candidates):
+        row = run_point(train, params, initial_capital)
+        score = row[objective]
+        trials.append({"split": split.index, "candidate": i, **row})
+        if score is not None and (best is None or score > best[0]):
+            best = (float(score), i)
+
+    summary: dict[str, Any] = {
+        "split": split.index,
+        "train_start": split.train_start,
+        "train_end": split.train_end,
+        "test_start": split.test_start,
+        "test_end": split.test_end,
+    }
+    if best is None:
+        return trials, summary
+    params = dict(candidates[best[1]])
+    test_row = run_point(test, params, initial_capital)
+    summary.update(params)
+    summary["candidate"] = best[1]
+    summary[f"train_{objective}"] = best[0]
+    summary.update({f"test_{key}": value for key, value in test_row.items() if key not in params})
+    return trials, summary
+
+
+def _run_split(
+    split: WalkForwardSplit,
+    candidates: list[dict[str, float]],
+    initial_capital: float,
+    objective: str,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    return evaluate_split(worker_quotes(), split, candidates, initial_capital, objective)
+
+
+def run_walk_forward(
+    data: pd.DataFrame | WindowQuotes,
+    grid: Mapping[str, Sequence[float]] | Iterable[Mapping[str, float]],
+    initial_capital: float,
+    train: pd.Timedelta | str,
+    test: pd.Timedelta | str,
+    step: pd.Timedelta | str | None = None,
+    mode: WindowMode = "rolling",
+    objective: str = "total_return",
+    workers: int | None = None,
+    window: str = "min",
+) -> WalkForwardResult:
+    """Walk-forward optimize the spread strategy over the data's full range.
+
+    `grid` takes the same forms as in `run_sweep`. `objective` is any
+    numeric metric column (e.g. `total_return`, `sharpe_ratio`), maximized.
+    `window` is the quote bucket size used when `data` is an orderbook.
+    `workers=None` uses every core; `workers=1` runs in-process.
+    """
+    quotes = data if isinstance(data, WindowQuotes) else compute_window_quotes(data, window)
+    candidates = expand_grid(grid) if isinstance(grid, Mapping) else [dict(p) for p in grid]
+    if not candidates:
+        raise ValueError("At least one parameter candidate is required")
+    if len(quotes) == 0:
+        return WalkForwardResult(splits=pd.DataFrame(), trials=pd.DataFrame())
+
+    # Windows are floored timestamps, so the data ends one window after the last
+    end = quotes.windows[-1] + pd.Timedelta(to_offset(window))
+    splits = walk_forward_splits(quotes.windows[0], end, train, test, step=step, mode=mode)
+    workers = workers or os.cpu_count() or 1
+
+    results: list[tuple[list[dict[str, Any]], dict[str, Any]]] = []
+    if workers == 1 or len(splits) <= 1:
+        results = [
+            evaluate_split(quotes, split, candidates, initial_capital, objective)
+            for split in splits
+        ]
+    else:
+        with shared_pool(quotes, workers) as pool:
+            futures = [
+                pool.submit(_run_split, split, candidates, initial_capital, objective)
+                for split in splits
+            ]
+            logger.info(
+                "Walk-forward: %d splits x %d candidates on %d workers",
+                len(splits),
+                len(candidates),
+                workers,
+            )
+            results = [future.result() for future in as_completed(futures)]
+
+    trials = [row for split_trials, _ in results for row in split_trials]
+    summaries = [summary for _, summary in results]
+    return WalkForwardResult(
+        splits=_sorted_frame(summaries, ["split"]),
+        trials=_sorted_frame(trials, ["split", "candidate"]),
+    )
+
+
+def _sorted_frame(rows: list[dict[str, Any]], by: list[str]) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame(columns=by)
+    return pd.DataFrame(rows).sort_values(by, ignore_index=True)
@@ -0,0 +1,346 @@
+"""Reproducible performance benchmarks for each pipeline stage.
+
+A benchmark case is a synthetic dataset of fixed size: `days` of data with
+every one of `venues` venues quoted once a minute, generated from a fixed
+seed. Each case times these stages:
+
+| Stage | Work | Items |
+|-------|------|-------|
+| `generate` | `SyntheticMarketGenerator.generate_all` to CSV | rows written |
+| `load` | `load_data_dir` | rows loaded |
+| `evaluate` | `SimpleSpreadStrategy.evaluate` on one minute's snapshots | calls |
+| `on_orderbook` | `SimpleSpreadStrategy.on_orderbook` per snapshot | calls |
+| `publish` | `EventBus.publish` to one direct subscriber | calls |
+| `backtest` | `run_backtest` over the whole orderbook | orderbook rows |
+
+Whole-stage timings are the median of `repeat` runs. Per-call stages time
+up to `max_calls` calls into a `LatencyHistogram` for p50/p99/p99.9.
+Peak RSS is the process high-water mark during the stage: on Linux it is
+reset before each stage, elsewhere it is the peak since process start.
+
+`compare` checks a run against a saved baseline: a stage regresses when
+its throughput drops, or its p99 latency or peak RSS grows, by more than
+`threshold`.
+"""
+
+import asyncio
+import contextlib
+import gc
+import json
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from ai_arb_lab import __version__
+from ai_arb_lab.backtest.engine import run_backtest
+from ai_arb_lab.core.batch import EventBatch
+from ai_arb_lab.core.bus import EventBus
+from ai_arb_lab.core.events import Event, OrderbookEvent
+from ai_arb_lab.core.telemetry import LatencyHistogram
+from ai_arb_lab.data.loader import load_data_dir
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+logger = logging.getLogger(__name__)
+
+BENCH_SEED = 42
+BENCH_START = datetime(2025, 1, 1)
+DEFAULT_DAYS = (1, 30)
+DEFAULT_VENUES = (2, 10, 50)
+DEFAULT_MAX_CALLS = 20_000
+
+_PROC_STATUS = Path("/proc/self/status")
+_PROC_CLEAR_REFS = Path("/proc/self/clear_refs")
+
+
+def _reset_peak_rss() -> None:
+    """Reset the high-water mark read by `_peak_rss_mb` (Linux only)."""
+    with contextlib.suppress(OSError):
+        _PROC_CLEAR_REFS.write_text("5")
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size in MiB, or None where it cannot be read."""
+    try:
+        for line in _PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KiB elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class StageResult:
+    """Timing of one stage. Latency fields are None for whole-stage timings."""
+
+    items: int
+    seconds: float
+    throughput: float
+    peak_rss_mb: float | None = None
+    p50_us: float | None = None
+    p99_us: float | None = None
+    p999_us: float | None = None
+
+
+@dataclass
+class BenchCase:
+    """One dataset size and the results of every stage run on it."""
+
+    days: int
+    venues: int
+    rows: int = 0
+    stages: dict[str, StageResult] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        """Key used to match cases against a baseline, e.g. `30d_10v`."""
+        return f"{self.days}d_{self.venues}v"
+
+
+@dataclass
+class Regression:
+    """A stage metric that moved the wrong way by more than the threshold."""
+
+    case: str
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline (positive = increase)."""
+        return self.current / self.baseline - 1.0 if self.baseline else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case} {self.stage} {self.metric}: "
+            f"{self.baseline:.4g} -> {self.current:.4g} ({self.change:+.1%})"
+        )
+
+
+def _timed(fn: Callable[[], int], repeat: int) -> StageResult:
+    """Median wall time of `repeat` runs of `fn`, which returns its item count."""
+    times = []
+    items = 0
+    _reset_peak_rss()
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        t0 = time.perf_counter()
+        items = fn()
+        times.append(time.perf_counter() - t0)
+    seconds = statistics.median(times)
+    return StageResult(
+        items=items,
+        seconds=seconds,
+        throughput=items / seconds if seconds > 0 else 0.0,
+        peak_rss_mb=_peak_rss_mb(),
+    )
+
+
+def _from_histogram(hist: LatencyHistogram) -> StageResult:
+    seconds = hist.total / 1e9
+    qs = hist.quantiles((0.5, 0.99, 0.999))
+    return StageResult(
+        items=hist.count,
+        seconds=seconds,
+        throughput=hist.count / seconds if seconds > 0 else 0.0,
+        peak_rss_mb=_peak_rss_mb(),
+        p50_us=qs[0.5] / 1e3,
+        p99_us=qs[0.99] / 1e3,
+        p999_us=qs[0.999] / 1e3,
+    )
+
+
+def _per_call(fn: Callable[[Any], object], args: Iterable[Any]) -> StageResult:
+    """Time `fn(arg)` for every arg into a histogram."""
+    hist = LatencyHistogram()
+    record = hist.record
+    clock = time.perf_counter_ns
+    _reset_peak_rss()
+    gc.collect()
+    for arg in args:
+        t0 = clock()
+        fn(arg)
+        record(clock() - t0)
+    return _from_histogram(hist)
+
+
+async def _publish_all(events: Sequence[Event]) -> LatencyHistogram:
+    bus = EventBus()
+
+    async def handler(event: Event) -> None:
+        pass
+
+    bus.subscribe(OrderbookEvent, handler)
+    hist = LatencyHistogram()
+    record = hist.record
+    clock = time.perf_counter_ns
+    for event in events:
+        t0 = clock()
+        await bus.publish(event)
+        record(clock() - t0)
+    return hist
+
+
+def run_case(
+    days: int,
+    venues: int,
+    workdir: Path,
+    repeat: int = 3,
+    max_calls: int = DEFAULT_MAX_CALLS,
+) -> BenchCase:
+    """Generate one dataset under `workdir` and benchmark every stage on it."""
+    case = BenchCase(days, venues)
+    generator = SyntheticMarketGenerator(seed=BENCH_SEED, n_venues=venues)
+
+    paths: dict[str, Path] = {}
+
+    def generate() -> int:
+        paths.update(
+            generator.generate_all(
+                workdir, start=BENCH_START, days=days, snapshots_per_minute=venues
+            )
+        )
+        return 0
+
+    stage = case.stages["generate"] = _timed(generate, repeat)
+    # Rows are counted afterwards so reading the files back is not timed
+    stage.items = sum(_csv_rows(path) for path in paths.values() if path.suffix == ".csv")
+    stage.throughput = stage.items / stage.seconds if stage.seconds > 0 else 0.0
+
+    loaded: dict[str, pd.DataFrame] = {}
+
+    def load() -> int:
+        loaded.update(load_data_dir(workdir))
+        return sum(len(frame) for frame in loaded.values())
+
+    case.stages["load"] = _timed(load, repeat)
+    orderbook = loaded["orderbook"]
+    case.rows = len(orderbook)
+
+    strategy = SimpleSpreadStrategy()
+    head = orderbook.head(max_calls * venues)
+    windows = [
+        {"orderbook": frame}
+        for _, frame in head.groupby(head["timestamp"].dt.floor("min"), sort=True)
+    ][:max_calls]
+    del head
+    case.stages["evaluate"] = _per_call(strategy.evaluate, windows)
+    del windows
+
+    events = list(EventBatch.from_frame(orderbook.head(max_calls), OrderbookEvent).iter_events())
+    strategy.reset()
+    case.stages["on_orderbook"] = _per_call(strategy.on_orderbook, events)
+
+    _reset_peak_rss()
+    gc.collect()
+    case.stages["publish"] = _from_histogram(asyncio.run(_publish_all(events)))
+    del events
+
+    def backtest() -> int:
+        broker = PaperBroker(fill_model=FillModel(seed=BENCH_SEED))
+        run_backtest(orderbook, SimpleSpreadStrategy(), broker.initial_capital, broker=broker)
+        return len(orderbook)
+
+    case.stages["backtest"] = _timed(backtest, repeat)
+    return case
+
+
+def _csv_rows(path: Path) -> int:
+    with path.open("rb") as f:
+        return max(0, sum(1 for _ in f) - 1)
+
+
+def run_bench(
+    days: Sequence[int] = DEFAULT_DAYS,
+    venues: Sequence[int] = DEFAULT_VENUES,
+    repeat: int = 3,
+    max_calls: int = DEFAULT_MAX_CALLS,
+    on_case: Callable[[BenchCase], None] | None = None,
+) -> list[BenchCase]:
+    """Benchmark every (days, venues) combination in a scratch directory."""
+    cases = []
+    for n_days in days:
+        for n_venues in venues:
+            with tempfile.TemporaryDirectory(prefix="ai-arb-bench-") as workdir:
+                case = run_case(n_days, n_venues, Path(workdir), repeat, max_calls)
+            logger.info("Benchmarked %s (%d orderbook rows)", case.name, case.rows)
+            if on_case is not None:
+                on_case(case)
+            cases.append(case)
+    return cases
+
+
+def to_dict(cases: Sequence[BenchCase]) -> dict[str, Any]:
+    """Benchmark results with the environment they were measured in."""
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": BENCH_SEED,
+        "cases": {
+            case.name: {
+                "days": case.days,
+                "venues": case.venues,
+                "rows": case.rows,
+                "stages": {name: asdict(stage) for name, stage in case.stages.items()},
+            }
+            for case in cases
+        },
+    }
+
+
+def save(cases: Sequence[BenchCase], path: Path | str) -> Path:
+    """Write results as JSON (see `to_dict`)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(to_dict(cases), indent=2))
+    return path
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.10
+) -> list[Regression]:
+    """Stage metrics in `current` worse than `baseline` by more than `threshold`.
+
+    Both arguments are `to_dict` output. Cases and stages missing from
+    either side are skipped.
+    """
+    regressions = []
+    for name, case in current["cases"].items():
+        base_case = baseline.get("cases", {}).get(name)
+        if base_case is None:
+            continue
+        for stage, result in case["stages"].items():
+            base = base_case["stages"].get(stage)
+            if base is None:
+                continue
+            if base["throughput"] and result["throughput"] < base["throughput"] * (1 - threshold):
+                regressions.append(
+                    Regression(name, stage, "throughput", base["throughput"], result["throughput"])
+                )
+            for metric in ("p99_us", "peak_rss_mb"):
+                old, new = base.get(metric), result.get(metric)
+                if old and new is not None and new > old * (1 + threshold):
+                    regressions.append(Regression(name, stage, metric, old, new))
+    return regressions
@@ -1,27 +1,24 @@
-"""CLI entry point using Typer."""
+"""CLI entry point using Typer.
+
+Only the standard library and Typer are imported at module level. Each
+command imports what it needs (pandas, NumPy, the strategy and execution
+stack) when it runs, and options that default to a setting read
+`ai_arb_lab.config` only then, so `ai-arb-lab version` and `--help` start
+in milliseconds. `tests/test_import_time.py` holds the import budget.
+"""
 
-import json
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
 from ai_arb_lab import __version__
-from ai_arb_lab.config import (
-    BACKTEST_INITIAL_CAPITAL,
-    DATA_DIR,
-)
-from ai_arb_lab.data.loader import load_data_dir
-from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
-from ai_arb_lab.execution.fill_model import FillModel
-from ai_arb_lab.execution.paper_broker import PaperBroker
-from ai_arb_lab.logging_config import setup_logging
-from ai_arb_lab.reporting.metrics import BacktestMetrics
-from ai_arb_lab.reporting.render import render_markdown_report, save_report
-from ai_arb_lab.risk.kill_switch import KillSwitch
-from ai_arb_lab.risk.limits import RiskLimits
-from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+if TYPE_CHECKING:
+    from ai_arb_lab.bench import BenchCase
+    from ai_arb_lab.reporting.metrics import BacktestMetrics
 
 app = typer.Typer(
     name="ai-arb-lab",
@@ -30,71 +27,87 @@ app = typer.Typer(
 logger = logging.getLogger(__name__)
 
 
+def _echo_latency() -> None:
+    """Print p50/p99 per instrumented stage and the event rate."""
+    from ai_arb_lab.core.telemetry import TELEMETRY
+
+    summary = TELEMETRY.to_dict()
+    for name, stage in summary["stages"].items():
+        typer.echo(
+            f"  {name:<18} n={stage['count']:<8} p50 {stage['p50_us']:9.1f} us  "
+            f"p99 {stage['p99_us']:9.1f} us"
+        )
+    typer.echo(f"  {summary['events_per_second']:,.0f} events/s")
+
+
 def _run_backtest_engine(
     data_dir: Path,
     output_dir: Path,
     initial_capital: float,
-) -> BacktestMetrics:
-    """Run backtest on loaded data."""
+    start: datetime | None = None,
+    end: datetime | None = None,
+    stress_paths: int = 0,
+    seed: int = 0,
+) -> "BacktestMetrics":
+    """Run backtest on loaded data, optionally followed by a Monte Carlo stress test."""
+    import json
+
+    from ai_arb_lab.backtest.engine import run_backtest
+    from ai_arb_lab.backtest.montecarlo import StressScenario, stress_test
+    from ai_arb_lab.core.telemetry import TELEMETRY
+    from ai_arb_lab.data.loader import load_data_dir
+    from ai_arb_lab.execution.fill_model import FillModel
+    from ai_arb_lab.execution.paper_broker import PaperBroker
+    from ai_arb_lab.logging_config import setup_logging
+    from ai_arb_lab.reporting.render import render_markdown_report, save_report
+    from ai_arb_lab.risk.kill_switch import KillSwitch
+    from ai_arb_lab.risk.limits import RiskLimits
+    from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
     setup_logging()
-    data = load_data_dir(data_dir)
+    TELEMETRY.enable()
+    data = load_data_dir(data_dir, start=start, end=end)
     if "orderbook" not in data:
         raise typer.BadParameter("No orderbook data found. Run generate-data first.")
 
-    orderbook = data["orderbook"]
     strategy = SimpleSpreadStrategy(min_spread_bps=15.0)
     risk_limits = RiskLimits(
         max_exposure=initial_capital * 0.5,
         initial_capital=initial_capital,
     )
     kill_switch = KillSwitch(enabled=True)
-    broker = PaperBroker(initial_capital=initial_capital, fill_model=FillModel())
-
-    trade_count = 0
-    win_count = 0
-    capital = initial_capital
-
-    # Sample orderbook by time windows (e.g., per minute)
-    orderbook = orderbook.copy()
-    orderbook["minute"] = orderbook["timestamp"].dt.floor("min")
-    groups = list(orderbook.groupby("minute"))
-    max_iterations = 500  # Limit for reasonable backtest duration
-    for minute, group in groups[:max_iterations]:
-        market_data = {"orderbook": group, "symbol": "BTC-USD"}
-        signal = strategy.evaluate(market_data)
-        if signal is None:
-            continue
-
-        ok, reason = risk_limits.check(signal, capital)
-        if not ok:
-            continue
-        ok, reason = kill_switch.check()
-        if not ok:
-            continue
-
-        from ai_arb_lab.core.clock import SimClock
-
-        clock = SimClock()
-        clock.start(datetime.fromisoformat(str(minute)))
-        _, fill = broker.submit_order(signal, clock)
-        if fill:
-            trade_count += 1
-            # Simplified: assume profit if we got a fill
-            win_count += 1
-        capital = broker.capital
-
-    metrics = BacktestMetrics.from_results(
+    broker = PaperBroker(initial_capital=initial_capital, fill_model=FillModel(seed=seed))
+
+    result = run_backtest(
+        data["orderbook"],
+        strategy,
         initial_capital=initial_capital,
-        final_capital=capital,
-        trade_count=trade_count,
-        win_count=win_count,
+        risk_limits=risk_limits,
+        kill_switch=kill_switch,
+        broker=broker,
     )
+    metrics = result.metrics
+    TELEMETRY.disable()
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "backtest_latency.json").write_text(json.dumps(TELEMETRY.to_dict(), indent=2))
+
+    stress = None
+    if stress_paths > 0:
+        fill_model = broker.fill_model
+        scenario = StressScenario(
+            slippage_bps=fill_model.slippage_bps * 10000, fee_rate=fill_model.fee_rate
+        )
+        mc = stress_test(result.signals, initial_capital, scenario, n_paths=stress_paths, seed=seed)
+        if mc.n_signals:
+            stress = mc.summary()
+            (output_dir / "backtest_stress.json").write_text(json.dumps(stress.to_dict(), indent=2))
 
     # Save report
-    output_dir.mkdir(parents=True, exist_ok=True)
-    md = render_markdown_report(metrics)
+    md = render_markdown_report(metrics, stress=stress)
     save_report(md, output_dir / "backtest_report.md")
     (output_dir / "backtest_metrics.json").write_text(json.dumps(metrics.to_dict(), indent=2))
+    if result.equity_curve is not None:
+        result.equity_curve.to_csv(output_dir / "backtest_equity.csv", index=False)
 
     return metrics
 
@@ -116,11 +129,44 @@ def generate_data(
     days: int = typer.Option(1, "--days", "-d"),
     seed: int = typer.Option(42, "--seed", "-s"),
     venues: int = typer.Option(2, "--venues", "-v"),
+    fmt: str = typer.Option(
+        "csv", "--format", "-f", help="csv, or parquet for a partitioned dataset"
+    ),
+    chunk_size: int = typer.Option(
+        None, "--chunk-size", help="Rows generated and written per chunk (default: 1,000,000)"
+    ),
+    depth_levels: int = typer.Option(1, "--depth-levels", help="Orderbook levels per side"),
+    cross: bool = typer.Option(
+        False, "--cross", help="Quote every pair of USD, BTC, ETH and SOL (triangular)"
+    ),
+    mispricing_bps: float = typer.Option(
+        0.0, "--mispricing-bps", help="Per-quote noise on cross rates (with --cross)"
+    ),
 ) -> None:
     """Generate synthetic market data."""
+    from ai_arb_lab.data.synthetic import (
+        CROSS_CURRENCIES,
+        DEFAULT_CHUNK_SIZE,
+        SyntheticMarketGenerator,
+        cross_symbols,
+    )
+    from ai_arb_lab.logging_config import setup_logging
+
     setup_logging()
+    if fmt not in ("csv", "parquet"):
+        raise typer.BadParameter("--format must be csv or parquet")
     gen = SyntheticMarketGenerator(seed=seed, n_venues=venues)
-    paths = gen.generate_all(output, days=days)
+    paths = gen.generate_all(
+        output,
+        days=days,
+        fmt=fmt,
+        chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+        depth_levels=depth_levels,
+        # With --cross, every symbol is quoted on every venue once a minute
+        snapshots_per_minute=len(cross_symbols(list(CROSS_CURRENCIES))) * venues if cross else 1,
+        currencies=CROSS_CURRENCIES if cross else None,
+        mispricing_bps=mispricing_bps,
+    )
     typer.echo(f"Generated: {list(paths.values())}")
 
 
@@ -128,39 +174,357 @@ def generate_data(
 def backtest(
     data_dir: Path = typer.Option(None, "--data-dir", "-d", path_type=Path),
     output: Path = typer.Option("./reports", "--output", "-o", path_type=Path),
-    initial_capital: float = typer.Option(BACKTEST_INITIAL_CAPITAL, "--capital", "-c"),
+    initial_capital: float = typer.Option(
+        None, "--capital", "-c", help="(default: BACKTEST_INITIAL_CAPITAL)"
+    ),
+    start: datetime = typer.Option(None, "--start", help="Only data at or after this time"),
+    end: datetime = typer.Option(None, "--end", help="Only data before this time"),
+    stress_paths: int = typer.Option(
+        1000, "--stress-paths", help="Monte Carlo paths for the stress section (0 to skip)"
+    ),
+    seed: int = typer.Option(
+        None,
+        "--seed",
+        "-s",
+        help="Seed for fill simulation and the stress test (default: BACKTEST_SEED)",
+    ),
 ) -> None:
     """Run backtest on data directory."""
-    data_dir = data_dir or DATA_DIR
-    metrics = _run_backtest_engine(data_dir, output, initial_capital)
+    from ai_arb_lab import config
+
+    data_dir = data_dir or config.DATA_DIR
+    metrics = _run_backtest_engine(
+        data_dir,
+        output,
+        initial_capital if initial_capital is not None else config.BACKTEST_INITIAL_CAPITAL,
+        start=start,
+        end=end,
+        stress_paths=stress_paths,
+        seed=seed if seed is not None else config.BACKTEST_SEED,
+    )
     typer.echo(
         f"Backtest complete. Return: {metrics.total_return_pct:.2%}, Trades: {metrics.trade_count}"
     )
     typer.echo(f"Report saved to {output / 'backtest_report.md'}")
+    typer.echo(f"Stage latency saved to {output / 'backtest_latency.json'}")
+
+
+@app.command()
+def sweep(
+    param: list[str] = typer.Option(
+        ..., "--param", "-p", help="Grid axis as name=v1,v2,... (repeatable)"
+    ),
+    data_dir: Path = typer.Option(None, "--data-dir", "-d", path_type=Path),
+    output: Path = typer.Option("./reports", "--output", "-o", path_type=Path),
+    initial_capital: float = typer.Option(
+        None, "--capital", "-c", help="(default: BACKTEST_INITIAL_CAPITAL)"
+    ),
+    workers: int = typer.Option(0, "--workers", "-w", help="Worker processes (0 = all cores)"),
+    start: datetime = typer.Option(None, "--start", help="Only data at or after this time"),
+    end: datetime = typer.Option(None, "--end", help="Only data before this time"),
+) -> None:
+    """Backtest every point of a parameter grid in parallel."""
+    from ai_arb_lab import config
+    from ai_arb_lab.backtest.sweep import parse_param, run_sweep
+    from ai_arb_lab.data.loader import load_data_dir
+    from ai_arb_lab.logging_config import setup_logging
+
+    setup_logging()
+    try:
+        grid = dict(parse_param(spec) for spec in param)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    data = load_data_dir(data_dir or config.DATA_DIR, start=start, end=end)
+    if "orderbook" not in data:
+        raise typer.BadParameter("No orderbook data found. Run generate-data first.")
+
+    if initial_capital is None:
+        initial_capital = config.BACKTEST_INITIAL_CAPITAL
+    results = run_sweep(data["orderbook"], grid, initial_capital, workers=workers or None)
+    output.mkdir(parents=True, exist_ok=True)
+    path = output / "sweep_results.csv"
+    results.to_csv(path, index=False)
+
+    best = results.loc[results["total_return_pct"].idxmax()]
+    params = ", ".join(f"{name}={best[name]:g}" for name in grid)
+    typer.echo(
+        f"Swept {len(results)} points. Best return {best['total_return_pct']:.2%} at {params}"
+    )
+    typer.echo(f"Results saved to {path}")
+
+
+@app.command()
+def walk_forward(
+    param: list[str] = typer.Option(
+        ..., "--param", "-p", help="Grid axis as name=v1,v2,... (repeatable)"
+    ),
+    train: str = typer.Option("7D", "--train", help="Train window length (e.g. 30D, 12h)"),
+    test: str = typer.Option("1D", "--test", help="Test window length"),
+    step: str = typer.Option(None, "--step", help="Advance between splits (default: --test)"),
+    mode: str = typer.Option("rolling", "--mode", help="rolling or anchored train windows"),
+    objective: str = typer.Option("total_return", "--objective", help="Metric to maximize"),
+    data_dir: Path = typer.Option(None, "--data-dir", "-d", path_type=Path),
+    output: Path = typer.Option("./reports", "--output", "-o", path_type=Path),
+    initial_capital: float = typer.Option(
+        None, "--capital", "-c", help="(default: BACKTEST_INITIAL_CAPITAL)"
+    ),
+    workers: int = typer.Option(0, "--workers", "-w", help="Worker processes (0 = all cores)"),
+) -> None:
+    """Walk-forward optimize strategy parameters and test them out-of-sample."""
+    from ai_arb_lab import config
+    from ai_arb_lab.backtest.sweep import parse_param
+    from ai_arb_lab.backtest.walkforward import run_walk_forward
+    from ai_arb_lab.data.loader import load_data_dir
+    from ai_arb_lab.logging_config import setup_logging
+
+    setup_logging()
+    if mode not in ("rolling", "anchored"):
+        raise typer.BadParameter("--mode must be rolling or anchored")
+    try:
+        grid = dict(parse_param(spec) for spec in param)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    data = load_data_dir(data_dir or config.DATA_DIR)
+    if "orderbook" not in data:
+        raise typer.BadParameter("No orderbook data found. Run generate-data first.")
+
+    result = run_walk_forward(
+        data["orderbook"],
+        grid,
+        initial_capital if initial_capital is not None else config.BACKTEST_INITIAL_CAPITAL,
+        train=train,
+        test=test,
+        step=step,
+        mode="anchored" if mode == "anchored" else "rolling",
+        objective=objective,
+        workers=workers or None,
+    )
+    output.mkdir(parents=True, exist_ok=True)
+    result.splits.to_csv(output / "walk_forward.csv", index=False)
+    result.trials.to_csv(output / "walk_forward_trials.csv", index=False)
+    typer.echo(
+        f"Walk-forward: {len(result.splits)} splits, "
+        f"out-of-sample return {result.test_return:.2f}"
+    )
+    typer.echo(f"Results saved to {output / 'walk_forward.csv'}")
+
+
+@app.command()
+def compare(
+    strategy: list[str] = typer.Option(
+        ...,
+        "--strategy",
+        "-s",
+        help="Strategy as id[:name=value,...], e.g. stat_arb:window=200 (repeatable)",
+    ),
+    data_dir: Path = typer.Option(None, "--data-dir", "-d", path_type=Path),
+    output: Path = typer.Option("./reports", "--output", "-o", path_type=Path),
+    initial_capital: float = typer.Option(
+        None, "--capital", "-c", help="(default: BACKTEST_INITIAL_CAPITAL)"
+    ),
+    seed: int = typer.Option(
+        None, "--seed", help="Seed for every strategy's fill simulation (default: BACKTEST_SEED)"
+    ),
+    start: datetime = typer.Option(None, "--start", help="Only data at or after this time"),
+    end: datetime = typer.Option(None, "--end", help="Only data before this time"),
+) -> None:
+    """Backtest several strategies in one event-driven pass over the data."""
+    from ai_arb_lab import config
+    from ai_arb_lab.backtest.event_driven import parse_strategy, run_multi_backtest
+    from ai_arb_lab.data.loader import load_data_dir
+    from ai_arb_lab.execution.fill_model import FillModel
+    from ai_arb_lab.logging_config import setup_logging
+    from ai_arb_lab.strategies.top_of_book import TopOfBookIndex
+
+    setup_logging()
+    book = TopOfBookIndex()
+    try:
+        strategies = {spec: parse_strategy(spec, book=book) for spec in strategy}
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    data = load_data_dir(data_dir or config.DATA_DIR, start=start, end=end)
+    if "orderbook" not in data:
+        raise typer.BadParameter("No orderbook data found. Run generate-data first.")
+
+    result = run_multi_backtest(
+        data["orderbook"],
+        strategies,
+        initial_capital if initial_capital is not None else config.BACKTEST_INITIAL_CAPITAL,
+        fill_model=FillModel(seed=seed if seed is not None else config.BACKTEST_SEED),
+    )
+    summary = result.summary()
+    output.mkdir(parents=True, exist_ok=True)
+    path = output / "compare_results.csv"
+    summary.to_csv(path, index=False)
+    for row in summary.itertuples():
+        typer.echo(
+            f"  {row.strategy:<40} return {row.total_return_pct:8.2%}  "
+            f"trades {row.trade_count:<6} signals {row.signal_count}"
+        )
+    typer.echo(f"Compared {len(summary)} strategies in one pass. Results saved to {path}")
 
 
 @app.command()
 def paper_run(
     data_dir: Path = typer.Option(None, "--data-dir", "-d", path_type=Path),
-    duration: int = typer.Option(60, "--duration", help="Seconds to run (simulated)"),
+    duration: int = typer.Option(60, "--duration", help="Seconds of market data to replay"),
+    mode: str = typer.Option(
+        "afap", "--mode", help="Clock mode: afap (as fast as possible) or paced (wall clock)"
+    ),
+    speed: float = typer.Option(1.0, "--speed", help="Speed-up over real time in paced mode"),
+    capital: float = typer.Option(None, "--capital", "-c", help="(default: PAPER_INITIAL_CAPITAL)"),
+    async_orders: bool = typer.Option(
+        False, "--async-orders", help="Send both legs concurrently with leg-risk unwinds"
+    ),
+    latency_ms: float = typer.Option(
+        0.0, "--latency-ms", help="Order-entry latency per leg with --async-orders"
+    ),
+    metrics_port: int = typer.Option(
+        None,
+        "--metrics-port",
+        help="Serve Prometheus /metrics on this port, 0 = off (default: METRICS_PORT)",
+    ),
 ) -> None:
     """Run paper trading simulation."""
+    import asyncio
+    import contextlib
+
+    from ai_arb_lab import config
+    from ai_arb_lab.core.batch import EventBatch
+    from ai_arb_lab.core.clock import SimClock
+    from ai_arb_lab.core.events import OrderbookEvent
+    from ai_arb_lab.core.telemetry import TELEMETRY, MetricsServer
+    from ai_arb_lab.data.loader import load_data_dir
+    from ai_arb_lab.execution.async_broker import AsyncPaperBroker
+    from ai_arb_lab.execution.fill_model import FillModel
+    from ai_arb_lab.execution.latency import LatencyModel, VenueLatency
+    from ai_arb_lab.execution.paper_broker import PaperBroker
+    from ai_arb_lab.execution.session import PaperSession
+    from ai_arb_lab.logging_config import setup_logging
+    from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
     setup_logging()
-    data_dir = data_dir or DATA_DIR
+    if mode not in ("afap", "paced"):
+        raise typer.BadParameter("--mode must be afap or paced")
+    if capital is None:
+        capital = config.PAPER_INITIAL_CAPITAL
+    if metrics_port is None:
+        metrics_port = config.METRICS_PORT
+    TELEMETRY.enable()
+    data_dir = data_dir or config.DATA_DIR
     data = load_data_dir(data_dir)
     if "orderbook" not in data:
         raise typer.BadParameter("No orderbook data. Run generate-data first.")
 
-    typer.echo(f"Paper run for {duration}s (simulated). No real orders.")
-    # Simplified: just run a few iterations
-    strategy = SimpleSpreadStrategy()
-    orderbook = data["orderbook"]
-    signals = 0
-    for _, group in orderbook.head(100).groupby(orderbook["timestamp"].dt.floor("min")):
-        s = strategy.evaluate({"orderbook": group, "symbol": "BTC-USD"})
-        if s:
-            signals += 1
-    typer.echo(f"Detected {signals} potential signals (simulation only)")
+    orderbook = data["orderbook"].sort_values("timestamp", kind="stable")
+    if orderbook.empty:
+        raise typer.BadParameter("Orderbook data is empty.")
+    start = orderbook["timestamp"].iloc[0]
+    orderbook = orderbook[orderbook["timestamp"] < start + timedelta(seconds=duration)]
+
+    typer.echo(f"Paper run over {duration}s of data ({mode}, {speed:g}x). No real orders.")
+    clock = SimClock(speed_multiplier=speed, mode=mode)
+    broker = (
+        AsyncPaperBroker(
+            initial_capital=capital,
+            fill_model=FillModel(),
+            latency=LatencyModel(default=VenueLatency(order_entry_ms=latency_ms)),
+        )
+        if async_orders
+        else PaperBroker(initial_capital=capital, fill_model=FillModel())
+    )
+    session = PaperSession(SimpleSpreadStrategy(), broker=broker, clock=clock)
+    events = EventBatch.from_frame(orderbook, OrderbookEvent).iter_events()
+    with contextlib.ExitStack() as stack:
+        if metrics_port:
+            server = stack.enter_context(MetricsServer(metrics_port))
+            typer.echo(f"Metrics at http://127.0.0.1:{server.port}/metrics")
+        stats = asyncio.run(session.run(events))
+    TELEMETRY.disable()
+    typer.echo(
+        f"Processed {stats.events} events: {stats.signals} signals, {stats.orders} orders, "
+        f"{stats.fills} fills (simulation only)"
+    )
+    if stats.metrics is not None:
+        m = stats.metrics
+        win_rate = f"{m.win_rate:.1%}" if m.win_rate is not None else "n/a"
+        typer.echo(
+            f"P&L {m.total_return:,.2f} ({m.total_return_pct:.2%}), "
+            f"max drawdown {m.max_drawdown_pct:.2%}, win rate {win_rate}"
+        )
+    if isinstance(broker, AsyncPaperBroker):
+        unwound = sum(result.status == "unwound" for result in broker.results)
+        typer.echo(f"Async legs: {len(broker.results)} signals, {unwound} unwound after leg risk")
+    if stats.drift is not None and stats.drift.waits:
+        drift = stats.drift
+        typer.echo(
+            f"Clock drift: mean {drift.mean_lag_ms:.2f} ms, max {drift.max_lag_ms:.2f} ms, "
+            f"late {drift.late}/{drift.waits}"
+        )
+    typer.echo("Latency:")
+    _echo_latency()
+
+
+def _int_list(value: str, option: str) -> list[int]:
+    try:
+        return [int(v) for v in value.split(",") if v.strip()]
+    except ValueError as e:
+        raise typer.BadParameter(f"{option} must be comma-separated integers") from e
+
+
+def _echo_case(case: "BenchCase") -> None:
+    typer.echo(f"{case.name} ({case.rows:,} orderbook rows)")
+    for name, stage in case.stages.items():
+        line = f"  {name:<13} {stage.throughput:>14,.0f} /s"
+        if stage.p50_us is not None and stage.p99_us is not None:
+            line += f"  p50 {stage.p50_us:9.1f} us  p99 {stage.p99_us:9.1f} us"
+        if stage.peak_rss_mb is not None:
+            line += f"  peak {stage.peak_rss_mb:7.1f} MiB"
+        typer.echo(line)
+
+
+@app.command()
+def bench(
+    days: str = typer.Option("1,30", "--days", help="Comma-separated dataset lengths in days"),
+    venues: str = typer.Option("2,10,50", "--venues", help="Comma-separated venue counts"),
+    output: Path = typer.Option("./reports/bench.json", "--output", "-o", path_type=Path),
+    baseline: Path = typer.Option(
+        None, "--baseline", "-b", path_type=Path, help="Earlier bench JSON to compare against"
+    ),
+    threshold: float = typer.Option(
+        0.10, "--threshold", help="Relative change that counts as a regression"
+    ),
+    repeat: int = typer.Option(3, "--repeat", help="Runs per whole-stage timing (median)"),
+    max_calls: int = typer.Option(
+        None, "--max-calls", help="Calls timed per per-call stage (default: 20,000)"
+    ),
+) -> None:
+    """Benchmark every pipeline stage on fixed-seed synthetic data."""
+    import json
+
+    from ai_arb_lab import bench as benchmarks
+    from ai_arb_lab.logging_config import setup_logging
+
+    setup_logging()
+    baseline_data = json.loads(baseline.read_text()) if baseline is not None else None
+    cases = benchmarks.run_bench(
+        _int_list(days, "--days"),
+        _int_list(venues, "--venues"),
+        repeat=repeat,
+        max_calls=max_calls or benchmarks.DEFAULT_MAX_CALLS,
+        on_case=_echo_case,
+    )
+    path = benchmarks.save(cases, output)
+    typer.echo(f"Results saved to {path}")
+    if baseline_data is None:
+        return
+    regressions = benchmarks.compare(benchmarks.to_dict(cases), baseline_data, threshold)
+    if regressions:
+        typer.echo(f"{len(regressions)} regression(s) beyond {threshold:.0%} vs {baseline}:")
+        for regression in regressions:
+            typer.echo(f"  {regression}")
+        raise typer.Exit(1)
+    typer.echo(f"No regressions beyond {threshold:.0%} vs {baseline}")
 
 
 @app.command()
@@ -171,6 +535,12 @@ def report(
     output: Path = typer.Option("./reports/summary.md", "--output", "-o", path_type=Path),
 ) -> None:
     """Generate report from backtest metrics JSON."""
+    import json
+
+    from ai_arb_lab.logging_config import setup_logging
+    from ai_arb_lab.reporting.metrics import BacktestMetrics
+    from ai_arb_lab.reporting.render import render_markdown_report, save_report
+
     setup_logging()
     path = Path(input_path)
     if "*" in input_path:
@@ -196,6 +566,9 @@ def report(
             win_count=data["win_count"],
             max_drawdown_pct=data["max_drawdown_pct"],
             sharpe_ratio=data.get("sharpe_ratio"),
+            sortino_ratio=data.get("sortino_ratio"),
+            win_rate=data.get("win_rate"),
+            profit_factor=data.get("profit_factor"),
         )
         all_metrics.append(m)
 
@@ -1,11 +1,15 @@
-"""Configuration management. Load from env and defaults."""
+"""Configuration management. Load from env and defaults.
+
+Settings are read on first use, not at import: the first access to any of
+them loads `.env` into the environment and reads them all once (see
+`settings`). Importing this module is therefore free, and
+`from ai_arb_lab.config import DATA_DIR` works as before.
+"""
 
 import os
+from functools import cache
 from pathlib import Path
-
-from dotenv import load_dotenv
-
-load_dotenv()
+from typing import Any
 
 
 def get_env(key: str, default: str = "") -> str:
@@ -29,22 +33,59 @@ def get_env_int(key: str, default: int = 0) -> int:
         return default
 
 
+# Declared here, read by `settings` on first access
+
 # Application
-APP_ENV = get_env("APP_ENV", "development")
-LOG_LEVEL = get_env("LOG_LEVEL", "INFO")
-LOG_FORMAT = get_env("LOG_FORMAT", "json")
-CORRELATION_ID_PREFIX = get_env("CORRELATION_ID_PREFIX", "arb")
+APP_ENV: str
+LOG_LEVEL: str
+LOG_FORMAT: str
+CORRELATION_ID_PREFIX: str
 
 # Data
-DATA_DIR = Path(get_env("DATA_DIR", "./data/sample"))
-SYNTHETIC_SEED = get_env_int("SYNTHETIC_SEED", 42)
-SYNTHETIC_VENUES = get_env_int("SYNTHETIC_VENUES", 2)
-SYNTHETIC_DAYS = get_env_int("SYNTHETIC_DAYS", 1)
+DATA_DIR: Path
+SYNTHETIC_SEED: int
+SYNTHETIC_VENUES: int
+SYNTHETIC_DAYS: int
 
 # Backtest
-BACKTEST_INITIAL_CAPITAL = get_env_float("BACKTEST_INITIAL_CAPITAL", 100_000.0)
-BACKTEST_COMMISSION_RATE = get_env_float("BACKTEST_COMMISSION_RATE", 0.001)
+BACKTEST_INITIAL_CAPITAL: float
+BACKTEST_COMMISSION_RATE: float
+BACKTEST_SEED: int
 
 # Paper
-PAPER_INITIAL_CAPITAL = get_env_float("PAPER_INITIAL_CAPITAL", 100_000.0)
-PAPER_MODE = get_env("PAPER_MODE", "simulated")
+PAPER_INITIAL_CAPITAL: float
+PAPER_MODE: str
+
+# Telemetry
+METRICS_PORT: int
+
+
+@cache
+def settings() -> dict[str, Any]:
+    """Load `.env` and read every setting from the environment (once)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return {
+        "APP_ENV": get_env("APP_ENV", "development"),
+        "LOG_LEVEL": get_env("LOG_LEVEL", "INFO"),
+        "LOG_FORMAT": get_env("LOG_FORMAT", "json"),
+        "CORRELATION_ID_PREFIX": get_env("CORRELATION_ID_PREFIX", "arb"),
+        "DATA_DIR": Path(get_env("DATA_DIR", "./data/sample")),
+        "SYNTHETIC_SEED": get_env_int("SYNTHETIC_SEED", 42),
+        "SYNTHETIC_VENUES": get_env_int("SYNTHETIC_VENUES", 2),
+        "SYNTHETIC_DAYS": get_env_int("SYNTHETIC_DAYS", 1),
+        "BACKTEST_INITIAL_CAPITAL": get_env_float("BACKTEST_INITIAL_CAPITAL", 100_000.0),
+        "BACKTEST_COMMISSION_RATE": get_env_float("BACKTEST_COMMISSION_RATE", 0.001),
+        "BACKTEST_SEED": get_env_int("BACKTEST_SEED", 0),
+        "PAPER_INITIAL_CAPITAL": get_env_float("PAPER_INITIAL_CAPITAL", 100_000.0),
+        "PAPER_MODE": get_env("PAPER_MODE", "simulated"),
+        "METRICS_PORT": get_env_int("METRICS_PORT", 0),
+    }
+
+
+def __getattr__(name: str) -> Any:
+    values = settings()
+    if name not in values:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return values[name]
@@ -2,13 +2,15 @@
 
 Real exchange connectors must be implemented by users, with full
 awareness of ToS, rate limits, and compliance. This module provides
-interfaces and stubs for simulation only.
+interfaces, stubs and a historical replay connector for simulation only.
 """
 
 from ai_arb_lab.connectors.base import MarketDataConnector
 from ai_arb_lab.connectors.mock import MockMarketDataConnector
+from ai_arb_lab.connectors.replay import ReplayConnector
 
 __all__ = [
     "MarketDataConnector",
     "MockMarketDataConnector",
+    "ReplayConnector",
 ]
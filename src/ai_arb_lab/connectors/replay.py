@@ -0,0 +1,150 @@
+"""Historical replay connector. Streams recorded CSV/Parquet data as events.
+
+Files are read in fixed-size chunks (CSV) or record batches (Parquet), so
+memory stays flat regardless of file size. Parquet row groups whose
+timestamp statistics fall outside the requested window are skipped
+without being read.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Generator, Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ai_arb_lab.connectors.base import MarketDataConnector
+from ai_arb_lab.core.batch import EventBatch
+from ai_arb_lab.core.clock import ClockMode, SimClock
+from ai_arb_lab.core.events import Event, OrderbookEvent, TradeEvent
+
+logger = logging.getLogger(__name__)
+
+ReplayMode = ClockMode
+
+
+def infer_event_type(columns: list[str]) -> type[Event]:
+    """Pick the event model matching a file's columns."""
+    if "bid_price" in columns and "ask_price" in columns:
+        return OrderbookEvent
+    if "price" in columns and "side" in columns:
+        return TradeEvent
+    raise ValueError(f"Cannot infer event type from columns: {columns}")
+
+
+class ReplayConnector(MarketDataConnector):
+    """Replay a recorded CSV or Parquet file through the async pipeline.
+
+    Pacing follows the clock's mode. With a `paced` clock, event timestamps
+    are mapped to wall-clock time scaled by `clock.speed_multiplier` (10.0 =
+    ten times faster than recorded). With an `afap` clock, events are yielded
+    as fast as they can be read. `mode`, if given, sets the clock's mode; it
+    can be switched later with `clock.set_mode`, even mid-stream. Either way
+    the clock is moved to each event's timestamp before it is yielded.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        clock: SimClock | None = None,
+        mode: ReplayMode | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        event_type: type[Event] | None = None,
+        chunk_size: int = 50_000,
+    ) -> None:
+        self.path = Path(path)
+        self.clock = clock or SimClock()
+        if mode is not None:
+            self.clock.set_mode(mode)
+        self.start = pd.Timestamp(start) if start is not None else None
+        self.end = pd.Timestamp(end) if end is not None else None
+        self.event_type = event_type
+        self.chunk_size = chunk_size
+        self._connected = False
+
+    def connect(self) -> None:
+        """Validate the source file and resolve the event type."""
+        if not self.path.exists():
+            raise FileNotFoundError(self.path)
+        if self.event_type is None:
+            self.event_type = infer_event_type(self._columns())
+        self._connected = True
+
+    def disconnect(self) -> None:
+        """Stop replay. Files are opened per stream, so nothing is held."""
+        self._connected = False
+
+    def _is_parquet(self) -> bool:
+        return self.path.suffix.lower() in (".parquet", ".pq")
+
+    def _columns(self) -> list[str]:
+        if self._is_parquet():
+            return list(pq.ParquetFile(self.path).schema_arrow.names)
+        return list(pd.read_csv(self.path, nrows=0).columns)
+
+    def _read_chunks(self) -> Generator[pd.DataFrame, None, None]:
+        if self._is_parquet():
+            yield from self._read_parquet_chunks()
+        else:
+            for chunk in pd.read_csv(self.path, chunksize=self.chunk_size):
+                chunk["timestamp"] = pd.to_datetime(chunk["timestamp"])
+                yield chunk
+
+    def _read_parquet_chunks(self) -> Iterator[pd.DataFrame]:
+        pf = pq.ParquetFile(self.path)
+        ts_index = pf.schema_arrow.get_field_index("timestamp")
+        row_groups = []
+        for i in range(pf.metadata.num_row_groups):
+            stats = pf.metadata.row_group(i).column(ts_index).statistics
+            if stats is not None and stats.has_min_max:
+                if self.start is not None and pd.Timestamp(stats.max) < self.start:
+                    continue
+                if self.end is not None and pd.Timestamp(stats.min) >= self.end:
+                    continue
+            row_groups.append(i)
+        if not row_groups:
+            return
+        for record_batch in pf.iter_batches(batch_size=self.chunk_size, row_groups=row_groups):
+            chunk = record_batch.to_pandas()
+            chunk["timestamp"] = pd.to_datetime(chunk["timestamp"])
+            yield chunk
+
+    def _filter(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        if self.start is not None:
+            chunk = chunk[chunk["timestamp"] >= self.start]
+        if self.end is not None:
+            chunk = chunk[chunk["timestamp"] < self.end]
+        return chunk
+
+    async def _iter_batches(self) -> AsyncIterator[EventBatch]:
+        if not self._connected:
+            self.connect()
+        assert self.event_type is not None
+        chunks = self._read_chunks()
+        try:
+            while self._connected:
+                # File reads run in a worker thread so the event loop keeps serving
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    return
+                chunk = self._filter(chunk)
+                if not chunk.empty:
+                    yield EventBatch.from_frame(chunk, self.event_type)
+        finally:
+            chunks.close()
+
+    async def stream_batches(self) -> AsyncIterator[EventBatch]:
+        """Yield one `EventBatch` per chunk, paced on each batch's first event."""
+        async for batch in self._iter_batches():
+            await self.clock.wait_until(int(batch.timestamps[0]))
+            yield batch
+
+    async def stream_events(self) -> AsyncIterator[Event]:  # type: ignore[override]
+        """Yield per-event models in file order, paced per event."""
+        async for batch in self._iter_batches():
+            for event, ts in zip(batch.iter_events(), batch.timestamps.tolist(), strict=True):
+                await self.clock.wait_until(ts)
+                yield event
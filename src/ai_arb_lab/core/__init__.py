@@ -1,8 +1,11 @@
-"""Core components: events, bus, clock."""
+"""Core components: events, bus, clock, telemetry, quantile sketches."""
 
-from ai_arb_lab.core.bus import EventBus
-from ai_arb_lab.core.clock import SimClock
+from ai_arb_lab.core.batch import EventBatch
+from ai_arb_lab.core.book import BookSide, OrderBookL2, SweepResult
+from ai_arb_lab.core.bus import EventBus, SubscriberStats, Subscription
+from ai_arb_lab.core.clock import ClockDrift, SimClock
 from ai_arb_lab.core.events import (
+    BookDepth,
     Event,
     FillEvent,
     OrderbookEvent,
@@ -10,14 +13,36 @@ from ai_arb_lab.core.events import (
     SignalEvent,
     TradeEvent,
 )
+from ai_arb_lab.core.ledger import Position, PositionLedger
+from ai_arb_lab.core.scheduler import EventScheduler, ScheduledEvent
+from ai_arb_lab.core.sketch import QuantileSketch
+from ai_arb_lab.core.telemetry import TELEMETRY, LatencyHistogram, MetricsServer, Stage, Telemetry
 
 __all__ = [
     "Event",
     "TradeEvent",
     "OrderbookEvent",
+    "BookDepth",
     "SignalEvent",
     "FillEvent",
     "OrderEvent",
+    "EventBatch",
+    "BookSide",
+    "OrderBookL2",
+    "SweepResult",
+    "Position",
+    "PositionLedger",
     "EventBus",
+    "Subscription",
+    "SubscriberStats",
     "SimClock",
+    "ClockDrift",
+    "EventScheduler",
+    "ScheduledEvent",
+    "LatencyHistogram",
+    "Stage",
+    "Telemetry",
+    "TELEMETRY",
+    "MetricsServer",
+    "QuantileSketch",
 ]
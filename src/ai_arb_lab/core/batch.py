@@ -0,0 +1,165 @@
+"""Columnar event batches.
+
+An `EventBatch` holds many events of one type as a struct of NumPy arrays:
+int64 nanosecond timestamps, categorical codes for string fields (venue,
+symbol, side, ...) and float64 columns for prices and sizes. Replay and
+backtest traffic moves through the bus as batches; the per-event pydantic
+models are only built at the edges via `to_events` / `from_events`.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cache
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ai_arb_lab.core.events import Event
+
+FieldKind = Literal["float", "category"]
+
+
+@cache
+def batch_schema(event_type: type[Event]) -> dict[str, FieldKind]:
+    """Map each columnar field of an event type to its storage kind.
+
+    `timestamp` is stored separately as int64 nanoseconds. Fields that are
+    neither numeric nor string (e.g. `OrderbookEvent.depth`) are not carried.
+    """
+    schema: dict[str, FieldKind] = {}
+    for name, info in event_type.model_fields.items():
+        if name == "timestamp":
+            continue
+        annotation = info.annotation
+        if annotation in (float, int):
+            schema[name] = "float"
+        elif annotation in (str, str | None):
+            schema[name] = "category"
+    return schema
+
+
+@dataclass(frozen=True)
+class EventBatch:
+    """Struct-of-arrays container for events of a single type.
+
+    String fields are stored as int32 codes into `categories[name]`; a code
+    of -1 means missing (None). Slicing with a `slice` returns views of the
+    underlying arrays, so windows over a large batch are zero-copy.
+    """
+
+    event_type: type[Event]
+    timestamps: npt.NDArray[np.int64]
+    floats: dict[str, npt.NDArray[np.float64]]
+    codes: dict[str, npt.NDArray[np.int32]]
+    categories: dict[str, tuple[str, ...]]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(
+        self, index: slice | npt.NDArray[np.bool_] | npt.NDArray[np.intp]
+    ) -> "EventBatch":
+        """Select rows. Slices are views; masks and index arrays copy."""
+        return EventBatch(
+            event_type=self.event_type,
+            timestamps=self.timestamps[index],
+            floats={name: col[index] for name, col in self.floats.items()},
+            codes={name: col[index] for name, col in self.codes.items()},
+            categories=self.categories,
+        )
+
+    def column(self, name: str) -> npt.NDArray[Any]:
+        """Return a field as an array. String fields are decoded to objects."""
+        if name == "timestamp":
+            return self.timestamps
+        if name in self.floats:
+            return self.floats[name]
+        if name in self.codes:
+            lookup = np.array([*self.categories[name], None], dtype=object)
+            return lookup[self.codes[name]]
+        raise KeyError(name)
+
+    def iter_events(self) -> Iterator[Event]:
+        """Yield per-event models, one row at a time."""
+        times = pd.to_datetime(self.timestamps, unit="ns").to_pydatetime()
+        floats = {name: col.tolist() for name, col in self.floats.items()}
+        strings = {name: self.column(name).tolist() for name in self.codes}
+        for i, ts in enumerate(times):
+            fields: dict[str, Any] = {"timestamp": ts}
+            for name, values in floats.items():
+                fields[name] = values[i]
+            for name, values in strings.items():
+                fields[name] = values[i]
+            yield self.event_type(**fields)
+
+    def to_events(self) -> list[Event]:
+        """Convert the batch back to per-event models."""
+        return list(self.iter_events())
+
+    def to_frame(self) -> pd.DataFrame:
+        """Convert to a DataFrame with categorical string columns."""
+        data: dict[str, Any] = {"timestamp": pd.to_datetime(self.timestamps, unit="ns")}
+        for name in batch_schema(self.event_type):
+            if name in self.floats:
+                data[name] = self.floats[name]
+            else:
+                data[name] = pd.Categorical.from_codes(
+                    self.codes[name], categories=pd.Index(self.categories[name])
+                )
+        return pd.DataFrame(data)
+
+    @classmethod
+    def from_events(cls, events: Sequence[Event]) -> "EventBatch":
+        """Build a batch from per-event models of one type."""
+        if not events:
+            raise ValueError("Cannot infer event type from an empty sequence")
+        event_type = type(events[0])
+        if any(type(e) is not event_type for e in events):
+            raise TypeError("EventBatch requires events of a single type")
+        columns: dict[str, list[Any]] = {"timestamp": [e.timestamp for e in events]}
+        for name in batch_schema(event_type):
+            columns[name] = [getattr(e, name) for e in events]
+        return cls.from_frame(pd.DataFrame(columns), event_type)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, event_type: type[Event]) -> "EventBatch":
+        """Build a batch from a DataFrame (e.g. loader output).
+
+        Columns missing from the frame take the model's default; a missing
+        required field raises ValueError.
+        """
+        n = len(frame)
+        if "timestamp" in frame.columns:
+            timestamps = (
+                pd.to_datetime(frame["timestamp"]).to_numpy(dtype="datetime64[ns]").view(np.int64)
+            )
+        else:
+            timestamps = np.full(n, np.datetime64(datetime.utcnow(), "ns").view(np.int64))
+
+        floats: dict[str, npt.NDArray[np.float64]] = {}
+        codes: dict[str, npt.NDArray[np.int32]] = {}
+        categories: dict[str, tuple[str, ...]] = {}
+        for name, kind in batch_schema(event_type).items():
+            if name in frame.columns:
+                values = frame[name]
+            else:
+                info = event_type.model_fields[name]
+                if info.is_required():
+                    raise ValueError(f"Missing required column {name!r} for {event_type.__name__}")
+                values = pd.Series([info.default] * n, dtype=object)
+            if kind == "float":
+                floats[name] = values.to_numpy(dtype=np.float64)
+            else:
+                cat = pd.Categorical(values)
+                codes[name] = cat.codes.astype(np.int32)
+                categories[name] = tuple(str(c) for c in cat.categories)
+        return cls(
+            event_type=event_type,
+            timestamps=np.ascontiguousarray(timestamps),
+            floats=floats,
+            codes=codes,
+            categories=categories,
+        )
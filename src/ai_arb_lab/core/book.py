@@ -0,0 +1,289 @@
+"""Array-backed L2 order book.
+
+Each side keeps its levels in preallocated NumPy arrays sorted so that the
+best level is last: bids by ascending price, asks by descending price.
+Finding a level is a binary search (O(log n)). Changes at or near the top of
+the book, which are the common case, shift only the few levels above the
+touched one. Sweeping k levels reads the last k entries, so its cost
+depends on k and not on the book's total depth.
+
+Wide frames carry extra levels as `bid_price_1`, `bid_size_1`, ...,
+`ask_price_1`, `ask_size_1`, ... next to the top-of-book columns
+(`bid_price`, `bid_size`, `ask_price`, `ask_size`), which are level 0.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from ai_arb_lab.core.events import BookDepth, OrderbookEvent
+
+BookSideName = Literal["bid", "ask"]
+FloatArray = npt.NDArray[np.float64]
+
+
+def depth_columns(levels: int) -> list[str]:
+    """Column names for levels 1..levels-1 of a wide orderbook frame."""
+    return [
+        f"{side}_{field}_{i}"
+        for i in range(1, levels)
+        for side in ("bid", "ask")
+        for field in ("price", "size")
+    ]
+
+
+def frame_levels(frame: pd.DataFrame) -> int:
+    """Number of book levels present in a wide orderbook frame."""
+    levels = 1
+    while f"bid_price_{levels}" in frame.columns:
+        levels += 1
+    return levels
+
+
+def level_arrays(frame: pd.DataFrame) -> tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    """(bid_prices, bid_sizes, ask_prices, ask_sizes), each rows x levels, best first."""
+    levels = frame_levels(frame)
+
+    def stack(side: str, field: str) -> FloatArray:
+        names = [f"{side}_{field}"] + [f"{side}_{field}_{i}" for i in range(1, levels)]
+        values: FloatArray = frame[names].to_numpy(dtype=np.float64)
+        return values
+
+    return stack("bid", "price"), stack("bid", "size"), stack("ask", "price"), stack("ask", "size")
+
+
+@dataclass(frozen=True, slots=True)
+class SweepResult:
+    """Outcome of walking one side of the book for a given size."""
+
+    requested: float
+    filled: float
+    cost: float
+    levels: int
+    worst_price: float
+
+    @property
+    def vwap(self) -> float:
+        """Volume-weighted average fill price (NaN if nothing filled)."""
+        return self.cost / self.filled if self.filled > 0 else float("nan")
+
+    @property
+    def remaining(self) -> float:
+        """Size left unfilled because liquidity ran out (or hit the limit)."""
+        return max(self.requested - self.filled, 0.0)
+
+
+class BookSide:
+    """One side of an L2 book as sorted price/size arrays, best level last."""
+
+    def __init__(self, side: BookSideName, capacity: int = 64) -> None:
+        self.side = side
+        # Keys are prices for bids and negated prices for asks, so that in
+        # both cases keys ascend towards the best level
+        self._sign = 1.0 if side == "bid" else -1.0
+        self._keys: FloatArray = np.empty(max(capacity, 1))
+        self._sizes: FloatArray = np.empty(max(capacity, 1))
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def _grow(self) -> None:
+        capacity = max(2 * len(self._keys), 8)
+        keys = np.empty(capacity)
+        sizes = np.empty(capacity)
+        keys[: self._n] = self._keys[: self._n]
+        sizes[: self._n] = self._sizes[: self._n]
+        self._keys, self._sizes = keys, sizes
+
+    def clear(self) -> None:
+        """Remove every level."""
+        self._n = 0
+
+    def update(self, price: float, size: float) -> None:
+        """Set the size at a price level; a size <= 0 removes the level."""
+        key = self._sign * price
+        n = self._n
+        keys = self._keys
+        i = int(np.searchsorted(keys[:n], key))
+        exists = i < n and keys[i] == key
+        if size <= 0:
+            if exists:
+                keys[i : n - 1] = keys[i + 1 : n]
+                self._sizes[i : n - 1] = self._sizes[i + 1 : n]
+                self._n = n - 1
+            return
+        if exists:
+            self._sizes[i] = size
+            return
+        if n == len(keys):
+            self._grow()
+            keys = self._keys
+        sizes = self._sizes
+        keys[i + 1 : n + 1] = keys[i:n]
+        sizes[i + 1 : n + 1] = sizes[i:n]
+        keys[i] = key
+        sizes[i] = size
+        self._n = n + 1
+
+    def set_levels(self, prices: npt.ArrayLike, sizes: npt.ArrayLike) -> None:
+        """Replace the side with a full snapshot (any order; empty levels dropped)."""
+        p = np.asarray(prices, dtype=np.float64)
+        s = np.asarray(sizes, dtype=np.float64)
+        keep = (s > 0) & np.isfinite(p)
+        keys = self._sign * p[keep]
+        order = np.argsort(keys, kind="stable")
+        n = len(order)
+        while len(self._keys) < n:
+            self._grow()
+        self._keys[:n] = keys[order]
+        self._sizes[:n] = s[keep][order]
+        self._n = n
+
+    def set_top(self, price: float, size: float) -> None:
+        """Replace the side with a single level (empty if `size` <= 0)."""
+        self._keys[0] = self._sign * price
+        self._sizes[0] = size
+        self._n = 1 if size > 0 else 0
+
+    def best(self) -> tuple[float, float] | None:
+        """(price, size) of the best level."""
+        if self._n == 0:
+            return None
+        return self._sign * float(self._keys[self._n - 1]), float(self._sizes[self._n - 1])
+
+    def levels(self, k: int | None = None) -> tuple[FloatArray, FloatArray]:
+        """Prices and sizes of the best `k` levels (all by default), best first."""
+        n = self._n
+        lo = 0 if k is None else max(n - k, 0)
+        return self._sign * self._keys[lo:n][::-1], self._sizes[lo:n][::-1].copy()
+
+    def total_size(self, k: int | None = None) -> float:
+        """Liquidity available in the best `k` levels."""
+        n = self._n
+        lo = 0 if k is None else max(n - k, 0)
+        return float(self._sizes[lo:n].sum())
+
+    def sweep(self, size: float, limit_price: float | None = None) -> SweepResult:
+        """Walk levels from the best until `size` is filled, without mutating.
+
+        Levels priced worse than `limit_price` are not taken. Levels are
+        scanned in growing blocks from the top, so the work is proportional
+        to the number of levels consumed.
+        """
+        n = self._n
+        if size <= 0 or n == 0:
+            return SweepResult(size, 0.0, 0.0, 0, float("nan"))
+        limit_key = -np.inf if limit_price is None else self._sign * limit_price
+        block = 8
+        while True:
+            lo = max(n - block, 0)
+            keys = self._keys[lo:n][::-1]
+            sizes = self._sizes[lo:n][::-1]
+            usable = int(np.searchsorted(-keys, -limit_key, side="right"))
+            cum = np.cumsum(sizes[:usable])
+            if usable < len(keys) or lo == 0 or (len(cum) and cum[-1] >= size):
+                break
+            block *= 4
+        k = int(np.searchsorted(cum, size))
+        if k < len(cum):
+            taken = sizes[: k + 1].copy()
+            taken[k] = size - (cum[k - 1] if k > 0 else 0.0)
+        else:
+            taken = sizes[:usable]
+        levels = len(taken)
+        if levels == 0:
+            return SweepResult(size, 0.0, 0.0, 0, float("nan"))
+        prices = self._sign * keys[:levels]
+        return SweepResult(
+            requested=size,
+            filled=float(taken.sum()),
+            cost=float(prices @ taken),
+            levels=levels,
+            worst_price=float(prices[-1]),
+        )
+
+    def consume(self, size: float, limit_price: float | None = None) -> SweepResult:
+        """Sweep and remove the taken liquidity from the book."""
+        result = self.sweep(size, limit_price)
+        if result.levels:
+            n = self._n
+            top = n - result.levels
+            left = float(self._sizes[top]) - (result.filled - float(self._sizes[top + 1 : n].sum()))
+            if left > 1e-12:
+                self._sizes[top] = left
+                self._n = top + 1
+            else:
+                self._n = top
+        return result
+
+
+class OrderBookL2:
+    """L2 book for one venue/symbol."""
+
+    def __init__(self, venue: str, symbol: str, capacity: int = 64) -> None:
+        self.venue = venue
+        self.symbol = symbol
+        self.bids = BookSide("bid", capacity)
+        self.asks = BookSide("ask", capacity)
+        self.timestamp: datetime | None = None
+
+    @classmethod
+    def from_levels(
+        cls,
+        venue: str,
+        symbol: str,
+        bid_prices: npt.ArrayLike,
+        bid_sizes: npt.ArrayLike,
+        ask_prices: npt.ArrayLike,
+        ask_sizes: npt.ArrayLike,
+    ) -> "OrderBookL2":
+        """Build a book from level arrays."""
+        book = cls(venue, symbol)
+        book.bids.set_levels(bid_prices, bid_sizes)
+        book.asks.set_levels(ask_prices, ask_sizes)
+        return book
+
+    def apply(self, event: OrderbookEvent) -> None:
+        """Replace the book with an orderbook snapshot.
+
+        Uses `event.depth` when present, else the top of book only.
+        """
+        if event.depth is not None:
+            bids = np.asarray(event.depth.bids, dtype=np.float64).reshape(-1, 2)
+            asks = np.asarray(event.depth.asks, dtype=np.float64).reshape(-1, 2)
+            self.bids.set_levels(bids[:, 0], bids[:, 1])
+            self.asks.set_levels(asks[:, 0], asks[:, 1])
+        else:
+            self.bids.set_top(event.bid_price, event.bid_size)
+            self.asks.set_top(event.ask_price, event.ask_size)
+        self.timestamp = event.timestamp
+
+    def update(self, side: BookSideName, price: float, size: float) -> None:
+        """Incremental level update; a size <= 0 removes the level."""
+        (self.bids if side == "bid" else self.asks).update(price, size)
+
+    def best_bid(self) -> tuple[float, float] | None:
+        """(price, size) of the highest bid."""
+        return self.bids.best()
+
+    def best_ask(self) -> tuple[float, float] | None:
+        """(price, size) of the lowest ask."""
+        return self.asks.best()
+
+    def sweep(self, side: str, size: float, limit_price: float | None = None) -> SweepResult:
+        """Cost of a market order: buys walk the asks, sells walk the bids."""
+        return (self.asks if side == "buy" else self.bids).sweep(size, limit_price)
+
+    def to_depth(self, k: int | None = None) -> BookDepth:
+        """Best `k` levels per side as an event payload."""
+        bid_p, bid_s = self.bids.levels(k)
+        ask_p, ask_s = self.asks.levels(k)
+        return BookDepth(
+            bids=list(zip(bid_p.tolist(), bid_s.tolist(), strict=True)),
+            asks=list(zip(ask_p.tolist(), ask_s.tolist(), strict=True)),
+        )
@@ -3,50 +3,415 @@
 Routes events between publishers and subscribers. Used for
 data -> strategy -> risk -> execution flow. No external
 message queue required for core functionality.
+
+Two dispatch modes are available per subscriber:
+
+- **direct**: the publisher awaits the handler inline (original behaviour).
+- **queued**: the subscriber owns a bounded queue drained by its own
+  consumer task, so a slow handler (e.g. reporting) never stalls the
+  publisher or other subscribers. Backpressure is configurable and
+  handlers may opt into receiving lists of events.
+
+Routing is MRO-aware: a handler subscribed to `Event` receives every
+event subclass. The per-type route table is computed once and cached.
 """
 
 import asyncio
+import contextlib
 import logging
-from collections.abc import Awaitable, Callable
-from typing import TypeVar
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from itertools import groupby, islice
+from typing import Any, Literal, TypeVar
 
+from ai_arb_lab.core.batch import EventBatch
 from ai_arb_lab.core.events import Event
+from ai_arb_lab.core.telemetry import BUS_PUBLISH, TELEMETRY
 
 logger = logging.getLogger(__name__)
 
-T = TypeVar("T", bound=Event)
+Message = Event | EventBatch
+T = TypeVar("T", bound=Message)
+
+Dispatch = Literal["direct", "queued"]
+Backpressure = Literal["block", "drop_oldest", "coalesce"]
+KeyFunc = Callable[[Any], Hashable]
+Handler = Callable[[Any], Awaitable[None]]
+
+_PUBLISH = TELEMETRY.stage(BUS_PUBLISH)
+
+
+def default_coalesce_key(event: Any) -> Hashable:
+    """Coalesce key for orderbook-style updates: one pending event per venue/symbol."""
+    return (type(event), getattr(event, "venue", None), getattr(event, "symbol", None))
+
+
+@dataclass
+class SubscriberStats:
+    """Point-in-time counters for a queued subscriber.
+
+    `delivered` counts events passed to the handler, including those it
+    raised on (also counted in `errors`, once per event or batch).
+    """
+
+    name: str
+    depth: int
+    max_depth: int
+    enqueued: int
+    delivered: int
+    dropped: int
+    coalesced: int
+    errors: int
+
+    @property
+    def lag(self) -> int:
+        """Events accepted but not yet handled."""
+        return self.enqueued - self.delivered - self.dropped - self.coalesced
+
+
+class Subscription:
+    """A queued subscriber: bounded buffer plus a dedicated consumer task."""
+
+    def __init__(
+        self,
+        event_type: type[Any],
+        handler: Handler,
+        maxsize: int = 10_000,
+        backpressure: Backpressure = "block",
+        key: KeyFunc | None = None,
+        batch: bool = False,
+        max_batch: int = 1024,
+        name: str | None = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.event_type = event_type
+        self.handler = handler
+        self.maxsize = maxsize
+        self.backpressure = backpressure
+        self.key = key or default_coalesce_key
+        self.batch = batch
+        self.max_batch = max_batch
+        self.name: str = name or str(getattr(handler, "__qualname__", repr(handler)))
+
+        self._queue: deque[Any] = deque()
+        self._pending: dict[Hashable, Any] = {}
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task[None] | None = None
+
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Events currently buffered."""
+        return len(self._pending) if self.backpressure == "coalesce" else len(self._queue)
+
+    def stats(self) -> SubscriberStats:
+        """Snapshot the subscriber's counters."""
+        return SubscriberStats(
+            name=self.name,
+            depth=self.depth,
+            max_depth=self.max_depth,
+            enqueued=self.enqueued,
+            delivered=self.delivered,
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+            errors=self.errors,
+        )
+
+    def offer(self, events: list[Any]) -> int:
+        """Enqueue without waiting. Returns how many events were accepted.
+
+        Only the `block` policy can accept fewer than all events; the other
+        policies make room by dropping or coalescing.
+        """
+        if not events:
+            return 0
+        if self.backpressure == "coalesce":
+            accepted = self._offer_coalesce(events)
+        elif self.backpressure == "drop_oldest":
+            accepted = self._offer_drop_oldest(events)
+        else:
+            accepted = min(len(events), self.maxsize - len(self._queue))
+            if accepted > 0:
+                self._queue.extend(events[:accepted] if accepted < len(events) else events)
+        if accepted > 0:
+            self.enqueued += accepted
+            self.max_depth = max(self.max_depth, self.depth)
+            self._idle.clear()
+            self._wakeup.set()
+        return accepted
+
+    def offer_one(self, event: Any) -> bool:
+        """Single-event fast path of `offer`."""
+        if self.backpressure != "block":
+            return self.offer([event]) == 1
+        queue = self._queue
+        if len(queue) >= self.maxsize:
+            return False
+        queue.append(event)
+        self.enqueued += 1
+        if len(queue) > self.max_depth:
+            self.max_depth = len(queue)
+        if self._idle.is_set():
+            self._idle.clear()
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+        return True
+
+    def _offer_drop_oldest(self, events: list[Any]) -> int:
+        accepted = len(events)
+        queue = self._queue
+        overflow = len(queue) + len(events) - self.maxsize
+        if overflow > 0:
+            self.dropped += overflow
+            if overflow >= len(queue):
+                events = events[overflow - len(queue) :]
+                queue.clear()
+            else:
+                for _ in range(overflow):
+                    queue.popleft()
+        queue.extend(events)
+        return accepted
+
+    def _offer_coalesce(self, events: list[Any]) -> int:
+        pending = self._pending
+        key = self.key
+        for event in events:
+            k = key(event)
+            if k in pending:
+                self.coalesced += 1
+            elif len(pending) >= self.maxsize:
+                del pending[next(iter(pending))]
+                self.dropped += 1
+            pending[k] = event
+        return len(events)
+
+    async def put(self, events: list[Any]) -> None:
+        """Enqueue, waiting for space under the `block` policy."""
+        while events:
+            accepted = self.offer(events)
+            events = events[accepted:]
+            if events:
+                self._space.clear()
+                await self._space.wait()
+
+    def _take(self) -> list[Any]:
+        if self.backpressure == "coalesce":
+            pending = self._pending
+            if len(pending) <= self.max_batch:
+                items = list(pending.values())
+                pending.clear()
+            else:
+                items = [pending.pop(k) for k in list(islice(pending, self.max_batch))]
+            return items
+        queue = self._queue
+        n = min(len(queue), self.max_batch)
+        return [queue.popleft() for _ in range(n)]
+
+    def start(self) -> None:
+        """Start the consumer task on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=self.name)
+
+    async def _run(self) -> None:
+        while True:
+            if self.depth == 0:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            items = self._take()
+            self._space.set()
+            if self.batch:
+                await self._handle(items)
+                self.delivered += len(items)
+                continue
+            # One failing event must not cost the rest of the pass
+            for item in items:
+                await self._handle(item)
+                self.delivered += 1
+
+    async def _handle(self, item: Any) -> None:
+        try:
+            await self.handler(item)
+        except Exception as e:
+            self.errors += 1
+            logger.exception("Handler %s failed: %s", self.name, e)
+
+    async def join(self) -> None:
+        """Wait until every accepted event has been handled."""
+        while not (self._idle.is_set() and self.depth == 0):
+            await self._idle.wait()
+
+    async def close(self) -> None:
+        """Stop the consumer task. Buffered events are discarded (counted as dropped)."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.dropped += self.depth
+        self._queue.clear()
+        self._pending.clear()
+        self._idle.set()
+        self._space.set()
 
 
 class EventBus:
-    """In-memory async event bus with type-based routing."""
+    """In-memory async event bus with type-based routing.
 
-    def __init__(self) -> None:
-        self._handlers: dict[type[Event], list[Callable[[Event], Awaitable[None]]]] = {}
-        self._lock = asyncio.Lock()
+    Publishes single events or columnar `EventBatch` objects; subscribe to
+    `EventBatch` to receive batches of any event type.
+
+    `dispatch` sets the default mode for new subscriptions. In queued mode
+    call `drain()` to wait for all subscribers to catch up and `close()` to
+    stop their consumer tasks.
+    """
+
+    def __init__(
+        self,
+        dispatch: Dispatch = "direct",
+        maxsize: int = 10_000,
+        backpressure: Backpressure = "block",
+    ) -> None:
+        self.dispatch = dispatch
+        self.maxsize = maxsize
+        self.backpressure = backpressure
+        self._handlers: dict[type[Any], list[Handler | Subscription]] = {}
+        self._routes: dict[type[Any], tuple[tuple[Handler, ...], tuple[Subscription, ...]]] = {}
+        self._subscriptions: list[Subscription] = []
+        self._unstarted = False
 
     def subscribe(
         self,
         event_type: type[T],
-        handler: Callable[[T], Awaitable[None]],
-    ) -> None:
-        """Register a handler for an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        # Cast needed for contravariance; runtime type is correct
-        self._handlers[event_type].append(handler)  # type: ignore[arg-type]
-
-    async def publish(self, event: Event) -> None:
-        """Publish an event to all subscribers of its type."""
-        event_type = type(event)
-        if event_type not in self._handlers:
-            return
-        for handler in self._handlers[event_type]:
+        handler: Callable[[T], Awaitable[None]] | Callable[[list[T]], Awaitable[None]],
+        *,
+        dispatch: Dispatch | None = None,
+        maxsize: int | None = None,
+        backpressure: Backpressure | None = None,
+        key: KeyFunc | None = None,
+        batch: bool = False,
+        max_batch: int = 1024,
+        name: str | None = None,
+    ) -> Subscription | None:
+        """Register a handler for an event type and its subclasses.
+
+        Queued subscriptions return their `Subscription` handle (for stats);
+        `batch=True` delivers lists of up to `max_batch` events.
+        """
+        mode = dispatch or self.dispatch
+        target: Handler | Subscription
+        if mode == "queued":
+            target = Subscription(
+                event_type,
+                handler,
+                maxsize=maxsize or self.maxsize,
+                backpressure=backpressure or self.backpressure,
+                key=key,
+                batch=batch,
+                max_batch=max_batch,
+                name=name,
+            )
+            self._subscriptions.append(target)
+            self._unstarted = True
+        elif batch:
+            raise ValueError("Batch delivery requires queued dispatch")
+        else:
+            target = handler
+        self._handlers.setdefault(event_type, []).append(target)
+        self._routes.clear()
+        return target if isinstance(target, Subscription) else None
+
+    def _route(self, event_type: type[Any]) -> tuple[tuple[Handler, ...], tuple[Subscription, ...]]:
+        route = self._routes.get(event_type)
+        if route is None:
+            direct: list[Handler] = []
+            queued: list[Subscription] = []
+            for base in event_type.__mro__:
+                for target in self._handlers.get(base, ()):
+                    if isinstance(target, Subscription):
+                        queued.append(target)
+                    else:
+                        direct.append(target)
+            route = (tuple(direct), tuple(queued))
+            self._routes[event_type] = route
+        return route
+
+    def _start(self) -> None:
+        for sub in self._subscriptions:
+            sub.start()
+        self._unstarted = False
+
+    async def publish(self, event: Message) -> None:
+        """Publish an event to all subscribers of its type.
+
+        The `bus_publish` stage times the whole call, direct handlers included.
+        """
+        t0 = _PUBLISH.start()
+        direct, queued = self._route(type(event))
+        if queued:
+            if self._unstarted:
+                self._start()
+            for sub in queued:
+                if not sub.offer_one(event):
+                    await sub.put([event])
+        for handler in direct:
             try:
                 await handler(event)
             except Exception as e:
-                logger.exception("Handler failed for %s: %s", event_type.__name__, e)
+                logger.exception("Handler failed for %s: %s", type(event).__name__, e)
+        _PUBLISH.stop(t0)
 
-    async def publish_many(self, events: list[Event]) -> None:
-        """Publish multiple events in order."""
-        for event in events:
-            await self.publish(event)
+    async def publish_many(self, events: Iterable[Message]) -> None:
+        """Publish multiple events in order.
+
+        Consecutive events of the same type are enqueued as one block, so
+        queued subscribers see the whole run with a single buffer operation.
+        The call is timed as one `bus_publish` sample.
+        """
+        t0 = _PUBLISH.start()
+        if self._unstarted:
+            self._start()
+        for event_type, run in groupby(events, key=type):
+            direct, queued = self._route(event_type)
+            if not direct and not queued:
+                continue
+            block = list(run)
+            for sub in queued:
+                accepted = sub.offer(block)
+                if accepted < len(block):
+                    await sub.put(block[accepted:])
+            if not direct:
+                continue
+            for event in block:
+                for handler in direct:
+                    try:
+                        await handler(event)
+                    except Exception as e:
+                        logger.exception("Handler failed for %s: %s", event_type.__name__, e)
+        _PUBLISH.stop(t0)
+
+    def stats(self) -> list[SubscriberStats]:
+        """Queue depth and lag counters for every queued subscriber."""
+        return [sub.stats() for sub in self._subscriptions]
+
+    async def drain(self) -> None:
+        """Wait until all queued subscribers have handled their buffers."""
+        await asyncio.gather(*(sub.join() for sub in self._subscriptions))
+
+    async def close(self) -> None:
+        """Stop all consumer tasks."""
+        for sub in self._subscriptions:
+            await sub.close()
+        self._unstarted = bool(self._subscriptions)
@@ -1,30 +1,112 @@
 """Simulation clock for reproducible, time-controlled execution.
 
-Supports replay mode (replay historical timestamps) and speed-up
-for faster backtesting. All components use this clock for consistency.
+Time is stored as int64 nanoseconds since the Unix epoch (naive datetimes
+are read as UTC), so moving the clock never allocates a `datetime`. The
+clock runs in one of two modes, switchable at any time:
+
+- `afap`: as fast as possible. `wait_until` jumps straight to the target.
+- `paced`: simulated time is tied to `time.monotonic`, scaled by
+  `speed_multiplier` (10.0 = ten times faster than real time).
+  `wait_until` sleeps until the target's wall-clock deadline and records
+  how late each wake-up was, so `drift()` shows whether the pipeline keeps up.
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Literal
+
+ClockMode = Literal["afap", "paced"]
+
+_EPOCH = datetime(1970, 1, 1)
+_US = timedelta(microseconds=1)
+
+
+def to_ns(when: datetime) -> int:
+    """Nanoseconds since the epoch; naive datetimes are taken as UTC."""
+    if when.tzinfo is not None:
+        when = when.astimezone(UTC).replace(tzinfo=None)
+    return (when - _EPOCH) // _US * 1000
+
+
+def from_ns(ns: int) -> datetime:
+    """Naive UTC datetime for nanoseconds since the epoch (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+@dataclass(frozen=True)
+class ClockDrift:
+    """How far paced wake-ups fell behind their wall-clock deadlines."""
+
+    waits: int
+    late: int
+    mean_lag_ms: float
+    max_lag_ms: float
+    last_lag_ms: float
+
+    def to_dict(self) -> dict[str, float]:
+        """Plain dict for JSON output."""
+        return {
+            "waits": self.waits,
+            "late": self.late,
+            "mean_lag_ms": self.mean_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+            "last_lag_ms": self.last_lag_ms,
+        }
+
 
-from pydantic import BaseModel, Field
+class SimClock:
+    """Simulation clock with `afap` and wall-clock `paced` modes."""
 
+    _waits: int
+    _late: int
+    _lag_total: float
+    _lag_max: float
+    _lag_last: float
 
-class SimClock(BaseModel):
-    """Simulation clock with configurable speed and start time."""
+    def __init__(
+        self,
+        current_time: datetime | None = None,
+        speed_multiplier: float = 1.0,
+        mode: ClockMode = "afap",
+        late_threshold_ms: float = 5.0,
+    ) -> None:
+        self._ns = to_ns(current_time) if current_time is not None else time.time_ns()
+        self.speed_multiplier = speed_multiplier
+        self.mode: ClockMode = mode
+        self.late_threshold_ms = late_threshold_ms
+        self.initial_time: datetime | None = None
+        self._anchor: tuple[int, float] | None = None
+        self.reset_drift()
 
-    current_time: datetime = Field(default_factory=datetime.utcnow)
-    speed_multiplier: float = 1.0  # 1.0 = real-time, 10.0 = 10x faster
-    initial_time: datetime | None = None
+    @property
+    def now_ns(self) -> int:
+        """Current simulation time in nanoseconds since the epoch."""
+        return self._ns
+
+    @property
+    def current_time(self) -> datetime:
+        """Current simulation time as a naive UTC datetime."""
+        return from_ns(self._ns)
+
+    @current_time.setter
+    def current_time(self, when: datetime) -> None:
+        self._ns = to_ns(when)
+
+    def set_ns(self, ns: int) -> None:
+        """Move the clock to `ns` without pacing."""
+        self._ns = ns
 
     def start(self, start_time: datetime | None = None) -> None:
         """Start the clock. Optionally set initial time for replay."""
-        self.initial_time = start_time or datetime.utcnow()
-        self.current_time = self.initial_time
+        self._ns = to_ns(start_time) if start_time is not None else time.time_ns()
+        self.initial_time = from_ns(self._ns)
+        self._anchor = None
 
     def advance(self, delta: timedelta) -> datetime:
         """Advance clock by delta (scaled by speed_multiplier)."""
-        scaled = timedelta(seconds=delta.total_seconds() * self.speed_multiplier)
-        self.current_time = self.current_time + scaled
+        self._ns += round(delta / _US * self.speed_multiplier) * 1000
         return self.current_time
 
     def advance_seconds(self, seconds: float) -> datetime:
@@ -33,4 +115,65 @@ class SimClock(BaseModel):
 
     def now(self) -> datetime:
         """Return current simulation time."""
-        return self.current_time
+        return from_ns(self._ns)
+
+    def set_mode(self, mode: ClockMode, speed_multiplier: float | None = None) -> None:
+        """Switch mode (and optionally speed) mid-run.
+
+        Pacing restarts from the current simulated time, so the switch
+        causes no jump or catch-up burst.
+        """
+        self.mode = mode
+        if speed_multiplier is not None:
+            self.speed_multiplier = speed_multiplier
+        self._anchor = None
+
+    async def wait_until(self, ns: int) -> None:
+        """Move to simulated time `ns`, sleeping first in `paced` mode.
+
+        The first paced wait anchors simulated time to the wall clock. A
+        target in the past only sets the clock.
+        """
+        if self.mode == "paced" and ns >= self._ns:
+            if self._anchor is None:
+                self._anchor = (self._ns, time.monotonic())
+            anchor_ns, anchor_wall = self._anchor
+            speed = self.speed_multiplier or 1.0
+            deadline = anchor_wall + (ns - anchor_ns) / 1e9 / speed
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._record_lag((time.monotonic() - deadline) * 1000)
+        self._ns = ns
+
+    def _record_lag(self, lag_ms: float) -> None:
+        lag_ms = max(lag_ms, 0.0)
+        self._waits += 1
+        self._lag_total += lag_ms
+        self._lag_max = max(self._lag_max, lag_ms)
+        self._lag_last = lag_ms
+        if lag_ms > self.late_threshold_ms:
+            self._late += 1
+
+    def reset_drift(self) -> None:
+        """Clear the drift statistics."""
+        self._waits = 0
+        self._late = 0
+        self._lag_total = 0.0
+        self._lag_max = 0.0
+        self._lag_last = 0.0
+
+    def drift(self) -> ClockDrift:
+        """Lag of paced wake-ups behind their deadlines since the last reset.
+
+        A wake-up counts as `late` when it lags by more than
+        `late_threshold_ms`. A steadily growing `last_lag_ms` means the
+        pipeline cannot keep up at the current speed.
+        """
+        return ClockDrift(
+            waits=self._waits,
+            late=self._late,
+            mean_lag_ms=self._lag_total / self._waits if self._waits else 0.0,
+            max_lag_ms=self._lag_max,
+            last_lag_ms=self._lag_last,
+        )
@@ -5,7 +5,6 @@ between data, strategy, risk, and execution layers.
 """
 
 from datetime import datetime
-from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -30,6 +29,13 @@ class TradeEvent(Event):
     side: str  # "buy" | "sell"
 
 
+class BookDepth(BaseModel):
+    """L2 levels as (price, size) pairs, best level first."""
+
+    bids: list[tuple[float, float]] = Field(default_factory=list)
+    asks: list[tuple[float, float]] = Field(default_factory=list)
+
+
 class OrderbookEvent(Event):
     """Orderbook snapshot from a venue."""
 
@@ -39,7 +45,7 @@ class OrderbookEvent(Event):
     ask_price: float
     bid_size: float
     ask_size: float
-    depth: dict[str, Any] | None = None  # Optional full depth
+    depth: BookDepth | None = None  # Optional full depth
 
 
 class SignalEvent(Event):
@@ -80,3 +86,4 @@ class FillEvent(Event):
     price: float
     size: float
     fee: float = 0.0
+    remaining_size: float = 0.0  # Unfilled size when liquidity ran out
@@ -0,0 +1,192 @@
+"""Position and exposure ledger updated incrementally from fills.
+
+Positions are keyed by (venue, symbol) and carry average cost, realized
+P&L (fees included) and the latest mark. Every aggregate risk needs is
+maintained as a running total, adjusted by the change of the one position a
+fill or mark touches:
+
+- realized and unrealized P&L,
+- gross exposure (sum of |quantity| x mark over all positions),
+- net exposure (per symbol, |quantity summed over venues| x last price),
+- per-venue gross exposure.
+
+Reading any of them is O(1), so risk checks can run on every signal. P&L is
+also tracked per UTC day: the first fill or mark with a timestamp on a new
+day rolls `daily_pnl` over to zero.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from ai_arb_lab.core.clock import to_ns
+from ai_arb_lab.core.events import FillEvent
+
+_NS_PER_DAY = 24 * 3600 * 10**9
+
+# Quantities smaller than this are treated as flat
+_EPS = 1e-12
+
+
+@dataclass(slots=True)
+class Position:
+    """Inventory of one symbol on one venue."""
+
+    venue: str
+    symbol: str
+    quantity: float = 0.0
+    avg_cost: float = 0.0
+    realized_pnl: float = 0.0
+    mark_price: float = 0.0
+
+    @property
+    def unrealized_pnl(self) -> float:
+        """Mark-to-market P&L of the open quantity."""
+        return self.quantity * (self.mark_price - self.avg_cost)
+
+    @property
+    def exposure(self) -> float:
+        """Absolute marked value of the open quantity."""
+        return abs(self.quantity) * self.mark_price
+
+
+class PositionLedger:
+    """Positions per (venue, symbol) with O(1) running risk aggregates."""
+
+    def __init__(self) -> None:
+        self._positions: dict[tuple[str, str], Position] = {}
+        self._net_qty: dict[str, float] = {}
+        self._last_price: dict[str, float] = {}
+        self._venue_exposure: dict[str, float] = {}
+        self.realized_pnl = 0.0
+        self.unrealized_pnl = 0.0
+        self.gross_exposure = 0.0
+        self.net_exposure = 0.0
+        self.fills = 0
+        self._day: int | None = None
+        self._day_start_pnl = 0.0
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(self._positions.values())
+
+    def position(self, venue: str, symbol: str) -> Position | None:
+        """Position on `venue` in `symbol`, if any fill has touched it."""
+        return self._positions.get((venue, symbol))
+
+    def quantity(self, venue: str, symbol: str) -> float:
+        """Signed quantity held on `venue` (0.0 if none)."""
+        position = self._positions.get((venue, symbol))
+        return position.quantity if position is not None else 0.0
+
+    def net_quantity(self, symbol: str) -> float:
+        """Signed quantity of `symbol` summed over venues."""
+        return self._net_qty.get(symbol, 0.0)
+
+    def venue_exposure(self, venue: str) -> float:
+        """Gross marked exposure held on `venue`."""
+        return self._venue_exposure.get(venue, 0.0)
+
+    def inventory(self, venue: str) -> dict[str, float]:
+        """Signed quantity per symbol held on `venue`."""
+        return {p.symbol: p.quantity for p in self._positions.values() if p.venue == venue}
+
+    @property
+    def total_pnl(self) -> float:
+        """Realized plus unrealized P&L since the ledger was created."""
+        return self.realized_pnl + self.unrealized_pnl
+
+    @property
+    def daily_pnl(self) -> float:
+        """P&L since the start of the current UTC day."""
+        return self.realized_pnl + self.unrealized_pnl - self._day_start_pnl
+
+    def roll_day(self, ts_ns: int) -> None:
+        """Start a new day at `ts_ns` if it falls on a later UTC day."""
+        day = ts_ns // _NS_PER_DAY
+        if self._day is None or day > self._day:
+            self._day = day
+            self._day_start_pnl = self.realized_pnl + self.unrealized_pnl
+
+    def _revalue(self, position: Position, quantity: float, avg_cost: float, mark: float) -> None:
+        """Replace a position's state and adjust every running total by the change."""
+        old_qty = position.quantity
+        old_unrealized = position.unrealized_pnl
+        old_exposure = position.exposure
+        position.quantity = quantity
+        position.avg_cost = avg_cost
+        position.mark_price = mark
+        exposure_delta = position.exposure - old_exposure
+        self.unrealized_pnl += position.unrealized_pnl - old_unrealized
+        self.gross_exposure += exposure_delta
+        venue = position.venue
+        self._venue_exposure[venue] = self._venue_exposure.get(venue, 0.0) + exposure_delta
+        self._set_net(position.symbol, quantity - old_qty, mark)
+
+    def _set_net(self, symbol: str, qty_delta: float, price: float) -> None:
+        old_qty = self._net_qty.get(symbol, 0.0)
+        old_price = self._last_price.get(symbol, 0.0)
+        new_qty = old_qty + qty_delta
+        self._net_qty[symbol] = new_qty
+        self._last_price[symbol] = price
+        self.net_exposure += abs(new_qty) * price - abs(old_qty) * old_price
+
+    def apply(
+        self,
+        venue: str,
+        symbol: str,
+        side: str,
+        price: float,
+        size: float,
+        fee: float = 0.0,
+        ts_ns: int | None = None,
+    ) -> Position:
+        """Book a fill of `size` at `price`; `side` is "buy" or "sell"."""
+        if ts_ns is not None:
+            self.roll_day(ts_ns)
+        key = (venue, symbol)
+        position = self._positions.get(key)
+        if position is None:
+            position = self._positions[key] = Position(venue, symbol)
+        qty = position.quantity
+        avg = position.avg_cost
+        trade = size if side == "buy" else -size
+        new_qty = qty + trade
+        realized = -fee
+        if qty == 0.0 or (qty > 0) == (trade > 0):
+            avg = (avg * abs(qty) + price * size) / abs(new_qty) if abs(new_qty) > _EPS else 0.0
+        else:
+            closed = min(abs(qty), size)
+            realized += closed * (price - avg) if qty > 0 else closed * (avg - price)
+            if abs(new_qty) <= _EPS:
+                new_qty, avg = 0.0, 0.0
+            elif (new_qty > 0) != (qty > 0):
+                avg = price
+        position.realized_pnl += realized
+        self.realized_pnl += realized
+        self.fills += 1
+        self._revalue(position, new_qty, avg, price)
+        return position
+
+    def on_fill(self, fill: FillEvent) -> Position:
+        """Book a `FillEvent`."""
+        return self.apply(
+            fill.venue,
+            fill.symbol,
+            fill.side,
+            fill.price,
+            fill.size,
+            fill.fee,
+            to_ns(fill.timestamp),
+        )
+
+    def mark(self, venue: str, symbol: str, price: float, ts_ns: int | None = None) -> None:
+        """Revalue the position on `venue` (and the symbol's net exposure) at `price`."""
+        if ts_ns is not None:
+            self.roll_day(ts_ns)
+        position = self._positions.get((venue, symbol))
+        if position is not None:
+            self._revalue(position, position.quantity, position.avg_cost, price)
+        else:
+            self._set_net(symbol, 0.0, price)
@@ -0,0 +1,155 @@
+"""Discrete-event scheduler driving a `SimClock`.
+
+Callbacks are kept in a binary heap ordered by (time, insertion order), so
+scheduling and popping cost O(log n) and callbacks due at the same instant
+run in the order they were scheduled. The clock jumps straight to each
+event's time: no time passes between events, however far apart they are.
+Cancelled events stay in the heap and are skipped when they surface.
+
+Times are kept as int64 nanoseconds, like the clock. `run` always jumps
+(as fast as possible); `run_async` waits on the clock before each event, so
+a `paced` clock replays the schedule in scaled wall-clock time.
+"""
+
+import heapq
+import itertools
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from ai_arb_lab.core.clock import SimClock, from_ns, to_ns
+
+_US = timedelta(microseconds=1)
+
+
+class ScheduledEvent:
+    """Handle for a scheduled callback."""
+
+    __slots__ = ("when_ns", "callback", "args", "cancelled")
+
+    def __init__(self, when_ns: int, callback: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        self.when_ns = when_ns
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    @property
+    def when(self) -> datetime:
+        """Scheduled time."""
+        return from_ns(self.when_ns)
+
+    def cancel(self) -> None:
+        """Prevent the callback from running."""
+        self.cancelled = True
+
+
+class EventScheduler:
+    """Priority queue of timestamped callbacks around a simulation clock."""
+
+    def __init__(self, clock: SimClock | None = None) -> None:
+        self.clock = clock or SimClock()
+        self._heap: list[tuple[int, int, ScheduledEvent]] = []
+        self._seq = itertools.count()
+        self.processed = 0
+
+    def __len__(self) -> int:
+        """Pending entries, including cancelled ones not yet discarded."""
+        return len(self._heap)
+
+    def now(self) -> datetime:
+        """Current simulation time."""
+        return self.clock.now()
+
+    def schedule_at_ns(
+        self, when_ns: int, callback: Callable[..., Any], *args: Any
+    ) -> ScheduledEvent:
+        """Run `callback(*args)` at `when_ns`, which must not be in the past."""
+        now_ns = self.clock.now_ns
+        if when_ns < now_ns:
+            raise ValueError(
+                f"Cannot schedule at {from_ns(when_ns)}, before now ({from_ns(now_ns)})"
+            )
+        event = ScheduledEvent(when_ns, callback, args)
+        heapq.heappush(self._heap, (when_ns, next(self._seq), event))
+        return event
+
+    def schedule_at(
+        self, when: datetime, callback: Callable[..., Any], *args: Any
+    ) -> ScheduledEvent:
+        """Run `callback(*args)` at `when`, which must not be in the past."""
+        return self.schedule_at_ns(to_ns(when), callback, *args)
+
+    def schedule_in(
+        self, delay: timedelta, callback: Callable[..., Any], *args: Any
+    ) -> ScheduledEvent:
+        """Run `callback(*args)` after `delay` of simulation time."""
+        return self.schedule_at_ns(self.clock.now_ns + delay // _US * 1000, callback, *args)
+
+    def _discard_cancelled(self) -> None:
+        heap = self._heap
+        while heap and heap[0][2].cancelled:
+            heapq.heappop(heap)
+
+    def next_time(self) -> datetime | None:
+        """Time of the next pending event."""
+        self._discard_cancelled()
+        return from_ns(self._heap[0][0]) if self._heap else None
+
+    def _pop(self) -> ScheduledEvent | None:
+        self._discard_cancelled()
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
+
+    def _run(self, event: ScheduledEvent) -> None:
+        event.callback(*event.args)
+        self.processed += 1
+
+    def step(self) -> bool:
+        """Advance the clock to the next event and run it. False if none left."""
+        event = self._pop()
+        if event is None:
+            return False
+        self.clock.set_ns(event.when_ns)
+        self._run(event)
+        return True
+
+    def run_until(self, end: datetime) -> int:
+        """Run every event due at or before `end`, then move the clock to `end`.
+
+        Returns the number of events run.
+        """
+        end_ns = to_ns(end)
+        count = 0
+        while True:
+            self._discard_cancelled()
+            if not self._heap or self._heap[0][0] > end_ns:
+                break
+            self.step()
+            count += 1
+        if end_ns > self.clock.now_ns:
+            self.clock.set_ns(end_ns)
+        return count
+
+    def run(self, max_events: int | None = None) -> int:
+        """Run events until the queue is empty (or `max_events` have run)."""
+        count = 0
+        while (max_events is None or count < max_events) and self.step():
+            count += 1
+        return count
+
+    async def run_async(self, max_events: int | None = None) -> int:
+        """Like `run`, but wait on the clock before each event.
+
+        With a `paced` clock events fire at their scaled wall-clock times;
+        the clock's mode can be switched while this runs.
+        """
+        count = 0
+        while max_events is None or count < max_events:
+            event = self._pop()
+            if event is None:
+                break
+            await self.clock.wait_until(event.when_ns)
+            self._run(event)
+            count += 1
+        return count
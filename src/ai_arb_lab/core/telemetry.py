@@ -0,0 +1,338 @@
+"""Pipeline telemetry: per-stage latency histograms and event counters.
+
+Hot paths (bus publish, strategy evaluation, risk checks, fill simulation,
+data loading) are bracketed by a `Stage`:
+
+    t0 = STAGE.start()
+    ...
+    STAGE.stop(t0)
+
+`start` returns 0 while telemetry is disabled (the default) and `stop`
+ignores 0, so an uninstrumented run pays one attribute check per stage.
+Enabled, a sample costs two `perf_counter_ns` calls and one bucket
+increment.
+
+`LatencyHistogram` uses HDR-style log-linear buckets: values below 64 ns
+are exact, and every power of two above is split into 32 sub-buckets, so
+quantiles are within ~3% of the true value at any scale with a fixed
+~1,200-slot table. The process-wide `TELEMETRY` registry renders as JSON
+(`to_dict`) or Prometheus text (`render_prometheus`), and
+`MetricsServer` serves the latter at `/metrics` from a background thread.
+"""
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Sub-buckets per power of two: 2**5 = 32, i.e. ~3% relative precision
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS
+# Values are clamped to 2**40 ns (~18 minutes)
+_MAX_BITS = 40
+_BUCKETS = (_MAX_BITS - _SUB_BITS) * _SUB_COUNT + 2 * _SUB_COUNT
+_MAX_VALUE = (1 << _MAX_BITS) - 1
+_NO_MIN = _MAX_VALUE + 1
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# Stages instrumented across the pipeline
+BUS_PUBLISH = "bus_publish"
+STRATEGY_EVALUATE = "strategy_evaluate"
+RISK_CHECK = "risk_check"
+FILL_SIMULATION = "fill_simulation"
+DATA_LOAD = "data_load"
+
+
+def _bucket_upper(index: int) -> int:
+    """Largest value that lands in bucket `index`."""
+    if index < 2 * _SUB_COUNT:
+        return index
+    shift, top = divmod(index, _SUB_COUNT)
+    top += _SUB_COUNT
+    shift -= 1
+    return ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear histogram of nanosecond durations with O(1) recording."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.min = _NO_MIN
+        self.max = 0
+
+    def record(self, value_ns: int) -> None:
+        """Add one duration in nanoseconds (negative values count as 0)."""
+        # Values below 64 index directly; above, the top 6 bits pick the bucket
+        if value_ns < 2 * _SUB_COUNT:
+            if value_ns < 0:
+                value_ns = 0
+            index = value_ns
+        else:
+            if value_ns > _MAX_VALUE:
+                value_ns = _MAX_VALUE
+            shift = value_ns.bit_length() - _SUB_BITS - 1
+            index = shift * _SUB_COUNT + (value_ns >> shift)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value_ns
+        if value_ns > self.max:
+            self.max = value_ns
+        if value_ns < self.min:
+            self.min = value_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add every sample of `other` to this histogram."""
+        if other.count == 0:
+            return
+        counts = self.counts
+        for i, n in enumerate(other.counts):
+            if n:
+                counts[i] += n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self.counts = [0] * _BUCKETS
+        self.count = self.total = self.max = 0
+        self.min = _NO_MIN
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in nanoseconds (0.0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> int:
+        """Duration at quantile `q` in nanoseconds (0 when empty).
+
+        Returns the upper bound of the bucket holding the q-th sample,
+        capped at the largest value recorded.
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, min(self.count, int(q * self.count + 0.5)))
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return max(self.min, min(_bucket_upper(i), self.max))
+        return self.max
+
+    def quantiles(self, qs: tuple[float, ...] = QUANTILES) -> dict[float, int]:
+        """Several quantiles from a single pass over the buckets."""
+        result = dict.fromkeys(qs, 0)
+        if self.count == 0:
+            return result
+        ranks = sorted((max(1, min(self.count, int(q * self.count + 0.5))), q) for q in qs)
+        seen = 0
+        k = 0
+        for i, n in enumerate(self.counts):
+            if not n:
+                continue
+            seen += n
+            while k < len(ranks) and seen >= ranks[k][0]:
+                result[ranks[k][1]] = max(self.min, min(_bucket_upper(i), self.max))
+                k += 1
+            if k == len(ranks):
+                break
+        return result
+
+
+class Stage:
+    """A named pipeline stage timed into a `LatencyHistogram`."""
+
+    __slots__ = ("name", "histogram", "_telemetry")
+
+    def __init__(self, name: str, telemetry: "Telemetry") -> None:
+        self.name = name
+        self.histogram = LatencyHistogram()
+        self._telemetry = telemetry
+
+    def start(self) -> int:
+        """Timestamp to pass to `stop`, or 0 while telemetry is disabled."""
+        return time.perf_counter_ns() if self._telemetry.enabled else 0
+
+    def stop(self, t0: int) -> None:
+        """Record the time since `start` (no-op if `t0` is 0)."""
+        if t0:
+            self.histogram.record(time.perf_counter_ns() - t0)
+
+    def record(self, value_ns: int) -> None:
+        """Record a duration measured elsewhere, if telemetry is enabled."""
+        if self._telemetry.enabled:
+            self.histogram.record(value_ns)
+
+
+class Telemetry:
+    """Registry of stages and counters with JSON and Prometheus output.
+
+    Rates (`events_per_second` and per-stage `per_second`) are counts
+    divided by the wall time since the registry was last reset.
+    """
+
+    def __init__(self, enabled: bool = False, namespace: str = "ai_arb_lab") -> None:
+        self.enabled = enabled
+        self.namespace = namespace
+        self.stages: dict[str, Stage] = {}
+        self.counters: dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    def stage(self, name: str) -> Stage:
+        """The stage called `name`, created on first use."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = Stage(name, self)
+        return stage
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add `n` to counter `name`, if telemetry is enabled."""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def enable(self, reset: bool = True) -> None:
+        """Start collecting, by default from a clean slate."""
+        if reset:
+            self.reset()
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop collecting; recorded data is kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clear every histogram and counter and restart the rate clock."""
+        for stage in self.stages.values():
+            stage.histogram.reset()
+        self.counters.clear()
+        self._started = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the last reset."""
+        return time.perf_counter() - self._started
+
+    def to_dict(self) -> dict[str, Any]:
+        """Counters, rates and per-stage latency (microseconds) as plain data."""
+        elapsed = self.elapsed
+        stages: dict[str, Any] = {}
+        for name, stage in sorted(self.stages.items()):
+            hist = stage.histogram
+            if hist.count == 0:
+                continue
+            qs = hist.quantiles()
+            stages[name] = {
+                "count": hist.count,
+                "per_second": hist.count / elapsed if elapsed > 0 else 0.0,
+                "mean_us": hist.mean / 1e3,
+                "min_us": hist.min / 1e3,
+                "p50_us": qs[0.5] / 1e3,
+                "p90_us": qs[0.9] / 1e3,
+                "p99_us": qs[0.99] / 1e3,
+                "p999_us": qs[0.999] / 1e3,
+                "max_us": hist.max / 1e3,
+            }
+        events = self.counters.get("events", 0)
+        return {
+            "elapsed_s": elapsed,
+            "events_per_second": events / elapsed if elapsed > 0 else 0.0,
+            "counters": dict(sorted(self.counters.items())),
+            "stages": stages,
+        }
+
+    def render_prometheus(self) -> str:
+        """Prometheus text exposition: stage summaries, counters and event rate."""
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_stage_latency_seconds Pipeline stage latency.",
+            f"# TYPE {ns}_stage_latency_seconds summary",
+        ]
+        for name, stage in sorted(self.stages.items()):
+            hist = stage.histogram
+            for q, value in hist.quantiles().items():
+                lines.append(
+                    f'{ns}_stage_latency_seconds{{stage="{name}",quantile="{q:g}"}} '
+                    f"{value / 1e9:.9g}"
+                )
+            lines.append(f'{ns}_stage_latency_seconds_sum{{stage="{name}"}} {hist.total / 1e9:.9g}')
+            lines.append(f'{ns}_stage_latency_seconds_count{{stage="{name}"}} {hist.count}')
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"# TYPE {ns}_{name}_total counter")
+            lines.append(f"{ns}_{name}_total {value}")
+        elapsed = self.elapsed
+        events = self.counters.get("events", 0)
+        lines.append(f"# HELP {ns}_events_per_second Events processed per second since reset.")
+        lines.append(f"# TYPE {ns}_events_per_second gauge")
+        lines.append(f"{ns}_events_per_second {events / elapsed if elapsed > 0 else 0.0:.6g}")
+        return "\n".join(lines) + "\n"
+
+
+TELEMETRY = Telemetry()
+
+
+class MetricsServer:
+    """Serve a registry's Prometheus text at `/metrics` from a daemon thread.
+
+    Binds to `host` (localhost by default); port 0 picks a free port, see
+    `port`. Use as a context manager or call `start`/`stop`.
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1", telemetry: Telemetry = TELEMETRY):
+        registry = telemetry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 (http.server API)
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug("metrics: " + format, *args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        """Port the server is bound to."""
+        return int(self._server.server_address[1])
+
+    def start(self) -> "MetricsServer":
+        """Start serving in the background."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        logger.info("Serving metrics on port %d", self.port)
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down and release the port."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "MetricsServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -1,9 +1,12 @@
 """Data layer: loaders, synthetic generator, feature store."""
 
+from ai_arb_lab.data.features import Feature, FeatureStore
 from ai_arb_lab.data.loader import load_orderbook_csv, load_trades_csv
 from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
 
 __all__ = [
+    "Feature",
+    "FeatureStore",
     "SyntheticMarketGenerator",
     "load_trades_csv",
     "load_orderbook_csv",
@@ -0,0 +1,190 @@
+"""Partitioned Parquet dataset layout for trades and orderbook snapshots.
+
+Layout (hive-style partitions, one directory tree per data kind)::
+
+    <root>/orderbook/symbol=BTC-USD/date=2025-01-01/venue=venue_0/part-0-0.parquet
+    <root>/trades/symbol=BTC-USD/date=2025-01-01/venue=venue_1/part-0-0.parquet
+
+Files are sorted by timestamp and written with fixed Arrow schemas (plus
+float columns for any extra orderbook depth levels), so a
+time/venue/symbol filter prunes whole partitions by path and skips row
+groups by their timestamp statistics. Files are memory-mapped on read.
+"""
+
+import logging
+import shutil
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from ai_arb_lab.core.book import depth_columns
+
+logger = logging.getLogger(__name__)
+
+DataKind = Literal["trades", "orderbook"]
+
+PARTITION_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.string()),
+        ("date", pa.string()),
+        ("venue", pa.string()),
+    ]
+)
+
+SCHEMAS: dict[str, pa.Schema] = {
+    "trades": pa.schema(
+        [
+            ("timestamp", pa.timestamp("ns")),
+            ("venue", pa.string()),
+            ("symbol", pa.string()),
+            ("price", pa.float64()),
+            ("size", pa.float64()),
+            ("side", pa.dictionary(pa.int8(), pa.string())),
+        ]
+    ),
+    "orderbook": pa.schema(
+        [
+            ("timestamp", pa.timestamp("ns")),
+            ("venue", pa.string()),
+            ("symbol", pa.string()),
+            ("bid_price", pa.float64()),
+            ("ask_price", pa.float64()),
+            ("bid_size", pa.float64()),
+            ("ask_size", pa.float64()),
+        ]
+    ),
+}
+
+ROW_GROUP_SIZE = 65_536
+
+
+def _schema(kind: DataKind, columns: Sequence[str]) -> pa.Schema:
+    """Fixed schema for `kind`, extended with any L2 depth-level columns present."""
+    schema = SCHEMAS[kind]
+    if kind != "orderbook":
+        return schema
+    present = set(columns)
+    levels = 1
+    while f"bid_price_{levels}" in present:
+        levels += 1
+    for name in depth_columns(levels):
+        schema = schema.append(pa.field(name, pa.float64()))
+    return schema
+
+
+def _partitioning() -> ds.Partitioning:
+    return ds.partitioning(PARTITION_SCHEMA, flavor="hive")
+
+
+def is_dataset_dir(path: Path | str) -> bool:
+    """True if `path` looks like a partitioned dataset directory."""
+    path = Path(path)
+    return path.is_dir() and any(path.glob("symbol=*"))
+
+
+def clear_dataset(root: Path | str, kind: DataKind) -> None:
+    """Remove an existing dataset tree before rewriting it."""
+    path = Path(root) / kind
+    if path.exists():
+        shutil.rmtree(path)
+
+
+def write_dataset(
+    frame: pd.DataFrame,
+    root: Path | str,
+    kind: DataKind,
+    part: int = 0,
+) -> Path:
+    """Append a frame to the partitioned dataset for `kind`.
+
+    `part` distinguishes file names so successive chunks of one dataset can
+    be written without overwriting each other.
+    """
+    schema = _schema(kind, frame.columns)
+    table = pa.Table.from_pandas(frame[schema.names], schema=schema, preserve_index=False)
+    table = table.sort_by("timestamp")
+    table = table.append_column("date", pc.strftime(table["timestamp"], format="%Y-%m-%d"))
+    out = Path(root) / kind
+    ds.write_dataset(
+        table,
+        out,
+        format="parquet",
+        partitioning=_partitioning(),
+        basename_template=f"part-{part}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=ROW_GROUP_SIZE,
+        min_rows_per_group=min(ROW_GROUP_SIZE, max(1, len(table))),
+    )
+    return out
+
+
+def _ts_scalar(ts: pd.Timestamp) -> pa.Scalar:
+    return pa.scalar(ts.as_unit("ns").value, pa.timestamp("ns"))
+
+
+def _filter_expression(
+    start: datetime | None,
+    end: datetime | None,
+    venues: Sequence[str] | None,
+    symbols: Sequence[str] | None,
+) -> ds.Expression | None:
+    conditions: list[ds.Expression] = []
+    if start is not None:
+        ts = pd.Timestamp(start)
+        conditions.append(ds.field("date") >= ts.strftime("%Y-%m-%d"))
+        conditions.append(ds.field("timestamp") >= _ts_scalar(ts))
+    if end is not None:
+        ts = pd.Timestamp(end)
+        conditions.append(ds.field("date") <= ts.strftime("%Y-%m-%d"))
+        conditions.append(ds.field("timestamp") < _ts_scalar(ts))
+    if venues is not None:
+        conditions.append(ds.field("venue").isin(list(venues)))
+    if symbols is not None:
+        conditions.append(ds.field("symbol").isin(list(symbols)))
+    if not conditions:
+        return None
+    expr = conditions[0]
+    for cond in conditions[1:]:
+        expr = expr & cond
+    return expr
+
+
+def load_dataset(
+    path: Path | str,
+    kind: DataKind,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    venues: Sequence[str] | None = None,
+    symbols: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Load a partitioned dataset, reading only what the filters select.
+
+    `path` is the dataset directory (e.g. `data/sample/orderbook`). `start`
+    is inclusive and `end` exclusive. Venue and symbol filters and the date
+    part of the time range prune partitions by path; the timestamp filter
+    uses row-group statistics.
+    """
+    dataset = ds.dataset(
+        str(path),
+        format="parquet",
+        partitioning=_partitioning(),
+        filesystem=fs.LocalFileSystem(use_mmap=True),
+    )
+    schema = _schema(kind, dataset.schema.names)
+    table = dataset.to_table(
+        columns=schema.names,
+        filter=_filter_expression(start, end, venues, symbols),
+    )
+    table = table.sort_by("timestamp")
+    df = table.to_pandas()
+    if "side" in df.columns:
+        df["side"] = df["side"].astype(str)
+    logger.debug("Loaded %d %s rows from %s", len(df), kind, path)
+    return df
@@ -0,0 +1,537 @@
+"""Feature store: order-flow and technical indicators per venue and symbol.
+
+Indicators are registered once with a `FeatureStore` and kept per
+(venue, symbol). `update` advances them by one event in O(1): recursive
+indicators (EMA, RSI, MACD) carry only their last state, and windowed ones
+(realized volatility, trade-flow imbalance) keep a fixed-size ring of
+running sums. Strategies read the latest values by name with `get` (or
+`BaseStrategy.feature`) instead of recomputing them.
+
+`backfill` computes the same indicators over a historical frame with
+vectorized NumPy/pandas operations and gives bit-identical values: each
+indicator uses the same arithmetic in both paths (running sums come from a
+left-fold `cumsum`, EMAs replicate pandas' `ewm(adjust=False)` recursion).
+`materialize` caches a backfill as Parquet under a fingerprint of the
+input data and the registered indicators, so repeat runs load it.
+
+| Feature | Source | Default name |
+|---------|--------|--------------|
+| `Mid` | orderbook | `mid` |
+| `Microprice` | orderbook | `microprice` |
+| `BookImbalance` | orderbook | `book_imbalance` |
+| `EMA` | orderbook (mid) | `ema_{span}` |
+| `RSI` | orderbook (mid) | `rsi_{period}` |
+| `MACD` | orderbook (mid) | `macd_{fast}_{slow}_{signal}` |
+| `RealizedVol` | orderbook (mid) | `rv_{window}` |
+| `TradeFlowImbalance` | trades | `tfi_{window}` |
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ai_arb_lab.core.events import Event, OrderbookEvent, TradeEvent
+
+logger = logging.getLogger(__name__)
+
+FeatureSource = Literal["orderbook", "trades"]
+MacdOutput = Literal["line", "signal", "histogram"]
+
+FloatArray = npt.NDArray[np.float64]
+Columns = Mapping[str, npt.NDArray[Any]]
+
+_BOOK = ("bid_price", "ask_price")
+_BOOK_SIZES = ("bid_price", "ask_price", "bid_size", "ask_size")
+
+
+class Feature(ABC):
+    """An indicator with an incremental `update` and a vectorized `batch`.
+
+    An instance holds the state of one (venue, symbol) stream; the store
+    copies a registered prototype per stream with `fresh`.
+    """
+
+    source: FeatureSource = "orderbook"
+    # Columns `batch` reads
+    inputs: tuple[str, ...] = _BOOK
+
+    def __init__(self, name: str, **params: Any) -> None:
+        self.name = name
+        self.params = params
+        self.reset()
+
+    @abstractmethod
+    def update(self, event: Any) -> float:
+        """Advance by one event and return the new value."""
+
+    @abstractmethod
+    def batch(self, columns: Columns) -> FloatArray:
+        """Values for every row of one stream's `inputs`, as `update` would give."""
+
+    def reset(self) -> None:  # noqa: B027 (optional hook)
+        """Clear state. Override in stateful features."""
+
+    def fresh(self) -> "Feature":
+        """A copy with the same parameters and empty state."""
+        clone = copy.copy(self)
+        clone.reset()
+        return clone
+
+    @property
+    def spec(self) -> str:
+        """Class, name and parameters; part of the materialize fingerprint."""
+        return f"{type(self).__name__}:{self.name}:{json.dumps(self.params, sort_keys=True)}"
+
+
+class Mid(Feature):
+    """Mid price `(bid + ask) / 2`."""
+
+    def __init__(self, name: str = "mid") -> None:
+        super().__init__(name)
+
+    def update(self, event: OrderbookEvent) -> float:
+        return (event.bid_price + event.ask_price) / 2
+
+    def batch(self, columns: Columns) -> FloatArray:
+        return np.asarray((columns["bid_price"] + columns["ask_price"]) / 2, dtype=np.float64)
+
+
+class Microprice(Feature):
+    """Size-weighted mid: `(bid * ask_size + ask * bid_size) / (bid_size + ask_size)`.
+
+    Falls back to the mid price when both sizes are zero.
+    """
+
+    inputs = _BOOK_SIZES
+
+    def __init__(self, name: str = "microprice") -> None:
+        super().__init__(name)
+
+    def update(self, event: OrderbookEvent) -> float:
+        total = event.bid_size + event.ask_size
+        if total <= 0:
+            return (event.bid_price + event.ask_price) / 2
+        return (event.bid_price * event.ask_size + event.ask_price * event.bid_size) / total
+
+    def batch(self, columns: Columns) -> FloatArray:
+        bid, ask = columns["bid_price"], columns["ask_price"]
+        bid_size, ask_size = columns["bid_size"], columns["ask_size"]
+        total = bid_size + ask_size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            micro = (bid * ask_size + ask * bid_size) / total
+        return np.where(total > 0, micro, (bid + ask) / 2).astype(np.float64)
+
+
+class BookImbalance(Feature):
+    """Top-of-book imbalance `(bid_size - ask_size) / (bid_size + ask_size)` in [-1, 1]."""
+
+    inputs = _BOOK_SIZES
+
+    def __init__(self, name: str = "book_imbalance") -> None:
+        super().__init__(name)
+
+    def update(self, event: OrderbookEvent) -> float:
+        total = event.bid_size + event.ask_size
+        return (event.bid_size - event.ask_size) / total if total > 0 else 0.0
+
+    def batch(self, columns: Columns) -> FloatArray:
+        bid_size, ask_size = columns["bid_size"], columns["ask_size"]
+        total = bid_size + ask_size
+        with np.errstate(divide="ignore", invalid="ignore"):
+            imbalance = (bid_size - ask_size) / total
+        return np.where(total > 0, imbalance, 0.0).astype(np.float64)
+
+
+class _Ewm:
+    """pandas `ewm(com=com, adjust=False).mean()`, one value at a time.
+
+    The update is pandas' own arithmetic, so it matches the batch path bit
+    for bit (a plain `w += alpha * (x - w)` drifts in the last digits).
+    """
+
+    __slots__ = ("com", "alpha", "keep", "value", "started")
+
+    def __init__(self, com: float) -> None:
+        self.com = com
+        self.alpha = 1.0 / (1.0 + com)
+        self.keep = 1.0 - self.alpha
+        self.value = math.nan
+        self.started = False
+
+    def update(self, x: float) -> float:
+        if not self.started:
+            self.value = x
+            self.started = True
+        elif self.value != x:
+            self.value = (self.keep * self.value + self.alpha * x) / (self.keep + self.alpha)
+        return self.value
+
+    def batch(self, x: FloatArray) -> FloatArray:
+        return np.asarray(pd.Series(x).ewm(com=self.com, adjust=False).mean(), dtype=np.float64)
+
+
+class _MidSeries(Feature):
+    """A feature of the mid-price series."""
+
+    @abstractmethod
+    def update_mid(self, mid: float) -> float:
+        """Advance by one mid price."""
+
+    @abstractmethod
+    def batch_mid(self, mid: FloatArray) -> FloatArray:
+        """Values for a whole mid-price series."""
+
+    def update(self, event: OrderbookEvent) -> float:
+        return self.update_mid((event.bid_price + event.ask_price) / 2)
+
+    def batch(self, columns: Columns) -> FloatArray:
+        return self.batch_mid(
+            np.asarray((columns["bid_price"] + columns["ask_price"]) / 2, dtype=np.float64)
+        )
+
+
+class EMA(_MidSeries):
+    """Exponential moving average of the mid price with span `span`."""
+
+    def __init__(self, span: int = 20, name: str | None = None) -> None:
+        self.span = span
+        super().__init__(name or f"ema_{span}", span=span)
+
+    def reset(self) -> None:
+        self._ewm = _Ewm((self.span - 1) / 2)
+
+    def update_mid(self, mid: float) -> float:
+        return self._ewm.update(mid)
+
+    def batch_mid(self, mid: FloatArray) -> FloatArray:
+        return self._ewm.batch(mid)
+
+
+def _rsi(gain: float, loss: float) -> float:
+    if loss > 0:
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+    return 100.0 if gain > 0 else 50.0
+
+
+class RSI(_MidSeries):
+    """Wilder's relative strength index of mid-price changes, in [0, 100].
+
+    Gains and losses are smoothed with `alpha = 1 / period`; the value is
+    NaN until `period` changes have been seen.
+    """
+
+    def __init__(self, period: int = 14, name: str | None = None) -> None:
+        self.period = period
+        super().__init__(name or f"rsi_{period}", period=period)
+
+    def reset(self) -> None:
+        self._gain = _Ewm(self.period - 1)
+        self._loss = _Ewm(self.period - 1)
+        self._last = math.nan
+        self._changes = 0
+
+    def update_mid(self, mid: float) -> float:
+        last, self._last = self._last, mid
+        if math.isnan(last):
+            return math.nan
+        delta = mid - last
+        gain = self._gain.update(delta if delta > 0 else 0.0)
+        loss = self._loss.update(-delta if delta < 0 else 0.0)
+        self._changes += 1
+        return _rsi(gain, loss) if self._changes >= self.period else math.nan
+
+    def batch_mid(self, mid: FloatArray) -> FloatArray:
+        out = np.full(len(mid), np.nan)
+        if len(mid) < 2:
+            return out
+        delta = np.diff(mid)
+        gain = self._gain.batch(np.where(delta > 0, delta, 0.0))
+        loss = self._loss.batch(np.where(delta < 0, -delta, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+        rsi = np.where(loss > 0, rsi, np.where(gain > 0, 100.0, 50.0))
+        rsi[: self.period - 1] = np.nan
+        out[1:] = rsi
+        return out
+
+
+class MACD(_MidSeries):
+    """MACD of the mid price: EMA(fast) - EMA(slow), its EMA(signal), or their difference."""
+
+    def __init__(
+        self,
+        fast: int = 12,
+        slow: int = 26,
+        signal: int = 9,
+        output: MacdOutput = "line",
+        name: str | None = None,
+    ) -> None:
+        self.fast, self.slow, self.signal = fast, slow, signal
+        self.output: MacdOutput = output
+        suffix = "" if output == "line" else f"_{output}"
+        super().__init__(
+            name or f"macd_{fast}_{slow}_{signal}{suffix}",
+            fast=fast,
+            slow=slow,
+            signal=signal,
+            output=output,
+        )
+
+    def reset(self) -> None:
+        self._fast = _Ewm((self.fast - 1) / 2)
+        self._slow = _Ewm((self.slow - 1) / 2)
+        self._signal = _Ewm((self.signal - 1) / 2)
+
+    def update_mid(self, mid: float) -> float:
+        line = self._fast.update(mid) - self._slow.update(mid)
+        signal = self._signal.update(line)
+        if self.output == "line":
+            return line
+        return signal if self.output == "signal" else line - signal
+
+    def batch_mid(self, mid: FloatArray) -> FloatArray:
+        line = self._fast.batch(mid) - self._slow.batch(mid)
+        if self.output == "line":
+            return line
+        signal = self._signal.batch(line)
+        return signal if self.output == "signal" else line - signal
+
+
+def _window_sums(values: FloatArray, window: int) -> FloatArray:
+    """Sum of the last `window` values at each row (fewer at the start).
+
+    Differences of a running `cumsum`, matching `_RunningSum`.
+    """
+    total = np.cumsum(values)
+    padded = np.concatenate(([0.0], total))
+    start = np.maximum(np.arange(len(values)) + 1 - window, 0)
+    return np.asarray(total - padded[start], dtype=np.float64)
+
+
+class _RunningSum:
+    """Sum over the last `window` values from a ring of running totals."""
+
+    __slots__ = ("total", "ring")
+
+    def __init__(self, window: int) -> None:
+        self.total = 0.0
+        self.ring: deque[float] = deque([0.0], maxlen=window + 1)
+
+    def add(self, value: float) -> float:
+        self.total += value
+        self.ring.append(self.total)
+        return self.total - self.ring[0]
+
+
+class RealizedVol(_MidSeries):
+    """Root mean square of the last `window` simple mid-price returns.
+
+    NaN until `window` returns have been seen.
+    """
+
+    def __init__(self, window: int = 20, name: str | None = None) -> None:
+        self.window = window
+        super().__init__(name or f"rv_{window}", window=window)
+
+    def reset(self) -> None:
+        self._sum = _RunningSum(self.window)
+        self._last = math.nan
+        self._returns = 0
+
+    def update_mid(self, mid: float) -> float:
+        last, self._last = self._last, mid
+        if math.isnan(last):
+            return math.nan
+        r = mid / last - 1.0
+        squares = self._sum.add(r * r)
+        self._returns += 1
+        return math.sqrt(squares / self.window) if self._returns >= self.window else math.nan
+
+    def batch_mid(self, mid: FloatArray) -> FloatArray:
+        out = np.full(len(mid), np.nan)
+        if len(mid) < 2:
+            return out
+        r = mid[1:] / mid[:-1] - 1.0
+        rv = np.sqrt(_window_sums(r * r, self.window) / self.window)
+        rv[: self.window - 1] = np.nan
+        out[1:] = rv
+        return out
+
+
+class TradeFlowImbalance(Feature):
+    """Signed volume share of the last `window` trades: (buys - sells) / total, in [-1, 1]."""
+
+    source: FeatureSource = "trades"
+    inputs = ("price", "size", "side")
+
+    def __init__(self, window: int = 50, name: str | None = None) -> None:
+        self.window = window
+        super().__init__(name or f"tfi_{window}", window=window)
+
+    def reset(self) -> None:
+        self._signed = _RunningSum(self.window)
+        self._volume = _RunningSum(self.window)
+
+    def update(self, event: TradeEvent) -> float:
+        signed = self._signed.add(event.size if event.side == "buy" else -event.size)
+        volume = self._volume.add(event.size)
+        return signed / volume if volume > 0 else 0.0
+
+    def batch(self, columns: Columns) -> FloatArray:
+        size = np.asarray(columns["size"], dtype=np.float64)
+        signed = _window_sums(np.where(columns["side"] == "buy", size, -size), self.window)
+        volume = _window_sums(size, self.window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tfi = signed / volume
+        return np.where(volume > 0, tfi, 0.0).astype(np.float64)
+
+
+DEFAULT_FEATURES: tuple[Feature, ...] = (
+    Mid(),
+    Microprice(),
+    BookImbalance(),
+    EMA(20),
+    RSI(14),
+    MACD(),
+    RealizedVol(20),
+    TradeFlowImbalance(50),
+)
+
+
+class FeatureStore:
+    """Registered features, maintained per (venue, symbol) as events arrive."""
+
+    def __init__(self, features: Iterable[Feature] = DEFAULT_FEATURES) -> None:
+        self._features: dict[str, Feature] = {}
+        # (source, venue, symbol) -> per-stream feature instances and latest values
+        self._streams: dict[tuple[str, str, str], tuple[list[Feature], dict[str, float]]] = {}
+        for feature in features:
+            self.register(feature)
+
+    def register(self, feature: Feature) -> None:
+        """Add a feature; names must be unique."""
+        if feature.name in self._features:
+            raise ValueError(f"feature {feature.name!r} is already registered")
+        self._features[feature.name] = feature
+        # Streams seen so far pick it up from their next event
+        for (source, _, _), (instances, _) in self._streams.items():
+            if source == feature.source:
+                instances.append(feature.fresh())
+
+    @property
+    def names(self) -> list[str]:
+        """Registered feature names."""
+        return list(self._features)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._features
+
+    def _source_features(self, source: FeatureSource) -> list[Feature]:
+        return [f for f in self._features.values() if f.source == source]
+
+    def update(self, event: Event) -> None:
+        """Advance the features of the event's stream (other event types are ignored)."""
+        if isinstance(event, OrderbookEvent):
+            source: FeatureSource = "orderbook"
+        elif isinstance(event, TradeEvent):
+            source = "trades"
+        else:
+            return
+        key = (source, event.venue, event.symbol)
+        stream = self._streams.get(key)
+        if stream is None:
+            stream = self._streams[key] = (
+                [f.fresh() for f in self._source_features(source)],
+                {},
+            )
+        instances, values = stream
+        for feature in instances:
+            values[feature.name] = feature.update(event)
+
+    def get(self, name: str, venue: str, symbol: str) -> float:
+        """Latest value of `name` for a stream (NaN before its first event)."""
+        feature = self._features.get(name)
+        if feature is None:
+            raise KeyError(f"unknown feature {name!r}")
+        stream = self._streams.get((feature.source, venue, symbol))
+        return stream[1].get(name, math.nan) if stream is not None else math.nan
+
+    def values(self, venue: str, symbol: str) -> dict[str, float]:
+        """Latest value of every feature for a stream, orderbook and trades."""
+        result = dict.fromkeys(self._features, math.nan)
+        for source in ("orderbook", "trades"):
+            stream = self._streams.get((source, venue, symbol))
+            if stream is not None:
+                result.update(stream[1])
+        return result
+
+    def reset(self) -> None:
+        """Drop every stream's state; registrations are kept."""
+        self._streams.clear()
+
+    def backfill(self, frame: pd.DataFrame, source: FeatureSource = "orderbook") -> pd.DataFrame:
+        """Features of `source` for every row of a historical frame, vectorized.
+
+        Rows are taken in frame order per (venue, symbol), as `update`
+        would see them, and the values equal what `update` returns row by
+        row. The result has one column per feature and `frame`'s index.
+        """
+        features = self._source_features(source)
+        out = {f.name: np.full(len(frame), np.nan) for f in features}
+        if len(frame) and features:
+            keys = [c for c in ("venue", "symbol") if c in frame.columns]
+            inputs = {c: frame[c].to_numpy() for f in features for c in f.inputs}
+            if keys:
+                groups = frame.groupby(keys, sort=False, observed=True).indices.values()
+            else:
+                groups = [np.arange(len(frame))]
+            for rows in groups:
+                columns = {c: values[rows] for c, values in inputs.items()}
+                for feature in features:
+                    out[feature.name][rows] = feature.batch(columns)
+        return pd.DataFrame(out, index=frame.index)
+
+    def fingerprint(self, frame: pd.DataFrame, source: FeatureSource = "orderbook") -> str:
+        """Hash of the frame's feature inputs and the registered features of `source`."""
+        features = self._source_features(source)
+        columns = sorted(
+            {c for f in features for c in f.inputs} | ({"venue", "symbol"} & set(frame.columns))
+        )
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(source.encode())
+        for feature in features:
+            digest.update(feature.spec.encode())
+        digest.update(json.dumps(columns).encode())
+        digest.update(pd.util.hash_pandas_object(frame[columns], index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def materialize(
+        self, frame: pd.DataFrame, cache_dir: Path | str, source: FeatureSource = "orderbook"
+    ) -> pd.DataFrame:
+        """`backfill`, cached as Parquet in `cache_dir` by `fingerprint`."""
+        path = Path(cache_dir) / f"{source}-{self.fingerprint(frame, source)}.parquet"
+        if path.exists():
+            logger.info("Loading cached features: %s", path)
+            cached = pq.read_table(path).to_pandas()
+            cached.index = frame.index
+            return cached
+        features = self.backfill(frame, source)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        pq.write_table(pa.Table.from_pandas(features, preserve_index=False), tmp)
+        tmp.replace(path)
+        logger.info("Materialized %d feature rows: %s", len(features), path)
+        return features
@@ -1,12 +1,19 @@
 """Load market data from CSV and Parquet files."""
 
 import logging
+from collections.abc import Sequence
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 
+from ai_arb_lab.core.telemetry import DATA_LOAD, TELEMETRY
+from ai_arb_lab.data.dataset import is_dataset_dir, load_dataset
+
 logger = logging.getLogger(__name__)
 
+_LOAD = TELEMETRY.stage(DATA_LOAD)
+
 
 def load_trades_csv(path: Path | str) -> pd.DataFrame:
     """Load trades from CSV. Expected columns: timestamp, venue, symbol, price, size, side."""
@@ -29,21 +36,61 @@ def load_candles_parquet(path: Path | str) -> pd.DataFrame:
     return df
 
 
-def load_data_dir(data_dir: Path | str) -> dict[str, pd.DataFrame]:
-    """Load all available data from a directory."""
+def _apply_filters(
+    df: pd.DataFrame,
+    start: datetime | None,
+    end: datetime | None,
+    venues: Sequence[str] | None,
+    symbols: Sequence[str] | None,
+) -> pd.DataFrame:
+    if start is None and end is None and venues is None and symbols is None:
+        return df
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= df["timestamp"] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= df["timestamp"] < pd.Timestamp(end)
+    if venues is not None and "venue" in df.columns:
+        mask &= df["venue"].isin(list(venues))
+    if symbols is not None and "symbol" in df.columns:
+        mask &= df["symbol"].isin(list(symbols))
+    return df[mask].reset_index(drop=True)
+
+
+def load_data_dir(
+    data_dir: Path | str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    venues: Sequence[str] | None = None,
+    symbols: Sequence[str] | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Load all available data from a directory.
+
+    Partitioned datasets (`trades/`, `orderbook/`) are preferred over CSV
+    files; for them the filters are pushed down to partition pruning and
+    row-group statistics. For CSV the filters are applied after loading.
+    `start` is inclusive, `end` exclusive. Each call is one `data_load`
+    telemetry sample and adds the rows loaded to the `rows_loaded` counter.
+    """
+    t0 = _LOAD.start()
     data_dir = Path(data_dir)
     result: dict[str, pd.DataFrame] = {}
 
-    trades_path = data_dir / "trades.csv"
-    if trades_path.exists():
-        result["trades"] = load_trades_csv(trades_path)
-
-    orderbook_path = data_dir / "orderbook.csv"
-    if orderbook_path.exists():
-        result["orderbook"] = load_orderbook_csv(orderbook_path)
+    for kind in ("trades", "orderbook"):
+        dataset_path = data_dir / kind
+        csv_path = data_dir / f"{kind}.csv"
+        if is_dataset_dir(dataset_path):
+            result[kind] = load_dataset(dataset_path, kind, start, end, venues, symbols)
+        elif csv_path.exists():
+            loaded = load_trades_csv(csv_path) if kind == "trades" else load_orderbook_csv(csv_path)
+            result[kind] = _apply_filters(loaded, start, end, venues, symbols)
 
     candles_path = data_dir / "candles.parquet"
     if candles_path.exists():
-        result["candles"] = load_candles_parquet(candles_path)
+        result["candles"] = _apply_filters(
+            load_candles_parquet(candles_path), start, end, venues, symbols
+        )
 
+    _LOAD.stop(t0)
+    TELEMETRY.count("rows_loaded", sum(len(frame) for frame in result.values()))
     return result
@@ -2,18 +2,91 @@
 
 Generates multi-venue orderbooks, trades, and candles with configurable
 volatility, spreads, and depth. No real exchange connection required.
+
+Data is produced in fixed-size chunks (`iter_trades`, `iter_orderbook`,
+`iter_candles`) with vectorized timestamps and categorical venues, and
+`generate_all` streams the chunks straight to disk, so multi-month or
+billion-row datasets never need to fit in memory. Every random column has
+its own RNG stream derived from the seed and the random walk carries its
+last price across chunks, so output is bit-identical for a given seed
+regardless of chunk size.
+
+`iter_cross_orderbook` quotes every pair of several currencies instead of
+one symbol (for `TriangularArbStrategy`). Each currency follows its own
+random walk against the first one, and every pair is priced from the two
+walks, so cross rates are consistent apart from optional per-quote
+mispricing noise.
 """
 
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import datetime
 from pathlib import Path
+from typing import Literal
 
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ai_arb_lab.core.book import depth_columns
+from ai_arb_lab.data.dataset import clear_dataset, write_dataset
 
 logger = logging.getLogger(__name__)
 
+DataFormat = Literal["csv", "parquet"]
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+NS_PER_MINUTE = 60_000_000_000
+
+# Spawn keys keep each data kind's RNG streams independent of the others
+_STREAM_KEYS = {"trades": 0, "orderbook": 1, "candles": 2, "cross": 3}
+
+# Reference prices for `iter_cross_orderbook`, in units of the first currency
+CROSS_CURRENCIES: dict[str, float] = {"USD": 1.0, "BTC": 50000.0, "ETH": 3000.0, "SOL": 150.0}
+
+
+def _chunk_bounds(n: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if n == 0:
+        # One empty chunk keeps the column layout (and output schemas) intact
+        yield 0, 0
+        return
+    for lo in range(0, n, chunk_size):
+        yield lo, min(lo + chunk_size, n)
+
+
+def cross_symbols(currencies: Sequence[str]) -> list[str]:
+    """`BASE-QUOTE` symbols for every pair, quoted in the earlier currency."""
+    return [f"{base}-{quote}" for i, base in enumerate(currencies) for quote in currencies[:i]]
+
+
+def _timestamps(start: datetime, lo: int, hi: int, step_ns_num: int, step_den: int) -> pd.Series:
+    """Timestamps `start + i * step_ns_num / step_den` ns for rows [lo, hi)."""
+    offsets = np.arange(lo, hi, dtype=np.int64) * step_ns_num // step_den
+    return pd.Series(np.datetime64(start, "ns") + offsets.astype("timedelta64[ns]"))
+
+
+class _RandomWalk:
+    """Multiplicative random walk that continues across chunks."""
+
+    def __init__(self, base_price: float, volatility: float, rng: np.random.Generator) -> None:
+        self.last = base_price
+        self.volatility = volatility
+        self.rng = rng
+
+    def next(self, n: int) -> npt.NDArray[np.float64]:
+        steps = np.empty(n + 1)
+        steps[0] = self.last
+        steps[1:] = 1 + self.rng.normal(0, self.volatility, n)
+        # accumulate is a strict left fold, so chunk boundaries do not change the bits
+        prices = np.multiply.accumulate(steps)[1:]
+        if n:
+            self.last = float(prices[-1])
+        return prices
+
 
 class SyntheticMarketGenerator:
     """Generate synthetic market data for backtesting and paper trading."""
@@ -31,7 +104,187 @@ class SyntheticMarketGenerator:
         self.volatility = volatility
         self.spread_bps = spread_bps / 10000.0  # Convert to decimal
         self.n_venues = n_venues
-        self._rng = np.random.default_rng(seed)
+        self._venue_names = [f"venue_{i}" for i in range(n_venues)]
+
+    def _streams(self, kind: str, n: int) -> list[np.random.Generator]:
+        """Independent RNG streams for one data kind, one per random column."""
+        seq = np.random.SeedSequence(self.seed, spawn_key=(_STREAM_KEYS[kind],))
+        return [np.random.default_rng(child) for child in seq.spawn(n)]
+
+    def _venues(self, lo: int, hi: int) -> pd.Categorical:
+        codes = np.arange(lo, hi, dtype=np.int64) % self.n_venues
+        return pd.Categorical.from_codes(codes, categories=self._venue_names)
+
+    def iter_trades(
+        self,
+        start: datetime,
+        days: int = 1,
+        symbol: str = "BTC-USD",
+        trades_per_minute: int = 5,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield synthetic trades for all venues in chunks of `chunk_size` rows."""
+        n_trades = days * 24 * 60 * trades_per_minute
+        walk_rng, size_rng, side_rng = self._streams("trades", 3)
+        walk = _RandomWalk(self.base_price, self.volatility, walk_rng)
+        for lo, hi in _chunk_bounds(n_trades, chunk_size):
+            n = hi - lo
+            sides = (side_rng.random(n) < 0.5).astype(np.int8)
+            yield pd.DataFrame(
+                {
+                    "timestamp": _timestamps(start, lo, hi, NS_PER_MINUTE, trades_per_minute),
+                    "venue": self._venues(lo, hi),
+                    "symbol": symbol,
+                    "price": walk.next(n),
+                    "size": size_rng.lognormal(0, 1, n).clip(0.001, 10.0),
+                    "side": pd.Categorical.from_codes(sides, categories=["buy", "sell"]),
+                }
+            )
+
+    def iter_orderbook(
+        self,
+        start: datetime,
+        days: int = 1,
+        symbol: str = "BTC-USD",
+        snapshots_per_minute: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        depth_levels: int = 1,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield synthetic orderbook snapshots in chunks of `chunk_size` rows.
+
+        With `depth_levels > 1`, levels 1.. are added as `bid_price_1`,
+        `bid_size_1`, `ask_price_1`, ... columns (see `ai_arb_lab.core.book`),
+        spaced half a spread apart with sizes growing away from the touch.
+        Top-of-book columns are the same for any `depth_levels`.
+        """
+        if depth_levels < 1:
+            raise ValueError("depth_levels must be >= 1")
+        n_snapshots = days * 24 * 60 * snapshots_per_minute
+        walk_rng, bid_rng, ask_rng, bid_depth_rng, ask_depth_rng = self._streams("orderbook", 5)
+        walk = _RandomWalk(self.base_price, self.volatility, walk_rng)
+        extra = np.arange(1, depth_levels, dtype=np.float64)
+        for lo, hi in _chunk_bounds(n_snapshots, chunk_size):
+            n = hi - lo
+            prices = walk.next(n)
+            spread = prices * self.spread_bps
+            bid = prices - spread / 2
+            ask = prices + spread / 2
+            frame = pd.DataFrame(
+                {
+                    "timestamp": _timestamps(start, lo, hi, NS_PER_MINUTE, snapshots_per_minute),
+                    "venue": self._venues(lo, hi),
+                    "symbol": symbol,
+                    "bid_price": bid,
+                    "ask_price": ask,
+                    "bid_size": bid_rng.uniform(1, 100, n),
+                    "ask_size": ask_rng.uniform(1, 100, n),
+                }
+            )
+            if depth_levels > 1:
+                offsets = np.outer(spread / 2, extra)
+                growth = 1 + extra / 2
+                bid_sizes = bid_depth_rng.uniform(1, 100, (n, depth_levels - 1)) * growth
+                ask_sizes = ask_depth_rng.uniform(1, 100, (n, depth_levels - 1)) * growth
+                columns = []
+                for j in range(depth_levels - 1):
+                    columns += [bid - offsets[:, j], bid_sizes[:, j], ask + offsets[:, j]]
+                    columns.append(ask_sizes[:, j])
+                levels = pd.DataFrame(
+                    np.column_stack(columns), columns=depth_columns(depth_levels), index=frame.index
+                )
+                frame = pd.concat([frame, levels], axis=1)
+            yield frame
+
+    def iter_cross_orderbook(
+        self,
+        start: datetime,
+        days: int = 1,
+        currencies: Mapping[str, float] = CROSS_CURRENCIES,
+        snapshots_per_minute: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        mispricing_bps: float = 0.0,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield top-of-book snapshots for every pair of `currencies`.
+
+        `currencies` maps each currency to its starting price in the first
+        one (which stays fixed at its price). Rows cycle through every
+        (symbol, venue) of `cross_symbols`, venues fastest, and one full
+        cycle is a round: prices move once per round, so quotes within a
+        round share the same cross rates. `mispricing_bps` adds independent
+        noise with that standard deviation to each quote's mid price, which
+        is what opens triangular opportunities.
+        """
+        names = list(currencies)
+        if len(names) < 3:
+            raise ValueError("need at least three currencies")
+        symbols = cross_symbols(names)
+        base_idx = np.array([i for i in range(len(names)) for _ in range(i)], dtype=np.int64)
+        quote_idx = np.array([j for i in range(len(names)) for j in range(i)], dtype=np.int64)
+        per_round = len(symbols) * self.n_venues
+        n_snapshots = days * 24 * 60 * snapshots_per_minute
+        noise_rng, bid_rng, ask_rng, *walk_rngs = self._streams("cross", 3 + len(names) - 1)
+        walks = [
+            _RandomWalk(currencies[name], self.volatility, rng)
+            for name, rng in zip(names[1:], walk_rngs, strict=True)
+        ]
+        done = 0  # rounds generated so far
+        for lo, hi in _chunk_bounds(n_snapshots, chunk_size):
+            n = hi - lo
+            rows = np.arange(lo, hi, dtype=np.int64)
+            rounds = rows // per_round
+            needed = int(rounds[-1]) + 1 - done if n else 0
+            # Column 0 is the last round already generated, so chunks can split a round
+            levels = np.empty((len(names), needed + 1))
+            levels[0] = currencies[names[0]]
+            for k, walk in enumerate(walks, start=1):
+                levels[k, 0] = walk.last
+                levels[k, 1:] = walk.next(needed)
+            columns = rounds - done + 1
+            done += needed
+            slot = rows % per_round
+            sym = slot // self.n_venues
+            mid = levels[base_idx[sym], columns] / levels[quote_idx[sym], columns]
+            mid *= 1 + noise_rng.normal(0, mispricing_bps / 10000.0, n)
+            spread = mid * self.spread_bps
+            yield pd.DataFrame(
+                {
+                    "timestamp": _timestamps(start, lo, hi, NS_PER_MINUTE, snapshots_per_minute),
+                    "venue": self._venues(lo, hi),
+                    "symbol": pd.Categorical.from_codes(sym, categories=symbols),
+                    "bid_price": mid - spread / 2,
+                    "ask_price": mid + spread / 2,
+                    "bid_size": bid_rng.uniform(1, 100, n),
+                    "ask_size": ask_rng.uniform(1, 100, n),
+                }
+            )
+
+    def iter_candles(
+        self,
+        start: datetime,
+        days: int = 1,
+        symbol: str = "BTC-USD",
+        interval_minutes: int = 15,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield OHLCV candles in chunks of `chunk_size` rows."""
+        n_candles = (days * 24 * 60) // interval_minutes
+        walk_rng, high_rng, low_rng, volume_rng = self._streams("candles", 4)
+        walk = _RandomWalk(self.base_price, self.volatility, walk_rng)
+        for lo, hi in _chunk_bounds(n_candles, chunk_size):
+            n = hi - lo
+            prices = walk.next(n)
+            yield pd.DataFrame(
+                {
+                    "timestamp": _timestamps(start, lo, hi, NS_PER_MINUTE * interval_minutes, 1),
+                    "venue": self._venues(lo, hi),
+                    "symbol": symbol,
+                    "open": prices,
+                    "high": prices * (1 + high_rng.uniform(0, self.volatility, n)),
+                    "low": prices * (1 - low_rng.uniform(0, self.volatility, n)),
+                    "close": prices,
+                    "volume": volume_rng.lognormal(5, 2, n),
+                }
+            )
 
     def generate_trades(
         self,
@@ -41,23 +294,7 @@ class SyntheticMarketGenerator:
         trades_per_minute: int = 5,
     ) -> pd.DataFrame:
         """Generate synthetic trade data for all venues."""
-        n_trades = days * 24 * 60 * trades_per_minute
-        timestamps = [start + timedelta(minutes=i / trades_per_minute) for i in range(n_trades)]
-        prices = self._random_walk(n_trades)
-        sizes = self._rng.lognormal(0, 1, n_trades).clip(0.001, 10.0)
-        sides = self._rng.choice(["buy", "sell"], n_trades)
-        venues = [f"venue_{i % self.n_venues}" for i in range(n_trades)]
-
-        return pd.DataFrame(
-            {
-                "timestamp": timestamps,
-                "venue": venues,
-                "symbol": symbol,
-                "price": prices,
-                "size": sizes,
-                "side": sides,
-            }
-        )
+        return _concat(self.iter_trades(start, days, symbol, trades_per_minute))
 
     def generate_orderbook(
         self,
@@ -65,30 +302,28 @@ class SyntheticMarketGenerator:
         days: int = 1,
         symbol: str = "BTC-USD",
         snapshots_per_minute: int = 1,
+        depth_levels: int = 1,
     ) -> pd.DataFrame:
         """Generate synthetic orderbook snapshots."""
-        n_snapshots = days * 24 * 60 * snapshots_per_minute
-        timestamps = [
-            start + timedelta(minutes=i / snapshots_per_minute) for i in range(n_snapshots)
-        ]
-        prices = self._random_walk(n_snapshots)
-        spread = prices * self.spread_bps
-        bid_prices = prices - spread / 2
-        ask_prices = prices + spread / 2
-        bid_sizes = self._rng.uniform(1, 100, n_snapshots)
-        ask_sizes = self._rng.uniform(1, 100, n_snapshots)
-        venues = [f"venue_{i % self.n_venues}" for i in range(n_snapshots)]
-
-        return pd.DataFrame(
-            {
-                "timestamp": timestamps,
-                "venue": venues,
-                "symbol": symbol,
-                "bid_price": bid_prices,
-                "ask_price": ask_prices,
-                "bid_size": bid_sizes,
-                "ask_size": ask_sizes,
-            }
+        return _concat(
+            self.iter_orderbook(
+                start, days, symbol, snapshots_per_minute, depth_levels=depth_levels
+            )
+        )
+
+    def generate_cross_orderbook(
+        self,
+        start: datetime,
+        days: int = 1,
+        currencies: Mapping[str, float] = CROSS_CURRENCIES,
+        snapshots_per_minute: int = 1,
+        mispricing_bps: float = 0.0,
+    ) -> pd.DataFrame:
+        """Generate multi-symbol orderbook snapshots (see `iter_cross_orderbook`)."""
+        return _concat(
+            self.iter_cross_orderbook(
+                start, days, currencies, snapshots_per_minute, mispricing_bps=mispricing_bps
+            )
         )
 
     def generate_candles(
@@ -99,32 +334,7 @@ class SyntheticMarketGenerator:
         interval_minutes: int = 15,
     ) -> pd.DataFrame:
         """Generate OHLCV candles."""
-        n_candles = (days * 24 * 60) // interval_minutes
-        timestamps = [start + timedelta(minutes=i * interval_minutes) for i in range(n_candles)]
-        prices = self._random_walk(n_candles)
-        high = prices * (1 + self._rng.uniform(0, self.volatility, n_candles))
-        low = prices * (1 - self._rng.uniform(0, self.volatility, n_candles))
-        volume = self._rng.lognormal(5, 2, n_candles)
-        venues = [f"venue_{i % self.n_venues}" for i in range(n_candles)]
-
-        return pd.DataFrame(
-            {
-                "timestamp": timestamps,
-                "venue": venues,
-                "symbol": symbol,
-                "open": prices,
-                "high": high,
-                "low": low,
-                "close": prices,
-                "volume": volume,
-            }
-        )
-
-    def _random_walk(self, n: int) -> npt.NDArray[np.floating]:
-        """Generate price series with random walk."""
-        returns = self._rng.normal(0, self.volatility, n)
-        prices = self.base_price * np.cumprod(1 + returns)
-        return prices
+        return _concat(self.iter_candles(start, days, symbol, interval_minutes))
 
     def generate_all(
         self,
@@ -132,25 +342,66 @@ class SyntheticMarketGenerator:
         start: datetime | None = None,
         days: int = 1,
         symbol: str = "BTC-USD",
+        fmt: DataFormat = "csv",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        depth_levels: int = 1,
+        snapshots_per_minute: int = 1,
+        currencies: Mapping[str, float] | None = None,
+        mispricing_bps: float = 0.0,
     ) -> dict[str, Path]:
-        """Generate all data types and write to output directory."""
+        """Generate all data types and stream them to the output directory.
+
+        `fmt="parquet"` writes trades and orderbook as partitioned datasets
+        (see `ai_arb_lab.data.dataset`) instead of flat CSV files. At most
+        one chunk of each data type is held in memory at a time. Venues take
+        turns, so `snapshots_per_minute=n_venues` quotes every venue each minute.
+        With `currencies`, the orderbook quotes every pair of them instead
+        of `symbol` (see `iter_cross_orderbook`).
+        """
         from datetime import datetime as dt
 
         start = start or dt.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
         out = Path(output_dir)
         out.mkdir(parents=True, exist_ok=True)
 
-        trades = self.generate_trades(start, days, symbol)
-        orderbook = self.generate_orderbook(start, days, symbol)
-        candles = self.generate_candles(start, days, symbol)
+        trades = self.iter_trades(start, days, symbol, chunk_size=chunk_size)
+        orderbook: Iterator[pd.DataFrame]
+        if currencies is not None:
+            orderbook = self.iter_cross_orderbook(
+                start,
+                days,
+                currencies,
+                snapshots_per_minute,
+                chunk_size=chunk_size,
+                mispricing_bps=mispricing_bps,
+            )
+        else:
+            orderbook = self.iter_orderbook(
+                start,
+                days,
+                symbol,
+                snapshots_per_minute,
+                chunk_size=chunk_size,
+                depth_levels=depth_levels,
+            )
+        candles = self.iter_candles(start, days, symbol, chunk_size=chunk_size)
 
-        trades_path = out / "trades.csv"
-        orderbook_path = out / "orderbook.csv"
+        if fmt == "parquet":
+            clear_dataset(out, "trades")
+            clear_dataset(out, "orderbook")
+            trades_path = out / "trades"
+            orderbook_path = out / "orderbook"
+            for part, chunk in enumerate(trades):
+                write_dataset(chunk, out, "trades", part=part)
+            for part, chunk in enumerate(orderbook):
+                write_dataset(chunk, out, "orderbook", part=part)
+        else:
+            trades_path = out / "trades.csv"
+            orderbook_path = out / "orderbook.csv"
+            _write_csv(trades, trades_path)
+            _write_csv(orderbook, orderbook_path)
         candles_path = out / "candles.parquet"
-
-        trades.to_csv(trades_path, index=False)
-        orderbook.to_csv(orderbook_path, index=False)
-        candles.to_parquet(candles_path, index=False)
+        _write_parquet(candles, candles_path)
 
         logger.info("Generated synthetic data: %s", out)
         return {
@@ -158,3 +409,29 @@ class SyntheticMarketGenerator:
             "orderbook": orderbook_path,
             "candles": candles_path,
         }
+
+
+def _concat(chunks: Iterator[pd.DataFrame]) -> pd.DataFrame:
+    frames = list(chunks)
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+def _write_csv(chunks: Iterator[pd.DataFrame], path: Path) -> None:
+    with path.open("w", newline="") as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, index=False, header=i == 0)
+
+
+def _write_parquet(chunks: Iterator[pd.DataFrame], path: Path) -> None:
+    writer: pq.ParquetWriter | None = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk.astype({"venue": str}), preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
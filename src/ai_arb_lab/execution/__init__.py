@@ -1,9 +1,21 @@
-"""Execution layer: fill model, paper broker."""
+"""Execution layer: fill model, latency model, paper broker, paper session."""
 
-from ai_arb_lab.execution.fill_model import FillModel
-from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.execution.async_broker import AsyncPaperBroker, OrderRecord, PairResult
+from ai_arb_lab.execution.fill_model import FillBatch, FillModel
+from ai_arb_lab.execution.latency import LatencyModel, VenueLatency
+from ai_arb_lab.execution.paper_broker import PairFills, PaperBroker
+from ai_arb_lab.execution.session import PaperSession, SessionStats
 
 __all__ = [
+    "AsyncPaperBroker",
+    "OrderRecord",
+    "PairResult",
+    "FillBatch",
     "FillModel",
+    "LatencyModel",
+    "VenueLatency",
+    "PairFills",
     "PaperBroker",
+    "PaperSession",
+    "SessionStats",
 ]
@@ -0,0 +1,275 @@
+"""Asynchronous two-leg execution for the paper broker.
+
+`AsyncPaperBroker.submit` sends both legs of a signal at once, each as its
+own asyncio task. A leg waits out its venue's order-entry latency, then
+fills against that venue's book as it stands on arrival. With a `paced`
+clock the wait is real (scaled) time, so books keep updating while legs
+are in flight and many signals overlap. In `afap` mode legs only yield to
+the event loop, and the latency sets the fill timestamp.
+
+Every order is tracked as an `OrderRecord` moving from `new` to `filled`,
+`partially_filled`, `rejected` or `cancelled`. When the legs fill unequal
+sizes (one rejected, or a partial depth fill), the broker is exposed to
+leg risk. The `unwind` policy trades the difference back on the
+overfilled leg's venue; `hold` leaves it in the ledger. Orders and fills
+are published to an optional `EventBus`.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Literal
+
+from ai_arb_lab.core.bus import EventBus
+from ai_arb_lab.core.clock import SimClock, from_ns
+from ai_arb_lab.core.events import FillEvent, OrderEvent
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.latency import LatencyModel
+from ai_arb_lab.execution.paper_broker import PaperBroker, fill_cash
+from ai_arb_lab.strategies.base import Signal
+
+logger = logging.getLogger(__name__)
+
+OrderStatus = Literal["new", "partially_filled", "filled", "rejected", "cancelled"]
+PairStatus = Literal["filled", "unwound", "open", "rejected", "cancelled"]
+LegRiskPolicy = Literal["unwind", "hold"]
+
+_US = timedelta(microseconds=1)
+
+# Size imbalances below this are treated as hedged
+_EPS = 1e-12
+
+
+@dataclass
+class OrderRecord:
+    """An order and its fills; `role` is `buy`, `sell` or `unwind`."""
+
+    order: OrderEvent
+    role: str
+    status: OrderStatus = "new"
+    filled_size: float = 0.0
+    fills: list[FillEvent] = field(default_factory=list)
+
+    def on_fill(self, fill: FillEvent | None) -> None:
+        """Record the outcome of the order reaching its venue."""
+        if fill is None:
+            self.status = "rejected"
+            return
+        self.fills.append(fill)
+        self.filled_size += fill.size
+        self.status = "filled" if fill.remaining_size <= _EPS else "partially_filled"
+
+
+@dataclass
+class PairResult:
+    """Outcome of one signal: both legs, any unwind order, and every fill."""
+
+    signal: Signal
+    orders: list[OrderRecord]
+    status: PairStatus = "filled"
+
+    @property
+    def buy(self) -> OrderRecord:
+        """The buy leg."""
+        return self.orders[0]
+
+    @property
+    def sell(self) -> OrderRecord:
+        """The sell leg."""
+        return self.orders[1]
+
+    @property
+    def fills(self) -> list[FillEvent]:
+        """Fills of every order, legs first."""
+        return [fill for record in self.orders for fill in record.fills]
+
+    @property
+    def cash(self) -> float:
+        """Net capital change from all fills."""
+        return sum(fill_cash(fill) for fill in self.fills)
+
+    @property
+    def imbalance(self) -> float:
+        """Bought minus sold quantity, unwind orders included."""
+        net = 0.0
+        for record in self.orders:
+            net += record.filled_size if record.order.side == "buy" else -record.filled_size
+        return net
+
+
+class AsyncPaperBroker(PaperBroker):
+    """Paper broker that executes both legs of a signal concurrently.
+
+    `max_in_flight` caps how many signals execute at once (None: no cap);
+    further submissions wait for a slot.
+    """
+
+    def __init__(
+        self,
+        initial_capital: float = 100_000.0,
+        fill_model: FillModel | None = None,
+        latency: LatencyModel | None = None,
+        bus: EventBus | None = None,
+        leg_risk: LegRiskPolicy = "unwind",
+        max_in_flight: int | None = None,
+    ) -> None:
+        super().__init__(initial_capital=initial_capital, fill_model=fill_model)
+        self.latency = latency or LatencyModel()
+        self.bus = bus
+        self.leg_risk: LegRiskPolicy = leg_risk
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._pending: set[asyncio.Task[PairResult]] = set()
+        self._legs: dict[str, asyncio.Task[int]] = {}
+        self.results: list[PairResult] = []
+
+    @property
+    def in_flight(self) -> int:
+        """Signals submitted and not yet finished."""
+        return len(self._pending)
+
+    def _new_order(
+        self, signal: Signal, side: str, venue: str, price: float, size: float, sent_ns: int
+    ) -> OrderEvent:
+        return OrderEvent.model_construct(
+            timestamp=from_ns(sent_ns),
+            correlation_id=None,
+            order_id=self._next_order_id(),
+            symbol=signal.symbol,
+            side=side,
+            venue=venue,
+            price=price,
+            size=size,
+            signal_id=None,
+        )
+
+    async def _publish(self, event: OrderEvent | FillEvent) -> None:
+        if self.bus is not None:
+            await self.bus.publish(event)
+
+    async def _send(
+        self, record: OrderRecord, clock: SimClock, sent_ns: int, fill_prob: float | None = None
+    ) -> int:
+        """Deliver one order after its venue's latency; returns its arrival time."""
+        order = record.order
+        delay = self.latency.order_delay(order.venue)
+        if clock.mode == "paced" and delay > timedelta(0):
+            await asyncio.sleep(delay.total_seconds() / (clock.speed_multiplier or 1.0))
+        else:
+            await asyncio.sleep(0)
+        arrival_ns = sent_ns + delay // _US * 1000
+        fill = self.execute_order(order, SimClock(from_ns(arrival_ns)), fill_prob)
+        record.on_fill(fill)
+        if fill is not None:
+            await self._publish(fill)
+        return arrival_ns
+
+    async def _leg(self, record: OrderRecord, clock: SimClock, sent_ns: int) -> int:
+        try:
+            return await self._send(record, clock, sent_ns)
+        except asyncio.CancelledError:
+            record.status = "cancelled"
+            raise
+        finally:
+            self._legs.pop(record.order.order_id, None)
+
+    async def _execute(self, signal: Signal, clock: SimClock) -> PairResult:
+        sent_ns = clock.now_ns
+        records = [
+            OrderRecord(
+                self._new_order(
+                    signal, "buy", signal.venue_buy, signal.price_buy, signal.size, sent_ns
+                ),
+                "buy",
+            ),
+            OrderRecord(
+                self._new_order(
+                    signal, "sell", signal.venue_sell, signal.price_sell, signal.size, sent_ns
+                ),
+                "sell",
+            ),
+        ]
+        tasks = []
+        for record in records:
+            await self._publish(record.order)
+            task = asyncio.create_task(self._leg(record, clock, sent_ns))
+            self._legs[record.order.order_id] = task
+            tasks.append(task)
+        arrivals = await asyncio.gather(*tasks, return_exceptions=True)
+        result = PairResult(signal, records)
+
+        if all(record.status == "cancelled" for record in records):
+            result.status = "cancelled"
+        elif all(record.filled_size <= _EPS for record in records):
+            result.status = "rejected"
+        elif abs(result.imbalance) > _EPS:
+            if self.leg_risk == "unwind":
+                last_ns = max((a for a in arrivals if isinstance(a, int)), default=sent_ns)
+                await self._unwind(result, clock, last_ns)
+            else:
+                result.status = "open"
+                logger.warning(
+                    "Leg risk: %s left open %+g on %s",
+                    signal.symbol,
+                    result.imbalance,
+                    signal.venue_buy if result.imbalance > 0 else signal.venue_sell,
+                )
+        self.results.append(result)
+        return result
+
+    async def _unwind(self, result: PairResult, clock: SimClock, sent_ns: int) -> None:
+        """Trade the leg imbalance back on the venue that overfilled."""
+        signal = result.signal
+        imbalance = result.imbalance
+        if imbalance > 0:
+            side, venue, price = "sell", signal.venue_buy, signal.price_buy
+        else:
+            side, venue, price = "buy", signal.venue_sell, signal.price_sell
+        record = OrderRecord(
+            self._new_order(signal, side, venue, price, abs(imbalance), sent_ns), "unwind"
+        )
+        result.orders.append(record)
+        await self._publish(record.order)
+        # Hedging orders cross the book, so they always reach it
+        await self._send(record, clock, sent_ns, fill_prob=1.0)
+        result.status = "unwound" if abs(result.imbalance) <= _EPS else "open"
+        logger.info(
+            "Leg risk: unwound %g %s on %s (%s)",
+            abs(imbalance),
+            signal.symbol,
+            venue,
+            record.status,
+        )
+
+    async def submit(self, signal: Signal, clock: SimClock) -> PairResult:
+        """Execute both legs of `signal` concurrently and wait for the result."""
+        if self._slots is None:
+            return await self._execute(signal, clock)
+        async with self._slots:
+            return await self._execute(signal, clock)
+
+    def submit_nowait(self, signal: Signal, clock: SimClock) -> "asyncio.Task[PairResult]":
+        """Start executing `signal` and return its task; see `drain`."""
+        task = asyncio.create_task(self.submit(signal, clock))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        return task
+
+    def cancel(self, order_id: str) -> bool:
+        """Cancel a leg that has not reached its venue yet."""
+        task = self._legs.get(order_id)
+        if task is None or task.done():
+            return False
+        return task.cancel()
+
+    def cancel_all(self) -> int:
+        """Cancel every leg still in flight. Returns how many were cancelled."""
+        return sum(self.cancel(order_id) for order_id in list(self._legs))
+
+    async def drain(self) -> list[PairResult]:
+        """Wait for every signal started with `submit_nowait`."""
+        results = []
+        while self._pending:
+            done = await asyncio.gather(*self._pending)
+            results.extend(done)
+        return results
@@ -1,10 +1,31 @@
-"""Fill model: simulate realistic fills with slippage and partial fills."""
+"""Fill model: simulate realistic fills with slippage and partial fills.
+
+In the default `flat` mode any size fills at the quoted price plus a fixed
+slippage. In `depth` mode an order walks the L2 book on its venue, fills
+at the resulting VWAP and comes back partially filled when the book runs
+out of liquidity (or out of levels within the limit price).
+
+Randomness comes from a per-model `numpy.random.Generator` seeded at
+construction, and fill ids are counter-based (`fill-1`, `fill-2`, ...), so a
+given seed reproduces the same fills. `simulate_fills` simulates many orders
+at once as arrays. It draws the same random numbers in the same order as
+calling `simulate_fill` once per order, so both paths give identical fills.
+"""
 
-import uuid
 from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
 
+from ai_arb_lab.core.book import OrderBookL2
 from ai_arb_lab.core.clock import SimClock
 from ai_arb_lab.core.events import FillEvent
+from ai_arb_lab.core.telemetry import FILL_SIMULATION, TELEMETRY
+
+_FILL = TELEMETRY.stage(FILL_SIMULATION)
+
+FillMode = Literal["flat", "depth"]
 
 
 @dataclass
@@ -18,6 +39,28 @@ class FillResult:
     fee: float
 
 
+@dataclass
+class FillBatch:
+    """Fills for many orders as parallel arrays, one entry per order.
+
+    Unfilled orders have `filled` False, zero size and fee, and a
+    `fill_seq` of -1. Filled orders carry the counter behind their fill id.
+    """
+
+    filled: npt.NDArray[np.bool_]
+    price: npt.NDArray[np.float64]
+    size: npt.NDArray[np.float64]
+    fee: npt.NDArray[np.float64]
+    fill_seq: npt.NDArray[np.int64]
+
+    def __len__(self) -> int:
+        return len(self.filled)
+
+    def fill_id(self, i: int) -> str:
+        """Fill id of order `i` (which must be filled)."""
+        return f"fill-{self.fill_seq[i]}"
+
+
 class FillModel:
     """Simulate order fills with slippage, latency, and partial fills."""
 
@@ -26,10 +69,20 @@ class FillModel:
         slippage_bps: float = 5.0,
         fill_probability: float = 1.0,
         fee_rate: float = 0.001,
+        mode: FillMode = "flat",
+        seed: int = 0,
     ) -> None:
         self.slippage_bps = slippage_bps / 10000.0
         self.fill_probability = fill_probability
         self.fee_rate = fee_rate
+        self.mode = mode
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self._fill_seq = 0
+
+    def _next_fill_id(self) -> str:
+        self._fill_seq += 1
+        return f"fill-{self._fill_seq}"
 
     def simulate_fill(
         self,
@@ -41,27 +94,77 @@ class FillModel:
         size: float,
         clock: SimClock,
         fill_prob_override: float | None = None,
+        book: OrderBookL2 | None = None,
+        limit_price: float | None = None,
     ) -> FillEvent | None:
-        """Simulate a fill. Returns FillEvent or None if not filled."""
-        import random
+        """Simulate a fill. Returns FillEvent or None if not filled.
+
+        In `depth` mode with a `book`, the order sweeps the opposite side up
+        to `limit_price`; the fill's `remaining_size` is what could not be
+        filled. Without a book, depth mode falls back to flat slippage.
+        """
+        t0 = _FILL.start()
+        try:
+            prob = fill_prob_override if fill_prob_override is not None else self.fill_probability
+            if self.rng.random() > prob:
+                return None
+
+            remaining = 0.0
+            if self.mode == "depth" and book is not None:
+                sweep = book.sweep(side, size, limit_price)
+                if sweep.filled <= 0:
+                    return None
+                fill_price = sweep.vwap
+                remaining = sweep.remaining
+                size = sweep.filled
+            else:
+                # Apply slippage: buy gets worse (higher), sell gets worse (lower)
+                slippage = price * self.slippage_bps
+                fill_price = price + slippage if side == "buy" else price - slippage
+            fee = fill_price * size * self.fee_rate
+
+            return FillEvent(
+                order_id=order_id,
+                fill_id=self._next_fill_id(),
+                symbol=symbol,
+                side=side,
+                venue=venue,
+                price=fill_price,
+                size=size,
+                fee=fee,
+                remaining_size=remaining,
+                timestamp=clock.now(),
+            )
+        finally:
+            _FILL.stop(t0)
 
+    def simulate_fills(
+        self,
+        side: npt.ArrayLike,
+        price: npt.ArrayLike,
+        size: npt.ArrayLike,
+        fill_prob_override: float | None = None,
+    ) -> FillBatch:
+        """Simulate flat-mode fills for arrays of orders.
+
+        `side` holds "buy"/"sell" per order. Orders are simulated in array
+        order, exactly as if `simulate_fill` had been called for each one.
+        The whole batch is one `fill_simulation` sample.
+        """
+        t0 = _FILL.start()
+        is_buy = np.asarray(side) == "buy"
+        px = np.asarray(price, dtype=np.float64)
+        qty = np.asarray(size, dtype=np.float64)
         prob = fill_prob_override if fill_prob_override is not None else self.fill_probability
-        if random.random() > prob:
-            return None
-
-        # Apply slippage: buy gets worse (higher), sell gets worse (lower)
-        slippage = price * self.slippage_bps
-        fill_price = price + slippage if side == "buy" else price - slippage
-        fee = fill_price * size * self.fee_rate
-
-        return FillEvent(
-            order_id=order_id,
-            fill_id=str(uuid.uuid4()),
-            symbol=symbol,
-            side=side,
-            venue=venue,
-            price=fill_price,
-            size=size,
-            fee=fee,
-            timestamp=clock.now(),
-        )
+        filled = self.rng.random(len(px)) <= prob
+
+        slippage = px * self.slippage_bps
+        fill_price = np.where(is_buy, px + slippage, px - slippage)
+        fill_size = np.where(filled, qty, 0.0)
+        fee = fill_price * fill_size * self.fee_rate
+
+        fill_seq = np.full(len(px), -1, dtype=np.int64)
+        fill_seq[filled] = self._fill_seq + np.arange(1, int(filled.sum()) + 1)
+        self._fill_seq += int(filled.sum())
+        _FILL.stop(t0)
+        return FillBatch(filled, fill_price, fill_size, fee, fill_seq)
@@ -0,0 +1,70 @@
+"""Per-venue latency model for order entry and market data.
+
+Each venue has its own order-entry latency (strategy to venue) and
+market-data latency (venue to strategy), sampled per message from a fixed,
+exponential or lognormal distribution. Samples come from a seeded
+generator, so latency-aware runs are reproducible.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Literal
+
+import numpy as np
+
+LatencyDistribution = Literal["fixed", "exponential", "lognormal"]
+
+
+@dataclass(frozen=True)
+class VenueLatency:
+    """Latency distributions for one venue, in milliseconds.
+
+    `fixed` always returns the mean. `exponential` has the given mean.
+    `lognormal` has the given mean and `jitter_ms` standard deviation.
+    """
+
+    order_entry_ms: float = 0.0
+    market_data_ms: float = 0.0
+    jitter_ms: float = 0.0
+    distribution: LatencyDistribution = "fixed"
+
+
+class LatencyModel:
+    """Sample order-entry and market-data delays per venue."""
+
+    def __init__(
+        self,
+        venues: Mapping[str, VenueLatency] | None = None,
+        default: VenueLatency | None = None,
+        seed: int = 0,
+    ) -> None:
+        self.venues = dict(venues or {})
+        self.default = default or VenueLatency()
+        self.rng = np.random.default_rng(seed)
+
+    def venue(self, name: str) -> VenueLatency:
+        """Latency settings for a venue (the default if not configured)."""
+        return self.venues.get(name, self.default)
+
+    def _sample(self, mean_ms: float, config: VenueLatency) -> timedelta:
+        if mean_ms <= 0:
+            return timedelta(0)
+        if config.distribution == "exponential":
+            ms = self.rng.exponential(mean_ms)
+        elif config.distribution == "lognormal" and config.jitter_ms > 0:
+            sigma2 = np.log1p((config.jitter_ms / mean_ms) ** 2)
+            ms = self.rng.lognormal(np.log(mean_ms) - sigma2 / 2, np.sqrt(sigma2))
+        else:
+            ms = mean_ms
+        return timedelta(milliseconds=float(ms))
+
+    def order_delay(self, venue: str) -> timedelta:
+        """Time for an order to reach `venue`."""
+        config = self.venue(venue)
+        return self._sample(config.order_entry_ms, config)
+
+    def market_data_delay(self, venue: str) -> timedelta:
+        """Time for a market-data update from `venue` to reach the strategy."""
+        config = self.venue(venue)
+        return self._sample(config.market_data_ms, config)
@@ -1,17 +1,57 @@
 """Paper broker: simulate order execution without real exchange connection."""
 
 import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
 
-from ai_arb_lab.core.clock import SimClock
-from ai_arb_lab.core.events import FillEvent, OrderEvent
-from ai_arb_lab.execution.fill_model import FillModel
+import numpy as np
+import numpy.typing as npt
+
+from ai_arb_lab.core.book import OrderBookL2
+from ai_arb_lab.core.clock import SimClock, to_ns
+from ai_arb_lab.core.events import FillEvent, OrderbookEvent, OrderEvent
+from ai_arb_lab.core.ledger import PositionLedger
+from ai_arb_lab.core.scheduler import EventScheduler
+from ai_arb_lab.execution.fill_model import FillBatch, FillModel
+from ai_arb_lab.execution.latency import LatencyModel
 from ai_arb_lab.strategies.base import Signal
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PairFills:
+    """Simulated buy and sell legs of many two-leg signals."""
+
+    buy: FillBatch
+    sell: FillBatch
+
+    def __len__(self) -> int:
+        return len(self.buy)
+
+    @property
+    def cash(self) -> npt.NDArray[np.float64]:
+        """Capital change per signal if it is executed."""
+        buy_cost = self.buy.price * self.buy.size + self.buy.fee
+        sell_proceeds = self.sell.price * self.sell.size - self.sell.fee
+        return sell_proceeds - buy_cost
+
+
+def fill_cash(fill: FillEvent) -> float:
+    """Capital change from one fill: proceeds of a sell, minus the cost of a buy."""
+    notional = fill.price * fill.size
+    return notional - fill.fee if fill.side == "sell" else -(notional + fill.fee)
+
+
 class PaperBroker:
-    """Simulate order execution. No real orders are sent."""
+    """Simulate order execution. No real orders are sent.
+
+    Feed orderbook events to `on_orderbook` to keep per-venue L2 books; a
+    fill model in `depth` mode then fills each leg against its venue's book.
+    `schedule_order` models order-entry latency on an `EventScheduler`.
+    Every fill is booked in `ledger`, which the snapshots also mark to mid.
+    """
 
     def __init__(
         self,
@@ -21,8 +61,39 @@ class PaperBroker:
         self.initial_capital = initial_capital
         self.capital = initial_capital
         self.fill_model = fill_model or FillModel()
-        self._positions: dict[str, float] = {}
+        self.ledger = PositionLedger()
         self._order_id = 0
+        self.books: dict[tuple[str, str], OrderBookL2] = {}
+
+    def on_orderbook(self, event: OrderbookEvent) -> None:
+        """Replace the venue's L2 book with a snapshot and mark its position."""
+        key = (event.venue, event.symbol)
+        book = self.books.get(key)
+        if book is None:
+            book = self.books[key] = OrderBookL2(event.venue, event.symbol)
+        book.apply(event)
+        self.mark(event)
+
+    def mark(self, event: OrderbookEvent) -> None:
+        """Mark the ledger to a snapshot's mid without touching the books.
+
+        Brokers that share one `books` dict apply each snapshot once (via
+        `on_orderbook` on any of them) and only mark the others.
+        """
+        self.ledger.mark(
+            event.venue,
+            event.symbol,
+            (event.bid_price + event.ask_price) / 2,
+            to_ns(event.timestamp),
+        )
+
+    @property
+    def can_batch(self) -> bool:
+        """True when `simulate_batch` gives the same fills as `submit_order`.
+
+        Depth-mode fills against maintained books need the per-order path.
+        """
+        return self.fill_model.mode == "flat" or not self.books
 
     def _next_order_id(self) -> str:
         self._order_id += 1
@@ -33,7 +104,11 @@ class PaperBroker:
         signal: Signal,
         clock: SimClock,
     ) -> tuple[OrderEvent | None, FillEvent | None]:
-        """Submit buy order on venue_buy, then sell on venue_sell. Returns order and fill events."""
+        """Submit buy order on venue_buy, then sell on venue_sell. Returns order and fill events.
+
+        Both legs are booked, but only the buy order and fill are returned.
+        `AsyncPaperBroker.submit` runs the legs concurrently and returns both.
+        """
         order_id = self._next_order_id()
 
         # Buy leg
@@ -54,11 +129,11 @@ class PaperBroker:
             price=signal.price_buy,
             size=signal.size,
             clock=clock,
+            book=self.books.get((signal.venue_buy, signal.symbol)),
         )
 
         if buy_fill:
-            self.capital -= buy_fill.price * buy_fill.size + buy_fill.fee
-            logger.info("Paper fill: %s %s @ %s", buy_fill.side, buy_fill.size, buy_fill.price)
+            self._apply_fill(buy_fill)
 
         # Sell leg (simplified: assume we can sell immediately)
         sell_order_id = self._next_order_id()
@@ -70,11 +145,192 @@ class PaperBroker:
             price=signal.price_sell,
             size=signal.size,
             clock=clock,
+            book=self.books.get((signal.venue_sell, signal.symbol)),
         )
 
         if sell_fill:
-            self.capital += sell_fill.price * sell_fill.size - sell_fill.fee
-            logger.info("Paper fill: %s %s @ %s", sell_fill.side, sell_fill.size, sell_fill.price)
+            self._apply_fill(sell_fill)
 
         # Return first order and first fill for simplicity (caller can handle both legs)
         return buy_order, buy_fill
+
+    def _apply_fill(self, fill: FillEvent) -> None:
+        self.capital += fill_cash(fill)
+        self.ledger.on_fill(fill)
+        logger.debug("Paper fill: %s %s @ %s", fill.side, fill.size, fill.price)
+
+    def schedule_order(
+        self,
+        signal: Signal,
+        scheduler: EventScheduler,
+        latency: LatencyModel,
+        on_fill: Callable[[FillEvent], None] | None = None,
+    ) -> list[OrderEvent]:
+        """Send both legs through `scheduler`, each delayed by its venue's latency.
+
+        A leg fills with `execute_order` when it reaches its venue, against
+        that venue's book at that moment. `on_fill` receives every fill.
+        Returns the buy and sell orders.
+        """
+        orders = []
+        legs = (
+            ("buy", signal.venue_buy, signal.price_buy),
+            ("sell", signal.venue_sell, signal.price_sell),
+        )
+        for side, venue, price in legs:
+            order = OrderEvent(
+                order_id=self._next_order_id(),
+                symbol=signal.symbol,
+                side=side,
+                venue=venue,
+                price=price,
+                size=signal.size,
+                timestamp=scheduler.now(),
+            )
+            scheduler.schedule_in(
+                latency.order_delay(venue), self._on_arrival, order, scheduler.clock, on_fill
+            )
+            orders.append(order)
+        return orders
+
+    def execute_order(
+        self,
+        order: OrderEvent,
+        clock: SimClock,
+        fill_prob_override: float | None = None,
+    ) -> FillEvent | None:
+        """Fill `order` against its venue's book as it stands now and book the fill.
+
+        In flat mode the order takes the current best opposite price (its
+        own price if the venue has no book). In depth mode it sweeps the
+        book. The fill is stamped with `clock`'s time.
+        """
+        book = self.books.get((order.venue, order.symbol))
+        price = order.price
+        if book is not None:
+            top = book.best_ask() if order.side == "buy" else book.best_bid()
+            if top is not None:
+                price = top[0]
+        fill = self.fill_model.simulate_fill(
+            order_id=order.order_id,
+            symbol=order.symbol,
+            side=order.side,
+            venue=order.venue,
+            price=price,
+            size=order.size,
+            clock=clock,
+            fill_prob_override=fill_prob_override,
+            book=book,
+        )
+        if fill is not None:
+            self._apply_fill(fill)
+        return fill
+
+    def _on_arrival(
+        self,
+        order: OrderEvent,
+        clock: SimClock,
+        on_fill: Callable[[FillEvent], None] | None,
+    ) -> None:
+        fill = self.execute_order(order, clock)
+        if fill is not None and on_fill is not None:
+            on_fill(fill)
+
+    def simulate_batch(
+        self,
+        price_buy: npt.ArrayLike,
+        price_sell: npt.ArrayLike,
+        size: npt.ArrayLike,
+    ) -> PairFills:
+        """Simulate both legs of many signals without touching capital.
+
+        Legs are interleaved (buy, sell, buy, ...) in one fill-model call, so
+        the draws match calling `submit_order` for every signal in order.
+        Pass the result to `settle_batch` with the signals actually executed.
+        """
+        buy_px = np.asarray(price_buy, dtype=np.float64)
+        n = len(buy_px)
+        prices = np.column_stack([buy_px, np.asarray(price_sell, dtype=np.float64)]).ravel()
+        sizes = np.repeat(np.broadcast_to(np.asarray(size, dtype=np.float64), n), 2)
+        sides = np.tile(np.array(["buy", "sell"]), n)
+        legs = self.fill_model.simulate_fills(sides, prices, sizes)
+
+        def leg(offset: int) -> FillBatch:
+            return FillBatch(
+                filled=legs.filled[offset::2],
+                price=legs.price[offset::2],
+                size=legs.size[offset::2],
+                fee=legs.fee[offset::2],
+                fill_seq=legs.fill_seq[offset::2],
+            )
+
+        return PairFills(buy=leg(0), sell=leg(1))
+
+    def settle_signal(
+        self,
+        fills: PairFills,
+        i: int,
+        symbol: str,
+        venue_buy: str,
+        venue_sell: str,
+        timestamp: datetime,
+    ) -> FillEvent | None:
+        """Book signal `i` of a batch and return its buy-leg fill.
+
+        Capital, the ledger and order ids advance exactly as if the signal
+        had gone through `submit_order`, so risk checks between calls see
+        the same state on both paths.
+        """
+        order_id = self._order_id + 1
+        self._order_id += 2
+        ts_ns = to_ns(timestamp)
+        buy, sell = fills.buy, fills.sell
+        event = None
+        if buy.filled[i]:
+            price, size, fee = float(buy.price[i]), float(buy.size[i]), float(buy.fee[i])
+            self.capital -= price * size + fee
+            self.ledger.apply(venue_buy, symbol, "buy", price, size, fee, ts_ns)
+            # Fields come from validated arrays, so skip per-event validation
+            event = FillEvent.model_construct(
+                order_id=f"ord-{order_id}",
+                fill_id=buy.fill_id(i),
+                symbol=symbol,
+                side="buy",
+                venue=venue_buy,
+                price=price,
+                size=size,
+                fee=fee,
+                remaining_size=0.0,
+                timestamp=timestamp,
+                correlation_id=None,
+            )
+        if sell.filled[i]:
+            price, size, fee = float(sell.price[i]), float(sell.size[i]), float(sell.fee[i])
+            self.capital += price * size - fee
+            self.ledger.apply(venue_sell, symbol, "sell", price, size, fee, ts_ns)
+        return event
+
+    def settle_batch(
+        self,
+        fills: PairFills,
+        executed: npt.NDArray[np.bool_],
+        symbols: Sequence[str],
+        venues_buy: Sequence[str],
+        venues_sell: Sequence[str],
+        timestamps: Sequence[datetime],
+    ) -> list[FillEvent]:
+        """Book the executed signals of a batch and return their buy-leg fills.
+
+        Equivalent to `settle_signal` for each executed signal in order.
+        Like `submit_order`, only buy-leg fills are returned.
+        """
+        events = []
+        idx = np.flatnonzero(executed).tolist()
+        for i in idx:
+            event = self.settle_signal(
+                fills, i, symbols[i], venues_buy[i], venues_sell[i], timestamps[i]
+            )
+            if event is not None:
+                events.append(event)
+        logger.info("Paper batch: %d signals, %d buy fills", len(idx), len(events))
+        return events
@@ -0,0 +1,161 @@
+"""Paper trading session driven by a `SimClock`.
+
+A session feeds orderbook events to the broker's books and the strategy's
+`on_orderbook`, risk-checks each signal and submits it to the paper broker.
+Before each event the clock waits until that event's timestamp. In `afap`
+mode this is an instant jump. In `paced` mode it sleeps in scaled wall-clock
+time. A `MetricsAccumulator` marks equity on every orderbook event and
+records each filled signal's P&L, so `stats.metrics` is exact in O(1) memory.
+With an `AsyncPaperBroker`, approved signals execute as background tasks
+while the replay continues, and `run` waits for them before returning. `set_mode` switches between the two while the session runs, so one
+session can fast-forward to a point of interest and then replay it at 1x,
+10x or 100x. The clock's drift stats then show whether the pipeline kept up.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ai_arb_lab.core.clock import ClockDrift, ClockMode, SimClock, to_ns
+from ai_arb_lab.core.events import Event, OrderbookEvent
+from ai_arb_lab.core.telemetry import STRATEGY_EVALUATE, TELEMETRY
+from ai_arb_lab.execution.async_broker import AsyncPaperBroker, PairResult
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.reporting.metrics import BacktestMetrics, MetricsAccumulator
+from ai_arb_lab.risk.kill_switch import KillSwitch
+from ai_arb_lab.risk.limits import RiskLimits
+from ai_arb_lab.strategies.base import BaseStrategy
+
+logger = logging.getLogger(__name__)
+
+_EVALUATE = TELEMETRY.stage(STRATEGY_EVALUATE)
+
+
+@dataclass
+class SessionStats:
+    """Counters for a paper session."""
+
+    events: int = 0
+    signals: int = 0
+    orders: int = 0
+    fills: int = 0
+    drift: ClockDrift | None = field(default=None)
+    metrics: BacktestMetrics | None = field(default=None)
+
+
+class PaperSession:
+    """Run a strategy against an event stream with paper execution."""
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        broker: PaperBroker | None = None,
+        risk_limits: RiskLimits | None = None,
+        kill_switch: KillSwitch | None = None,
+        clock: SimClock | None = None,
+    ) -> None:
+        self.strategy = strategy
+        self.broker = broker or PaperBroker()
+        self.risk_limits = risk_limits or RiskLimits(
+            max_exposure=self.broker.initial_capital * 0.5,
+            initial_capital=self.broker.initial_capital,
+        )
+        if self.risk_limits.ledger is None:
+            self.risk_limits.ledger = self.broker.ledger
+        self.kill_switch = kill_switch or KillSwitch(enabled=True)
+        self.clock = clock or SimClock()
+        self.stats = SessionStats()
+        self.metrics = MetricsAccumulator(self.broker.capital)
+        self._started = False
+
+    def set_mode(self, mode: ClockMode, speed_multiplier: float | None = None) -> None:
+        """Switch between `afap` and `paced` (optionally changing speed) mid-run."""
+        self.clock.set_mode(mode, speed_multiplier)
+        logger.info("Clock mode: %s at %sx", mode, self.clock.speed_multiplier)
+
+    def on_event(self, event: Event) -> None:
+        """Handle one event at the current clock time."""
+        self.stats.events += 1
+        TELEMETRY.count("events")
+        features = self.strategy.features
+        if features is not None:
+            features.update(event)
+        if not isinstance(event, OrderbookEvent):
+            return
+        self.broker.on_orderbook(event)
+        self.metrics.mark(self.broker.capital, self.clock.now_ns)
+        t0 = _EVALUATE.start()
+        signal = self.strategy.on_orderbook(event)
+        _EVALUATE.stop(t0)
+        if signal is None:
+            return
+        self.stats.signals += 1
+        TELEMETRY.count("signals")
+        ok, reason = self.risk_limits.check(signal, self.broker.capital)
+        if ok:
+            ok, reason = self.kill_switch.check()
+        if not ok:
+            logger.debug("Signal rejected: %s", reason)
+            return
+        self.stats.orders += 1
+        TELEMETRY.count("orders")
+        if isinstance(self.broker, AsyncPaperBroker):
+            self.broker.submit_nowait(signal, self.clock).add_done_callback(self._on_result)
+            return
+        before = self.broker.capital
+        _, fill = self.broker.submit_order(signal, self.clock)
+        if self.broker.capital != before:
+            self.metrics.mark(self.broker.capital, self.clock.now_ns)
+        if fill is not None:
+            self.stats.fills += 1
+            TELEMETRY.count("fills")
+            self.metrics.record_trade(self.broker.capital - before)
+
+    def _on_result(self, task: "asyncio.Task[PairResult]") -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Signal execution failed: %s", error)
+            return
+        result = task.result()
+        self.metrics.mark(self.broker.capital, self.clock.now_ns)
+        if result.buy.filled_size > 0:
+            self.stats.fills += 1
+            TELEMETRY.count("fills")
+            self.metrics.record_trade(result.cash)
+
+    async def _advance(self, event: Event) -> None:
+        ts = to_ns(event.timestamp)
+        if not self._started:
+            self.clock.set_ns(ts)
+            self._started = True
+        elif ts > self.clock.now_ns:
+            await self.clock.wait_until(ts)
+
+    async def run(
+        self,
+        events: Iterable[Event] | AsyncIterable[Event],
+        until: datetime | None = None,
+    ) -> SessionStats:
+        """Process events in order, stopping at the first one at or after `until`."""
+        until_ns = to_ns(until) if until is not None else None
+        if isinstance(events, AsyncIterable):
+            async for event in events:
+                if until_ns is not None and to_ns(event.timestamp) >= until_ns:
+                    break
+                await self._advance(event)
+                self.on_event(event)
+        else:
+            for event in events:
+                if until_ns is not None and to_ns(event.timestamp) >= until_ns:
+                    break
+                await self._advance(event)
+                self.on_event(event)
+        if isinstance(self.broker, AsyncPaperBroker):
+            await self.broker.drain()
+        self.stats.drift = self.clock.drift()
+        self.stats.metrics = self.metrics.to_metrics()
+        return self.stats
@@ -1,9 +1,17 @@
 """Reporting: metrics, report rendering."""
 
-from ai_arb_lab.reporting.metrics import BacktestMetrics
+from ai_arb_lab.reporting.metrics import (
+    BacktestMetrics,
+    EquityCurve,
+    MetricsAccumulator,
+    StressMetrics,
+)
 from ai_arb_lab.reporting.render import render_markdown_report
 
 __all__ = [
     "BacktestMetrics",
+    "EquityCurve",
+    "MetricsAccumulator",
+    "StressMetrics",
     "render_markdown_report",
 ]
@@ -2,6 +2,10 @@
 
 from dataclasses import dataclass
 
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
 
 @dataclass
 class BacktestMetrics:
@@ -15,6 +19,9 @@ class BacktestMetrics:
     win_count: int
     max_drawdown_pct: float
     sharpe_ratio: float | None = None
+    sortino_ratio: float | None = None
+    win_rate: float | None = None
+    profit_factor: float | None = None
 
     def to_dict(self) -> dict[str, float | int | None]:
         """Export as dict for JSON serialization."""
@@ -27,6 +34,9 @@ class BacktestMetrics:
             "win_count": self.win_count,
             "max_drawdown_pct": self.max_drawdown_pct,
             "sharpe_ratio": self.sharpe_ratio,
+            "sortino_ratio": self.sortino_ratio,
+            "win_rate": self.win_rate,
+            "profit_factor": self.profit_factor,
         }
 
     @classmethod
@@ -38,28 +48,324 @@ class BacktestMetrics:
         win_count: int,
         returns: list[float] | None = None,
     ) -> "BacktestMetrics":
-        """Compute metrics from backtest results."""
-        total_return = final_capital - initial_capital
-        total_return_pct = total_return / initial_capital if initial_capital else 0
-
-        # Simplified max drawdown (would need equity curve for accurate)
-        max_dd = abs(min(0, total_return_pct))
-
-        sharpe = None
-        if returns and len(returns) > 1:
-            import numpy as np
-
-            arr = np.array(returns)
-            if arr.std() > 0:
-                sharpe = float(arr.mean() / arr.std() * (252**0.5))  # Annualized
+        """Compute metrics from end-of-run totals and optional per-period returns.
 
+        With `returns` (e.g. daily), drawdown, Sharpe and Sortino come from
+        the compounded equity path, annualized with 252 periods. Without
+        them only the end points are known, so the drawdown is the final
+        loss, if any. Engines feed a `MetricsAccumulator` instead.
+        """
+        if returns:
+            acc = MetricsAccumulator(initial_capital, periods_per_year=252, curve_points=0)
+            acc.mark_many(initial_capital * np.cumprod(1.0 + np.asarray(returns, dtype=np.float64)))
+            max_dd = acc.max_drawdown_pct
+            sharpe, sortino = acc.sharpe_ratio, acc.sortino_ratio
+        else:
+            max_dd = (
+                max(0.0, (initial_capital - final_capital) / initial_capital)
+                if initial_capital
+                else 0.0
+            )
+            sharpe = sortino = None
+        total_return = final_capital - initial_capital
         return cls(
             initial_capital=initial_capital,
             final_capital=final_capital,
             total_return=total_return,
-            total_return_pct=total_return_pct,
+            total_return_pct=total_return / initial_capital if initial_capital else 0,
             trade_count=trade_count,
             win_count=win_count,
             max_drawdown_pct=max_dd,
             sharpe_ratio=sharpe,
+            sortino_ratio=sortino,
+            win_rate=win_count / trade_count if trade_count else None,
+        )
+
+
+# Nanoseconds in a 365-day year, for annualizing from tick timestamps
+_NS_PER_YEAR = 365 * 24 * 3600 * 10**9
+
+
+class EquityCurve:
+    """Equity samples kept to at most `max_points` by uniform decimation.
+
+    Every `stride`-th update is stored. When the buffer is full, every
+    other stored point is dropped and the stride doubles, so memory stays
+    bounded however long the run and the kept points stay evenly spaced in
+    update count. The most recent update is always included in `to_frame`.
+    """
+
+    def __init__(self, max_points: int = 2048) -> None:
+        self.max_points = max(max_points, 2)
+        self.stride = 1
+        self.updates = 0
+        self._ts = np.empty(min(64, self.max_points), dtype=np.int64)
+        self._equity = np.empty(len(self._ts), dtype=np.float64)
+        self._len = 0
+        self._last: tuple[int, float] | None = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._ts):
+            return
+        capacity = min(self.max_points, max(size, 2 * len(self._ts)))
+        self._ts = np.resize(self._ts, capacity)
+        self._equity = np.resize(self._equity, capacity)
+
+    def _decimate(self) -> None:
+        kept = (self._len + 1) // 2
+        self._ts[:kept] = self._ts[: self._len : 2]
+        self._equity[:kept] = self._equity[: self._len : 2]
+        self._len = kept
+        self.stride *= 2
+
+    def append(self, ts_ns: int, equity: float) -> None:
+        """Add one update."""
+        if self.updates % self.stride == 0:
+            if self._len == self.max_points:
+                self._decimate()
+            if self.updates % self.stride == 0:
+                self._reserve(self._len + 1)
+                self._ts[self._len] = ts_ns
+                self._equity[self._len] = equity
+                self._len += 1
+        self.updates += 1
+        self._last = (ts_ns, equity)
+
+    def extend(self, ts_ns: npt.ArrayLike, equity: npt.ArrayLike) -> None:
+        """Add many updates in order."""
+        ts = np.asarray(ts_ns, dtype=np.int64)
+        values = np.asarray(equity, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return
+        position = self.updates + np.arange(n)
+        while True:
+            take = np.flatnonzero(position % self.stride == 0)
+            if self._len + len(take) <= self.max_points:
+                break
+            self._decimate()
+        end = self._len + len(take)
+        self._reserve(end)
+        self._ts[self._len : end] = ts[take]
+        self._equity[self._len : end] = values[take]
+        self._len = end
+        self.updates += n
+        self._last = (int(ts[-1]), float(values[-1]))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Stored points plus the latest update, as `timestamp`/`equity` columns."""
+        ts = self._ts[: self._len]
+        equity = self._equity[: self._len]
+        if self._last is not None and (self._len == 0 or (self.updates - 1) % self.stride):
+            ts = np.append(ts, self._last[0])
+            equity = np.append(equity, self._last[1])
+        return pd.DataFrame({"timestamp": pd.to_datetime(ts, unit="ns"), "equity": equity})
+
+
+class MetricsAccumulator:
+    """Streaming backtest metrics in O(1) time and memory per update.
+
+    Feed it every mark-to-market tick with `mark` (or `mark_many` for an
+    array of ticks) and every closed trade's realized P&L with
+    `record_trade`. It keeps the running peak and maximum drawdown, the
+    Welford mean and variance of tick returns (Sharpe) and their downside
+    deviation (Sortino), and win/loss counts, without storing ticks. Only
+    `curve`, a bounded downsampled `EquityCurve`, keeps any history.
+
+    Sharpe and Sortino are annualized by `periods_per_year`. When it is not
+    given, it is estimated from the tick timestamps (ticks per year over the
+    marked span); without timestamps the ratios are per tick.
+    """
+
+    def __init__(
+        self,
+        initial_capital: float,
+        periods_per_year: float | None = None,
+        curve_points: int = 2048,
+    ) -> None:
+        self.initial_capital = initial_capital
+        self.periods_per_year = periods_per_year
+        self.curve = EquityCurve(curve_points) if curve_points > 0 else None
+        self.equity = initial_capital
+        self.peak = initial_capital
+        self.max_drawdown_pct = 0.0
+        self.ticks = 0
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._downside_sq = 0.0
+        self._first_ns: int | None = None
+        self._last_ns: int | None = None
+        self.trade_count = 0
+        self.win_count = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+
+    def mark(self, equity: float, ts_ns: int | None = None) -> None:
+        """Record the account's marked-to-market equity at one tick."""
+        prev = self.equity
+        if prev > 0:
+            r = equity / prev - 1.0
+            self._n += 1
+            delta = r - self._mean
+            self._mean += delta / self._n
+            self._m2 += delta * (r - self._mean)
+            if r < 0:
+                self._downside_sq += r * r
+        self.equity = equity
+        if equity > self.peak:
+            self.peak = equity
+        elif self.peak > 0:
+            drawdown = (self.peak - equity) / self.peak
+            if drawdown > self.max_drawdown_pct:
+                self.max_drawdown_pct = drawdown
+        self.ticks += 1
+        if ts_ns is not None:
+            if self._first_ns is None:
+                self._first_ns = ts_ns
+            self._last_ns = ts_ns
+        if self.curve is not None:
+            self.curve.append(ts_ns if ts_ns is not None else self.ticks, equity)
+
+    def mark_many(self, equity: npt.ArrayLike, ts_ns: npt.ArrayLike | None = None) -> None:
+        """Record many ticks in order; same result as calling `mark` for each."""
+        values = np.asarray(equity, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return
+        prev = np.concatenate(([self.equity], values[:-1]))
+        valid = prev > 0
+        returns = values[valid] / prev[valid] - 1.0
+        if len(returns):
+            # Chan et al. pairwise merge of the batch's mean and M2
+            n_b = len(returns)
+            mean_b = float(returns.mean())
+            m2_b = float(((returns - mean_b) ** 2).sum())
+            total = self._n + n_b
+            delta = mean_b - self._mean
+            self._mean += delta * n_b / total
+            self._m2 += m2_b + delta * delta * self._n * n_b / total
+            self._n = total
+            self._downside_sq += float((np.minimum(returns, 0.0) ** 2).sum())
+        peaks = np.maximum.accumulate(np.concatenate(([self.peak], values)))[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            drawdowns = np.where(peaks > 0, (peaks - values) / peaks, 0.0)
+        self.max_drawdown_pct = max(self.max_drawdown_pct, float(drawdowns.max()))
+        self.peak = float(peaks[-1])
+        self.equity = float(values[-1])
+        if ts_ns is not None:
+            ts = np.asarray(ts_ns, dtype=np.int64)
+            if self._first_ns is None:
+                self._first_ns = int(ts[0])
+            self._last_ns = int(ts[-1])
+        else:
+            ts = self.ticks + 1 + np.arange(n, dtype=np.int64)
+        self.ticks += n
+        if self.curve is not None:
+            self.curve.extend(ts, values)
+
+    def record_trade(self, pnl: float) -> None:
+        """Record one closed trade's realized P&L (a win when positive)."""
+        self.trade_count += 1
+        if pnl > 0:
+            self.win_count += 1
+            self.gross_profit += pnl
+        else:
+            self.gross_loss -= pnl
+
+    def record_trades(self, pnl: npt.ArrayLike) -> None:
+        """Record many closed trades."""
+        values = np.asarray(pnl, dtype=np.float64)
+        wins = values > 0
+        self.trade_count += len(values)
+        self.win_count += int(wins.sum())
+        self.gross_profit += float(values[wins].sum())
+        self.gross_loss -= float(values[~wins].sum())
+
+    @property
+    def win_rate(self) -> float | None:
+        """Share of closed trades with positive P&L."""
+        return self.win_count / self.trade_count if self.trade_count else None
+
+    @property
+    def profit_factor(self) -> float | None:
+        """Gross profit over gross loss (None without losing trades)."""
+        return self.gross_profit / self.gross_loss if self.gross_loss > 0 else None
+
+    def _annualization(self) -> float:
+        if self.periods_per_year is not None:
+            return float(np.sqrt(self.periods_per_year))
+        if self._first_ns is not None and self._last_ns is not None:
+            span = self._last_ns - self._first_ns
+            if span > 0 and self._n > 1:
+                return float(np.sqrt(self._n * _NS_PER_YEAR / span))
+        return 1.0
+
+    @property
+    def sharpe_ratio(self) -> float | None:
+        """Mean over standard deviation of tick returns, annualized."""
+        if self._n < 2 or self._m2 <= 0:
+            return None
+        std = float(np.sqrt(self._m2 / self._n))
+        return self._mean / std * self._annualization()
+
+    @property
+    def sortino_ratio(self) -> float | None:
+        """Mean over downside deviation of tick returns, annualized."""
+        if self._n < 2 or self._downside_sq <= 0:
+            return None
+        downside = float(np.sqrt(self._downside_sq / self._n))
+        return self._mean / downside * self._annualization()
+
+    def to_metrics(self) -> "BacktestMetrics":
+        """Snapshot as `BacktestMetrics`."""
+        total_return = self.equity - self.initial_capital
+        return BacktestMetrics(
+            initial_capital=self.initial_capital,
+            final_capital=self.equity,
+            total_return=total_return,
+            total_return_pct=total_return / self.initial_capital if self.initial_capital else 0,
+            trade_count=self.trade_count,
+            win_count=self.win_count,
+            max_drawdown_pct=self.max_drawdown_pct,
+            sharpe_ratio=self.sharpe_ratio,
+            sortino_ratio=self.sortino_ratio,
+            win_rate=self.win_rate,
+            profit_factor=self.profit_factor,
         )
+
+
+@dataclass
+class StressMetrics:
+    """Monte Carlo P&L distribution for one backtest's signals."""
+
+    paths: int
+    signals: int
+    confidence: float
+    mean_pnl: float
+    std_pnl: float
+    percentiles: dict[str, float]
+    var: float
+    cvar: float
+    ruin_probability: float
+    ruin_threshold: float
+    fill_rate: float
+
+    def to_dict(self) -> dict[str, float | int | dict[str, float]]:
+        """Export as dict for JSON serialization."""
+        return {
+            "paths": self.paths,
+            "signals": self.signals,
+            "confidence": self.confidence,
+            "mean_pnl": self.mean_pnl,
+            "std_pnl": self.std_pnl,
+            "percentiles": dict(self.percentiles),
+            "var": self.var,
+            "cvar": self.cvar,
+            "ruin_probability": self.ruin_probability,
+            "ruin_threshold": self.ruin_threshold,
+            "fill_rate": self.fill_rate,
+        }
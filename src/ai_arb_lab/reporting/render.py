@@ -2,11 +2,15 @@
 
 from pathlib import Path
 
-from ai_arb_lab.reporting.metrics import BacktestMetrics
+from ai_arb_lab.reporting.metrics import BacktestMetrics, StressMetrics
 
 
-def render_markdown_report(metrics: BacktestMetrics, title: str = "Backtest Report") -> str:
-    """Render metrics as Markdown."""
+def render_markdown_report(
+    metrics: BacktestMetrics,
+    title: str = "Backtest Report",
+    stress: StressMetrics | None = None,
+) -> str:
+    """Render metrics as Markdown, with an optional Monte Carlo stress section."""
     lines = [
         f"# {title}",
         "",
@@ -17,14 +21,43 @@ def render_markdown_report(metrics: BacktestMetrics, title: str = "Backtest Repo
         f"- **Total Return**: {metrics.total_return:,.2f} ({metrics.total_return_pct:.2%})",
         f"- **Trade Count**: {metrics.trade_count}",
         f"- **Win Count**: {metrics.win_count}",
-        f"- **Max Drawdown**: {metrics.max_drawdown_pct:.2%}",
     ]
+    if metrics.win_rate is not None:
+        lines.append(f"- **Win Rate**: {metrics.win_rate:.2%}")
+    if metrics.profit_factor is not None:
+        lines.append(f"- **Profit Factor**: {metrics.profit_factor:.2f}")
+    lines.append(f"- **Max Drawdown**: {metrics.max_drawdown_pct:.2%}")
     if metrics.sharpe_ratio is not None:
         lines.append(f"- **Sharpe Ratio**: {metrics.sharpe_ratio:.2f}")
+    if metrics.sortino_ratio is not None:
+        lines.append(f"- **Sortino Ratio**: {metrics.sortino_ratio:.2f}")
     lines.append("")
+    if stress is not None:
+        lines.extend(_stress_lines(stress))
     return "\n".join(lines)
 
 
+def _stress_lines(stress: StressMetrics) -> list[str]:
+    level = f"{stress.confidence:.0%}"
+    lines = [
+        "## Stress Test (Monte Carlo)",
+        "",
+        f"- **Paths**: {stress.paths:,} over {stress.signals:,} signals",
+        f"- **Mean P&L**: {stress.mean_pnl:,.2f} (std {stress.std_pnl:,.2f})",
+        f"- **VaR ({level})**: {stress.var:,.2f}",
+        f"- **CVaR ({level})**: {stress.cvar:,.2f}",
+        f"- **Ruin Probability** (loss of {stress.ruin_threshold:,.2f}): "
+        f"{stress.ruin_probability:.2%}",
+        f"- **Leg Fill Rate**: {stress.fill_rate:.2%}",
+        "",
+        "| Percentile | P&L |",
+        "|------------|-----|",
+    ]
+    lines.extend(f"| {name} | {value:,.2f} |" for name, value in stress.percentiles.items())
+    lines.append("")
+    return lines
+
+
 def save_report(content: str, path: Path | str) -> Path:
     """Save report to file."""
     path = Path(path)
@@ -1,21 +1,39 @@
-"""Risk limits: max exposure, drawdown, daily loss.
+"""Risk limits: max exposure, drawdown, daily loss, per-venue position.
 
-All signals must pass these checks before simulated execution.
+All signals must pass these checks before simulated execution. With a
+`PositionLedger` attached, exposure, daily P&L and positions are read from
+it, so the limits reflect every fill; each check is a few attribute and dict
+lookups. Without one, the values set through `update` are used.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+import numpy as np
+import numpy.typing as npt
+
+from ai_arb_lab.core.ledger import PositionLedger
+from ai_arb_lab.core.telemetry import RISK_CHECK, TELEMETRY
 from ai_arb_lab.strategies.base import Signal
 
+_CHECK = TELEMETRY.stage(RISK_CHECK)
+
 
 @dataclass
 class RiskLimits:
-    """Enforce position and P&L limits."""
+    """Enforce position and P&L limits.
+
+    Exposure is the ledger's net exposure (directional risk summed over
+    venues) plus the notional of both legs of the new signal.
+    `max_position` caps the absolute quantity held per venue and symbol
+    after the signal; None disables it.
+    """
 
     max_exposure: float = 100_000.0
     max_drawdown_pct: float = 0.10
     max_daily_loss: float = 5_000.0
     initial_capital: float = 100_000.0
+    max_position: float | None = None
+    ledger: PositionLedger | None = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         self._current_exposure: float = 0.0
@@ -24,26 +42,75 @@ class RiskLimits:
 
     def check(self, signal: Signal, current_capital: float) -> tuple[bool, str]:
         """Check if signal passes risk limits. Returns (approved, reason)."""
-        notional = signal.price_buy * signal.size + signal.price_sell * signal.size
-        new_exposure = self._current_exposure + notional
+        t0 = _CHECK.start()
+        try:
+            ledger = self.ledger
+            if ledger is not None:
+                exposure = ledger.net_exposure
+                daily_pnl = ledger.daily_pnl
+            else:
+                exposure = self._current_exposure
+                daily_pnl = self._daily_pnl
+            size = signal.size
+            new_exposure = exposure + (signal.price_buy + signal.price_sell) * size
+
+            if new_exposure > self.max_exposure:
+                return False, f"Exposure {new_exposure:.0f} exceeds max {self.max_exposure:.0f}"
+
+            if current_capital > self._peak_capital:
+                self._peak_capital = current_capital
+            drawdown = (self._peak_capital - current_capital) / self._peak_capital
+            if drawdown > self.max_drawdown_pct:
+                return False, f"Drawdown {drawdown:.1%} exceeds max {self.max_drawdown_pct:.1%}"
+
+            if daily_pnl < -self.max_daily_loss:
+                return (
+                    False,
+                    f"Daily loss {abs(daily_pnl):.0f} exceeds max {self.max_daily_loss:.0f}",
+                )
 
-        if new_exposure > self.max_exposure:
-            return False, f"Exposure {new_exposure:.0f} exceeds max {self.max_exposure:.0f}"
+            if self.max_position is not None and ledger is not None:
+                symbol = signal.symbol
+                long_qty = ledger.quantity(signal.venue_buy, symbol) + size
+                short_qty = ledger.quantity(signal.venue_sell, symbol) - size
+                if long_qty > self.max_position or -short_qty > self.max_position:
+                    return False, f"Position exceeds max {self.max_position:g} per venue"
 
-        drawdown = (self._peak_capital - current_capital) / self._peak_capital
-        if drawdown > self.max_drawdown_pct:
-            return False, f"Drawdown {drawdown:.1%} exceeds max {self.max_drawdown_pct:.1%}"
+            return True, "OK"
+        finally:
+            _CHECK.stop(t0)
 
-        if self._daily_pnl < -self.max_daily_loss:
-            return (
-                False,
-                f"Daily loss {abs(self._daily_pnl):.0f} exceeds max {self.max_daily_loss:.0f}",
-            )
+    def check_batch(
+        self,
+        price_buy: npt.ArrayLike,
+        price_sell: npt.ArrayLike,
+        size: npt.ArrayLike,
+        current_capital: float,
+    ) -> npt.NDArray[np.bool_]:
+        """Screen many candidate signals against the current state at once.
 
-        return True, "OK"
+        Each candidate is checked on its own, as if it were the next signal:
+        approving one does not count against the others. Exposure and size
+        are per candidate; drawdown and daily loss are shared, so when
+        either is breached every candidate is rejected. Per-venue position
+        limits need venues and are left to `check`.
+        """
+        notional = (
+            np.asarray(price_buy, dtype=np.float64) + np.asarray(price_sell, dtype=np.float64)
+        ) * np.asarray(size, dtype=np.float64)
+        if self.ledger is not None:
+            exposure, daily_pnl = self.ledger.net_exposure, self.ledger.daily_pnl
+        else:
+            exposure, daily_pnl = self._current_exposure, self._daily_pnl
+        peak = max(self._peak_capital, current_capital)
+        drawdown = (peak - current_capital) / peak
+        if drawdown > self.max_drawdown_pct or daily_pnl < -self.max_daily_loss:
+            return np.zeros(notional.shape, dtype=np.bool_)
+        ok: npt.NDArray[np.bool_] = exposure + notional <= self.max_exposure
+        return ok
 
     def update(self, exposure: float, capital: float, daily_pnl: float) -> None:
-        """Update internal state after a fill or period end."""
+        """Update internal state after a fill or period end (used without a ledger)."""
         self._current_exposure = exposure
         self._peak_capital = max(self._peak_capital, capital)
         self._daily_pnl = daily_pnl
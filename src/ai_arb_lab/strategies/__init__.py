@@ -1,10 +1,22 @@
 """Strategy layer: arbitrage detection, cost model."""
 
-from ai_arb_lab.strategies.base import BaseStrategy, Signal
+from ai_arb_lab.strategies.base import BaseStrategy, Leg, Signal
 from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+from ai_arb_lab.strategies.stat_arb import EwmPairStats, RollingPairStats, StatArbStrategy
+from ai_arb_lab.strategies.top_of_book import Quote, TopOfBookIndex
+from ai_arb_lab.strategies.triangular import CurrencyGraph, Cycle, TriangularArbStrategy
 
 __all__ = [
     "BaseStrategy",
     "Signal",
     "SimpleSpreadStrategy",
+    "TopOfBookIndex",
+    "Quote",
+    "Leg",
+    "TriangularArbStrategy",
+    "CurrencyGraph",
+    "Cycle",
+    "StatArbStrategy",
+    "RollingPairStats",
+    "EwmPairStats",
 ]
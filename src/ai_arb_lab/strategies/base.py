@@ -1,9 +1,25 @@
 """Base strategy interface. All strategies extend this."""
 
+import math
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from ai_arb_lab.core.events import OrderbookEvent
+
+if TYPE_CHECKING:
+    from ai_arb_lab.data.features import FeatureStore
+
+
+class Leg(BaseModel):
+    """One conversion of a multi-leg signal."""
+
+    symbol: str
+    side: str  # "buy" | "sell"
+    venue: str
+    price: float
+    size: float
 
 
 class Signal(BaseModel):
@@ -18,18 +34,32 @@ class Signal(BaseModel):
     size: float
     expected_profit_bps: float
     rationale: str = ""
+    # Every leg in execution order, for signals with more than two (empty otherwise)
+    legs: list[Leg] = Field(default_factory=list)
 
 
 class BaseStrategy(ABC):
     """Abstract base for all strategies. Evaluates market data and emits signals."""
 
     strategy_id: str = "base"
+    # Shared features, updated by the session or backtest before each event
+    features: "FeatureStore | None" = None
 
     @abstractmethod
     def evaluate(self, market_data: dict[str, Any]) -> Signal | None:
         """Evaluate market data and return a signal if opportunity exists."""
         ...
 
+    def on_orderbook(self, event: OrderbookEvent) -> Signal | None:
+        """Event-driven entry point for a single orderbook update. Override to support streaming."""
+        return None
+
+    def feature(self, name: str, venue: str, symbol: str) -> float:
+        """Latest value of a feature from `features` (NaN without a store or data)."""
+        if self.features is None:
+            return math.nan
+        return self.features.get(name, venue, symbol)
+
     def reset(self) -> None:
         """Reset strategy state for new backtest run. Override in subclasses if needed."""
         pass
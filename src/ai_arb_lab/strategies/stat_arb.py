@@ -0,0 +1,327 @@
+"""Statistical (mean-reversion) arbitrage between two legs.
+
+A leg is a (venue, symbol) pair, so the strategy trades either the same
+symbol across two venues or two related symbols. Every quote update of
+either leg adds a sample `(x, y)` of log mid prices to a pair estimator,
+which keeps the means, variances and covariance of both series:
+
+- `RollingPairStats`: the last `window` samples in a ring buffer, with
+  windowed Welford updates (add the new sample, remove the evicted one),
+  recomputed exactly each time the buffer wraps to stop rounding drift.
+- `EwmPairStats`: exponentially weighted with `alpha = 2 / (window + 1)`.
+
+Both are O(1) per sample whatever the window. From them the hedge ratio
+is the regression slope `beta = cov(x, y) / var(y)`, the spread is
+`x - beta * y`, and its z-score uses the spread's mean and standard
+deviation over the same window (`mean_x - beta * mean_y` and
+`var_x - 2 * beta * cov + beta**2 * var_y`), so no spread history is kept.
+
+The strategy enters when `|z| >= entry_z`, selling the rich leg and buying
+the cheap one, and exits (reverses both legs) once `|z| <= exit_z`.
+"""
+
+import math
+from typing import Any, Literal
+
+import pandas as pd
+
+from ai_arb_lab.core.events import OrderbookEvent
+from ai_arb_lab.strategies.base import BaseStrategy, Leg, Signal
+
+StatsMode = Literal["window", "ewm"]
+SpreadPosition = Literal["flat", "long", "short"]
+
+
+class RollingPairStats:
+    """Windowed mean, variance and covariance of two series, O(1) per sample."""
+
+    def __init__(self, window: int) -> None:
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self._xs = [0.0] * self.window
+        self._ys = [0.0] * self.window
+        self._pos = 0
+        self.count = 0
+        self.mean_x = self.mean_y = 0.0
+        self._cxx = self._cyy = self._cxy = 0.0
+
+    def update(self, x: float, y: float) -> None:
+        """Add a sample, evicting the oldest once the window is full."""
+        pos = self._pos
+        if self.count == self.window:
+            # Remove the evicted sample: the inverse of adding it
+            ox, oy = self._xs[pos], self._ys[pos]
+            n = self.count - 1
+            mx = self.mean_x - (ox - self.mean_x) / n
+            my = self.mean_y - (oy - self.mean_y) / n
+            self._cxx -= (ox - mx) * (ox - self.mean_x)
+            self._cyy -= (oy - my) * (oy - self.mean_y)
+            self._cxy -= (ox - mx) * (oy - self.mean_y)
+            self.mean_x, self.mean_y = mx, my
+            self.count = n
+        self._xs[pos] = x
+        self._ys[pos] = y
+        self._pos = pos + 1 if pos + 1 < self.window else 0
+        n = self.count + 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / n
+        self.mean_y += dy / n
+        self._cxx += dx * (x - self.mean_x)
+        self._cyy += dy * (y - self.mean_y)
+        self._cxy += dx * (y - self.mean_y)
+        self.count = n
+        if self._pos == 0:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recompute the moments from the buffer to shed rounding drift.
+
+        Runs once per `window` samples, so it adds O(1) amortized per sample.
+        """
+        xs, ys, n = self._xs, self._ys, self.window
+        mx = sum(xs) / n
+        my = sum(ys) / n
+        self.mean_x, self.mean_y = mx, my
+        self._cxx = sum((x - mx) * (x - mx) for x in xs)
+        self._cyy = sum((y - my) * (y - my) for y in ys)
+        self._cxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys, strict=True))
+
+    @property
+    def ready(self) -> bool:
+        """True once the window is full."""
+        return self.count == self.window
+
+    @property
+    def var_x(self) -> float:
+        """Population variance of x."""
+        return self._cxx / self.count if self.count else 0.0
+
+    @property
+    def var_y(self) -> float:
+        """Population variance of y."""
+        return self._cyy / self.count if self.count else 0.0
+
+    @property
+    def cov(self) -> float:
+        """Population covariance of x and y."""
+        return self._cxy / self.count if self.count else 0.0
+
+
+class EwmPairStats:
+    """Exponentially weighted mean, variance and covariance of two series."""
+
+    def __init__(self, window: int) -> None:
+        if window < 2:
+            raise ValueError("window must be >= 2")
+        self.window = window
+        self.alpha = 2.0 / (window + 1)
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all samples."""
+        self.count = 0
+        self.mean_x = self.mean_y = 0.0
+        self.var_x = self.var_y = self.cov = 0.0
+
+    def update(self, x: float, y: float) -> None:
+        """Add a sample."""
+        if self.count == 0:
+            self.mean_x, self.mean_y = x, y
+            self.count = 1
+            return
+        a = self.alpha
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += a * dx
+        self.mean_y += a * dy
+        self.var_x = (1 - a) * (self.var_x + a * dx * dx)
+        self.var_y = (1 - a) * (self.var_y + a * dy * dy)
+        self.cov = (1 - a) * (self.cov + a * dx * dy)
+        self.count += 1
+
+    @property
+    def ready(self) -> bool:
+        """True after `window` samples (the weights' warm-up)."""
+        return self.count >= self.window
+
+
+class StatArbStrategy(BaseStrategy):
+    """Trade the z-score of the hedged log-price spread between two legs.
+
+    `leg_a` and `leg_b` are (venue, symbol) pairs; a leg left unset is
+    taken from the first distinct pairs quoted (e.g. the two venues of the
+    sample data). `window` is the number of samples (`mode="window"`) or
+    the span (`mode="ewm"`) of the estimators. Signals carry both legs in
+    `Signal.legs`, leg b sized by the hedge ratio at equal notional.
+    """
+
+    strategy_id: str = "stat_arb"
+
+    def __init__(
+        self,
+        window: int = 500,
+        entry_z: float = 2.0,
+        exit_z: float = 0.5,
+        leg_a: tuple[str, str] | None = None,
+        leg_b: tuple[str, str] | None = None,
+        mode: StatsMode = "window",
+        fee_rate: float = 0.001,
+        slippage_bps: float = 5.0,
+        size: float = 0.01,
+    ) -> None:
+        if exit_z >= entry_z:
+            raise ValueError("exit_z must be below entry_z")
+        self.window = window
+        self.entry_z = entry_z
+        self.exit_z = exit_z
+        self.leg_a = leg_a
+        self.leg_b = leg_b
+        self._configured_legs = (leg_a, leg_b)
+        self.mode: StatsMode = mode
+        self.fee_rate = fee_rate
+        self.slippage_bps = slippage_bps / 10000.0
+        self.size = size
+        self.stats: RollingPairStats | EwmPairStats = (
+            EwmPairStats(window) if mode == "ewm" else RollingPairStats(window)
+        )
+        self.reset()
+
+    @property
+    def cost_bps(self) -> float:
+        """Round-trip cost in basis points (fees and slippage on both legs)."""
+        return 2 * self.fee_rate * 10000 + 2 * self.slippage_bps * 10000
+
+    def reset(self) -> None:
+        """Clear the estimators, latest quotes, position and auto-selected legs."""
+        self.stats.reset()
+        self.leg_a, self.leg_b = self._configured_legs
+        self.position: SpreadPosition = "flat"
+        self.zscore = 0.0
+        self.beta = 1.0
+        # Latest (bid, ask) per leg
+        self._a: tuple[float, float] | None = None
+        self._b: tuple[float, float] | None = None
+
+    def on_orderbook(self, event: OrderbookEvent) -> Signal | None:
+        """Add one quote update and check the entry/exit thresholds."""
+        return self.update_quote(event.venue, event.symbol, event.bid_price, event.ask_price)
+
+    def evaluate(self, market_data: dict[str, Any]) -> Signal | None:
+        """Feed every row of an orderbook window in order; returns the last signal.
+
+        Unlike `SimpleSpreadStrategy.evaluate`, state carries across calls,
+        so consecutive windows form one continuous series.
+        """
+        orderbook = market_data.get("orderbook")
+        if orderbook is None or not isinstance(orderbook, pd.DataFrame) or orderbook.empty:
+            return None
+        if "symbol" in orderbook.columns:
+            symbols = orderbook["symbol"].astype(str)
+        else:
+            symbols = pd.Series(market_data.get("symbol", "BTC-USD"), index=orderbook.index)
+        last = None
+        for venue, symbol, bid, ask in zip(
+            orderbook["venue"].astype(str),
+            symbols,
+            orderbook["bid_price"].to_numpy(),
+            orderbook["ask_price"].to_numpy(),
+            strict=True,
+        ):
+            signal = self.update_quote(venue, symbol, float(bid), float(ask))
+            if signal is not None:
+                last = signal
+        return last
+
+    def update_quote(
+        self, venue: str, symbol: str, bid_price: float, ask_price: float
+    ) -> Signal | None:
+        """Apply one venue's top of book for a symbol."""
+        key = (venue, symbol)
+        if self.leg_a is None and key != self.leg_b:
+            self.leg_a = key
+        elif self.leg_b is None and key != self.leg_a:
+            self.leg_b = key
+        if key == self.leg_a:
+            self._a = (bid_price, ask_price)
+        elif key == self.leg_b:
+            self._b = (bid_price, ask_price)
+        else:
+            return None
+        if self._a is None or self._b is None:
+            return None
+        mid_a = (self._a[0] + self._a[1]) / 2
+        mid_b = (self._b[0] + self._b[1]) / 2
+        if mid_a <= 0 or mid_b <= 0:
+            return None
+
+        stats = self.stats
+        x = math.log(mid_a)
+        y = math.log(mid_b)
+        stats.update(x, y)
+        if not stats.ready or stats.var_y <= 0:
+            return None
+        beta = stats.cov / stats.var_y
+        var_s = stats.var_x - 2 * beta * stats.cov + beta * beta * stats.var_y
+        if var_s <= 0:
+            return None
+        std_s = math.sqrt(var_s)
+        z = (x - beta * y - (stats.mean_x - beta * stats.mean_y)) / std_s
+        self.beta = beta
+        self.zscore = z
+
+        if self.position == "flat":
+            if z >= self.entry_z:
+                # Leg a is rich against leg b: sell a, buy b
+                self.position = "short"
+                return self.build_signal("sell", z, std_s)
+            if z <= -self.entry_z:
+                self.position = "long"
+                return self.build_signal("buy", z, std_s)
+        elif abs(z) <= self.exit_z:
+            side = "buy" if self.position == "short" else "sell"
+            self.position = "flat"
+            return self.build_signal(side, z, std_s)
+        return None
+
+    def build_signal(self, side_a: str, z: float, std_s: float) -> Signal:
+        """Signal trading leg a on `side_a` and leg b the other way.
+
+        Expected profit on entry is the reversion from `z` to `exit_z` in
+        spread units, after costs; exits report the cost of closing.
+        """
+        assert self.leg_a is not None and self.leg_b is not None and self._a and self._b
+        (venue_a, symbol_a), (venue_b, symbol_b) = self.leg_a, self.leg_b
+        # Cross the spread: buy at the ask, sell at the bid
+        price_a = self._a[1] if side_a == "buy" else self._a[0]
+        side_b = "sell" if side_a == "buy" else "buy"
+        price_b = self._b[1] if side_b == "buy" else self._b[0]
+        size_b = self.size * abs(self.beta) * price_a / price_b
+        legs = [
+            Leg(symbol=symbol_a, side=side_a, venue=venue_a, price=price_a, size=self.size),
+            Leg(symbol=symbol_b, side=side_b, venue=venue_b, price=price_b, size=size_b),
+        ]
+        buy, sell = (legs[0], legs[1]) if side_a == "buy" else (legs[1], legs[0])
+        entry = self.position != "flat"
+        if entry:
+            expected = (abs(z) - self.exit_z) * std_s * 10000 - self.cost_bps
+        else:
+            expected = -self.cost_bps / 2
+        action = "enter" if entry else "exit"
+        return Signal(
+            symbol=symbol_a if symbol_a == symbol_b else f"{symbol_a}/{symbol_b}",
+            side=side_a,
+            venue_buy=buy.venue,
+            venue_sell=sell.venue,
+            price_buy=buy.price,
+            price_sell=sell.price,
+            size=self.size,
+            expected_profit_bps=expected,
+            rationale=f"z={z:.2f}, beta={self.beta:.3f}: {action} ({self.entry_z}/{self.exit_z})",
+            legs=legs,
+        )
@@ -0,0 +1,175 @@
+"""Incremental cross-venue top-of-book index.
+
+Keeps the latest bid/ask per (symbol, venue) and, per symbol, two heaps
+ordered by price. Updates are O(log V); stale heap entries are discarded
+lazily when they reach the top, and heaps are compacted when stale entries
+dominate. Ties resolve to the lexicographically smallest venue, matching
+the DataFrame path in `SimpleSpreadStrategy.evaluate`.
+
+Several strategies can share one index: `update` ignores the snapshot it
+applied last, so each strategy may pass the same event, and `best_cross`
+is memoized per symbol until the next update.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from ai_arb_lab.core.events import OrderbookEvent
+
+
+@dataclass(frozen=True, slots=True)
+class Quote:
+    """One side of a venue's top of book."""
+
+    venue: str
+    price: float
+    size: float
+    timestamp: datetime | None = None
+
+
+@dataclass
+class _SymbolBook:
+    bids: dict[str, tuple[Quote, int]] = field(default_factory=dict)
+    asks: dict[str, tuple[Quote, int]] = field(default_factory=dict)
+    # Heap entries: (sort_price, venue, seq); bids use -price for a max-heap
+    bid_heap: list[tuple[float, str, int]] = field(default_factory=list)
+    ask_heap: list[tuple[float, str, int]] = field(default_factory=list)
+
+
+class TopOfBookIndex:
+    """Best bid and best ask across venues per symbol, maintained per update."""
+
+    def __init__(self) -> None:
+        self._books: dict[str, _SymbolBook] = {}
+        self._seq = 0
+        self._last: OrderbookEvent | None = None
+        self._cross: dict[str, tuple[Quote, Quote] | None] = {}
+
+    def update(self, event: OrderbookEvent) -> None:
+        """Apply an orderbook snapshot from one venue (once, if passed again)."""
+        if event is self._last:
+            return
+        self._last = event
+        self.update_quote(
+            event.symbol,
+            event.venue,
+            event.bid_price,
+            event.ask_price,
+            event.bid_size,
+            event.ask_size,
+            event.timestamp,
+        )
+
+    def update_quote(
+        self,
+        symbol: str,
+        venue: str,
+        bid_price: float,
+        ask_price: float,
+        bid_size: float = 0.0,
+        ask_size: float = 0.0,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Replace a venue's top of book for a symbol."""
+        self._cross.pop(symbol, None)
+        book = self._books.get(symbol)
+        if book is None:
+            book = self._books[symbol] = _SymbolBook()
+        self._seq += 1
+        seq = self._seq
+        book.bids[venue] = (Quote(venue, bid_price, bid_size, timestamp), seq)
+        book.asks[venue] = (Quote(venue, ask_price, ask_size, timestamp), seq)
+        heapq.heappush(book.bid_heap, (-bid_price, venue, seq))
+        heapq.heappush(book.ask_heap, (ask_price, venue, seq))
+        if len(book.bid_heap) > 4 * len(book.bids) + 16:
+            self._compact(book)
+
+    def remove(self, symbol: str, venue: str) -> None:
+        """Drop a venue's quotes (e.g. on disconnect)."""
+        self._cross.pop(symbol, None)
+        book = self._books.get(symbol)
+        if book is not None:
+            book.bids.pop(venue, None)
+            book.asks.pop(venue, None)
+
+    def clear(self) -> None:
+        """Forget all quotes."""
+        self._books.clear()
+        self._cross.clear()
+        self._last = None
+
+    def venue_count(self, symbol: str) -> int:
+        """Number of venues currently quoting a symbol."""
+        book = self._books.get(symbol)
+        return len(book.bids) if book is not None else 0
+
+    def best_bid(self, symbol: str) -> Quote | None:
+        """Highest bid across venues."""
+        book = self._books.get(symbol)
+        return self._top(book.bid_heap, book.bids) if book is not None else None
+
+    def best_ask(self, symbol: str) -> Quote | None:
+        """Lowest ask across venues."""
+        book = self._books.get(symbol)
+        return self._top(book.ask_heap, book.asks) if book is not None else None
+
+    def best_cross(self, symbol: str) -> tuple[Quote, Quote] | None:
+        """Return (lowest ask, highest bid) on two different venues.
+
+        When the best ask and best bid sit on the same venue, the runner-up
+        on each side is considered and the pair with the wider spread wins.
+        """
+        if symbol in self._cross:
+            return self._cross[symbol]
+        cross = self._best_cross(symbol)
+        self._cross[symbol] = cross
+        return cross
+
+    def _best_cross(self, symbol: str) -> tuple[Quote, Quote] | None:
+        book = self._books.get(symbol)
+        if book is None or len(book.bids) < 2:
+            return None
+        ask = self._top(book.ask_heap, book.asks)
+        bid = self._top(book.bid_heap, book.bids)
+        if ask is None or bid is None:
+            return None
+        if ask.venue != bid.venue:
+            return ask, bid
+        ask2 = self._runner_up(book.ask_heap, book.asks)
+        bid2 = self._runner_up(book.bid_heap, book.bids)
+        candidates = [
+            (a, b) for a, b in ((ask, bid2), (ask2, bid)) if a is not None and b is not None
+        ]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda pair: (pair[1].price - pair[0].price) / pair[0].price)
+
+    @staticmethod
+    def _valid(entry: tuple[float, str, int], side: dict[str, tuple[Quote, int]]) -> bool:
+        current = side.get(entry[1])
+        return current is not None and current[1] == entry[2]
+
+    def _top(
+        self, heap: list[tuple[float, str, int]], side: dict[str, tuple[Quote, int]]
+    ) -> Quote | None:
+        while heap and not self._valid(heap[0], side):
+            heapq.heappop(heap)
+        return side[heap[0][1]][0] if heap else None
+
+    def _runner_up(
+        self, heap: list[tuple[float, str, int]], side: dict[str, tuple[Quote, int]]
+    ) -> Quote | None:
+        if self._top(heap, side) is None:
+            return None
+        top = heapq.heappop(heap)
+        second = self._top(heap, side)
+        heapq.heappush(heap, top)
+        return second
+
+    @staticmethod
+    def _compact(book: _SymbolBook) -> None:
+        book.bid_heap = [(-q.price, v, seq) for v, (q, seq) in book.bids.items()]
+        book.ask_heap = [(q.price, v, seq) for v, (q, seq) in book.asks.items()]
+        heapq.heapify(book.bid_heap)
+        heapq.heapify(book.ask_heap)
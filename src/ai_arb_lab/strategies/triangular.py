@@ -0,0 +1,281 @@
+"""Triangular arbitrage across symbols and venues.
+
+Currencies are nodes of a directed graph and each `BASE-QUOTE` book adds
+two edges: selling BASE at the best bid (BASE -> QUOTE) and buying BASE at
+the best ask (QUOTE -> BASE). An edge weighs `-log(rate * (1 - fee) *
+(1 - slippage))`, so a cycle is profitable after costs exactly when its
+weights sum below zero. The best venue per edge comes from a
+`TopOfBookIndex`, so trading across venues assumes inventory on each.
+
+Detection is incremental. Any negative cycle that appears after an update
+must pass through an edge the update changed, so `CurrencyGraph.update`
+returns only those edges (none when a venue that is not the best moves)
+and `cycles_through` searches cycles of 3 to `max_length` currencies
+closing over them: O(d^(max_length - 2)) for out-degree d, instead of a
+Bellman-Ford pass over the whole graph per tick. `best_cycle` is the full
+scan, used by `evaluate`. Two-currency cycles (the same symbol across
+venues) are left to `SimpleSpreadStrategy`.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+
+from ai_arb_lab.core.events import OrderbookEvent
+from ai_arb_lab.strategies.base import BaseStrategy, Leg, Signal
+from ai_arb_lab.strategies.top_of_book import TopOfBookIndex
+
+
+@dataclass(frozen=True, slots=True)
+class Edge:
+    """Best rate for converting `source` into `target` on one venue."""
+
+    source: str
+    target: str
+    symbol: str
+    side: str  # "buy" | "sell" of the symbol's base currency
+    venue: str
+    price: float
+    weight: float
+
+
+@dataclass(frozen=True, slots=True)
+class Cycle:
+    """A closed path of edges, starting and ending at `edges[0].source`."""
+
+    edges: tuple[Edge, ...]
+    weight: float
+
+    @property
+    def currencies(self) -> list[str]:
+        """Currencies visited, the start repeated at the end."""
+        return [edge.source for edge in self.edges] + [self.edges[0].source]
+
+    @property
+    def profit_bps(self) -> float:
+        """Return of going once around the cycle after costs, in basis points."""
+        return math.expm1(-self.weight) * 10000
+
+
+def split_symbol(symbol: str) -> tuple[str, str] | None:
+    """(base, quote) of a `BASE-QUOTE` symbol, or None if it has no quote."""
+    base, sep, quote = symbol.partition("-")
+    if not sep or not base or not quote:
+        return None
+    return base, quote
+
+
+class CurrencyGraph:
+    """Log exchange rates between currencies, maintained per book update."""
+
+    def __init__(
+        self, fee_rate: float = 0.001, slippage_bps: float = 5.0, max_length: int = 3
+    ) -> None:
+        if max_length < 3:
+            raise ValueError("max_length must be >= 3")
+        self.max_length = max_length
+        # Fees and slippage apply to every conversion
+        self.cost_weight = -math.log((1 - fee_rate) * (1 - slippage_bps / 10000.0))
+        self.book = TopOfBookIndex()
+        self.edges: dict[str, dict[str, Edge]] = {}
+
+    def update(self, event: OrderbookEvent) -> list[Edge]:
+        """Apply an orderbook snapshot; returns the edges whose rate changed."""
+        return self.update_quote(
+            event.symbol, event.venue, event.bid_price, event.ask_price, event.timestamp
+        )
+
+    def update_quote(
+        self,
+        symbol: str,
+        venue: str,
+        bid_price: float,
+        ask_price: float,
+        timestamp: datetime | None = None,
+    ) -> list[Edge]:
+        """Replace a venue's top of book; returns the edges whose rate changed."""
+        pair = split_symbol(symbol)
+        if pair is None:
+            return []
+        base, quote = pair
+        self.book.update_quote(symbol, venue, bid_price, ask_price, timestamp=timestamp)
+        changed = []
+        bid = self.book.best_bid(symbol)
+        if bid is not None and bid.price > 0:
+            weight = self.cost_weight - math.log(bid.price)
+            edge = Edge(base, quote, symbol, "sell", bid.venue, bid.price, weight)
+            if self._set(edge):
+                changed.append(edge)
+        ask = self.book.best_ask(symbol)
+        if ask is not None and ask.price > 0:
+            weight = self.cost_weight + math.log(ask.price)
+            edge = Edge(quote, base, symbol, "buy", ask.venue, ask.price, weight)
+            if self._set(edge):
+                changed.append(edge)
+        return changed
+
+    def _set(self, edge: Edge) -> bool:
+        out = self.edges.get(edge.source)
+        if out is None:
+            out = self.edges[edge.source] = {}
+        old = out.get(edge.target)
+        if old is not None and old.weight == edge.weight and old.venue == edge.venue:
+            return False
+        out[edge.target] = edge
+        return True
+
+    def cycles_through(self, edge: Edge) -> Cycle | None:
+        """Lowest-weight cycle of 3 to `max_length` currencies starting with `edge`."""
+        start = edge.source
+        edges = self.edges
+        best: Cycle | None = None
+        path = [edge]
+        visited = {start, edge.target}
+
+        def extend(node: str, weight: float) -> None:
+            nonlocal best
+            out = edges.get(node)
+            if not out:
+                return
+            if len(path) >= 2:
+                closing = out.get(start)
+                if closing is not None:
+                    total = weight + closing.weight
+                    if best is None or total < best.weight:
+                        best = Cycle((*path, closing), total)
+            if len(path) >= self.max_length - 1:
+                return
+            for nxt in out.values():
+                if nxt.target in visited:
+                    continue
+                path.append(nxt)
+                visited.add(nxt.target)
+                extend(nxt.target, weight + nxt.weight)
+                visited.discard(nxt.target)
+                path.pop()
+
+        extend(edge.target, edge.weight)
+        return best
+
+    def best_cycle(self) -> Cycle | None:
+        """Lowest-weight cycle anywhere in the graph (checks every edge)."""
+        best = None
+        for out in self.edges.values():
+            for edge in out.values():
+                cycle = self.cycles_through(edge)
+                if cycle is not None and (best is None or cycle.weight < best.weight):
+                    best = cycle
+        return best
+
+    def clear(self) -> None:
+        """Forget all quotes and edges."""
+        self.book.clear()
+        self.edges.clear()
+
+
+class TriangularArbStrategy(BaseStrategy):
+    """Detect cycles across symbols whose return after costs exceeds min_profit_bps.
+
+    Signals carry every conversion in `Signal.legs`; the two-leg fields
+    describe the first and last legs, and `symbol` is the currency path
+    (e.g. `USD->BTC->ETH->USD`).
+    """
+
+    strategy_id: str = "triangular"
+
+    def __init__(
+        self,
+        min_profit_bps: float = 5.0,
+        fee_rate: float = 0.001,
+        slippage_bps: float = 5.0,
+        max_length: int = 3,
+    ) -> None:
+        self.min_profit_bps = min_profit_bps
+        self.fee_rate = fee_rate
+        self.slippage_bps = slippage_bps
+        self.max_length = max_length
+        self._max_weight = -math.log1p(min_profit_bps / 10000.0)
+        self.graph = self._new_graph()
+
+    def _new_graph(self) -> CurrencyGraph:
+        return CurrencyGraph(self.fee_rate, self.slippage_bps, self.max_length)
+
+    def evaluate(self, market_data: dict[str, Any]) -> Signal | None:
+        """Check the latest quote per (symbol, venue) in an orderbook window.
+
+        Builds a fresh graph from the window and scans every cycle, so it
+        does not touch the streaming state used by `on_orderbook`.
+        """
+        orderbook = market_data.get("orderbook")
+        if orderbook is None or not isinstance(orderbook, pd.DataFrame) or orderbook.empty:
+            return None
+        latest = orderbook.drop_duplicates(["symbol", "venue"], keep="last")
+        graph = self._new_graph()
+        for symbol, venue, bid, ask in zip(
+            latest["symbol"].astype(str),
+            latest["venue"].astype(str),
+            latest["bid_price"].to_numpy(),
+            latest["ask_price"].to_numpy(),
+            strict=True,
+        ):
+            graph.update_quote(symbol, venue, float(bid), float(ask))
+        return self._signal(graph.best_cycle())
+
+    def on_orderbook(self, event: OrderbookEvent) -> Signal | None:
+        """Update the graph and check only cycles through the edges that changed."""
+        best = None
+        for edge in self.graph.update(event):
+            cycle = self.graph.cycles_through(edge)
+            if cycle is not None and (best is None or cycle.weight < best.weight):
+                best = cycle
+        return self._signal(best)
+
+    def reset(self) -> None:
+        """Clear the currency graph."""
+        self.graph.clear()
+
+    def _signal(self, cycle: Cycle | None) -> Signal | None:
+        if cycle is None or cycle.weight > self._max_weight:
+            return None
+        return self.build_signal(cycle)
+
+    def build_signal(self, cycle: Cycle) -> Signal:
+        """Build the signal for a profitable cycle.
+
+        The first leg trades 0.01 of its symbol's base currency; each later
+        leg trades what the previous one delivered, net of costs.
+        """
+        keep = math.exp(-self.graph.cost_weight)
+        first = cycle.edges[0]
+        size = 0.01  # Small size for simulation
+        amount = size if first.side == "sell" else size * first.price / keep
+        legs = []
+        for edge in cycle.edges:
+            if edge.side == "sell":
+                qty = amount
+                amount = qty * edge.price * keep
+            else:
+                qty = amount * keep / edge.price
+                amount = qty
+            legs.append(
+                Leg(
+                    symbol=edge.symbol, side=edge.side, venue=edge.venue, price=edge.price, size=qty
+                )
+            )
+        profit_bps = cycle.profit_bps
+        path = "->".join(cycle.currencies)
+        return Signal(
+            symbol=path,
+            side=first.side,
+            venue_buy=first.venue,
+            venue_sell=cycle.edges[-1].venue,
+            price_buy=first.price,
+            price_sell=cycle.edges[-1].price,
+            size=size,
+            expected_profit_bps=profit_bps,
+            rationale=f"Cycle {path} returns {profit_bps:.1f} bps after costs > min {self.min_profit_bps} bps",
+            legs=legs,
+        )
@@ -0,0 +1,124 @@
+"""Tests for concurrent two-leg execution."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from ai_arb_lab.core.bus import EventBus
+from ai_arb_lab.core.clock import SimClock
+from ai_arb_lab.core.events import FillEvent, OrderbookEvent, OrderEvent
+from ai_arb_lab.execution.async_broker import AsyncPaperBroker
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.latency import LatencyModel, VenueLatency
+from ai_arb_lab.strategies.base import Signal
+
+T0 = datetime(2025, 1, 1)
+
+
+def _signal() -> Signal:
+    return Signal(
+        symbol="BTC-USD",
+        side="buy",
+        venue_buy="v1",
+        venue_sell="v2",
+        price_buy=100.0,
+        price_sell=101.0,
+        size=1.0,
+        expected_profit_bps=100.0,
+    )
+
+
+def _book(venue: str, bid: float, ask: float, bid_size: float = 5.0) -> OrderbookEvent:
+    return OrderbookEvent(
+        timestamp=T0,
+        venue=venue,
+        symbol="BTC-USD",
+        bid_price=bid,
+        ask_price=ask,
+        bid_size=bid_size,
+        ask_size=5.0,
+    )
+
+
+async def test_both_legs_fill_concurrently_and_publish() -> None:
+    bus = EventBus()
+    seen: list[str] = []
+
+    async def record(event: OrderEvent | FillEvent) -> None:
+        seen.append(type(event).__name__)
+
+    bus.subscribe(OrderEvent, record)
+    bus.subscribe(FillEvent, record)
+    latency = LatencyModel({"v1": VenueLatency(order_entry_ms=5), "v2": VenueLatency(20)})
+    broker = AsyncPaperBroker(10_000.0, latency=latency, bus=bus)
+
+    result = await broker.submit(_signal(), SimClock(T0))
+
+    assert result.status == "filled"
+    assert [r.status for r in result.orders] == ["filled", "filled"]
+    assert [f.timestamp for f in result.fills] == [
+        T0 + timedelta(milliseconds=5),
+        T0 + timedelta(milliseconds=20),
+    ]
+    assert broker.capital == pytest.approx(10_000.0 + result.cash)
+    assert broker.ledger.net_quantity("BTC-USD") == pytest.approx(0.0)
+    assert sorted(seen) == ["FillEvent"] * 2 + ["OrderEvent"] * 2
+
+
+async def test_rejected_leg_is_unwound() -> None:
+    broker = AsyncPaperBroker(10_000.0, fill_model=FillModel(mode="depth"))
+    broker.on_orderbook(_book("v1", 99.9, 100.0))
+    broker.on_orderbook(_book("v2", 101.0, 101.1, bid_size=0.0))
+
+    result = await broker.submit(_signal(), SimClock(T0))
+
+    assert result.status == "unwound"
+    assert [r.role for r in result.orders] == ["buy", "sell", "unwind"]
+    assert [r.status for r in result.orders] == ["filled", "rejected", "filled"]
+    assert result.orders[2].order.venue == "v1"
+    assert result.imbalance == pytest.approx(0.0)
+    assert broker.ledger.net_exposure == pytest.approx(0.0)
+    assert result.cash < 0
+
+
+async def test_hold_policy_leaves_exposure() -> None:
+    broker = AsyncPaperBroker(10_000.0, fill_model=FillModel(mode="depth"), leg_risk="hold")
+    broker.on_orderbook(_book("v1", 99.9, 100.0))
+    broker.on_orderbook(_book("v2", 101.0, 101.1, bid_size=0.0))
+
+    result = await broker.submit(_signal(), SimClock(T0))
+
+    assert result.status == "open"
+    assert len(result.orders) == 2
+    assert broker.ledger.net_quantity("BTC-USD") == pytest.approx(1.0)
+
+
+async def test_signals_overlap_in_flight() -> None:
+    latency = LatencyModel(default=VenueLatency(order_entry_ms=50))
+    broker = AsyncPaperBroker(100_000.0, latency=latency)
+    clock = SimClock(T0, mode="paced")
+
+    start = time.monotonic()
+    for _ in range(10):
+        broker.submit_nowait(_signal(), clock)
+    assert broker.in_flight == 10
+    results = await broker.drain()
+
+    # Ten signals at 50 ms each would take 0.5 s one after another
+    assert time.monotonic() - start < 0.3
+    assert len(results) == 10 and all(r.status == "filled" for r in results)
+
+
+async def test_cancel_pending_legs() -> None:
+    latency = LatencyModel(default=VenueLatency(order_entry_ms=1_000))
+    broker = AsyncPaperBroker(10_000.0, latency=latency)
+    task = broker.submit_nowait(_signal(), SimClock(T0, mode="paced"))
+    await asyncio.sleep(0.01)
+
+    assert broker.cancel_all() == 2
+    result = await task
+    assert result.status == "cancelled"
+    assert [r.status for r in result.orders] == ["cancelled", "cancelled"]
+    assert broker.capital == 10_000.0
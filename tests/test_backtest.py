@@ -0,0 +1,108 @@
+"""Tests for the vectorized backtest engine."""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from ai_arb_lab.backtest import engine
+from ai_arb_lab.backtest.engine import (
+    BacktestResult,
+    compute_window_quotes,
+    run_backtest,
+    scan_spreads,
+)
+from ai_arb_lab.core.clock import SimClock
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.risk.limits import RiskLimits
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+
+@pytest.fixture
+def multi_venue_orderbook() -> pd.DataFrame:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    return gen.generate_orderbook(datetime(2025, 1, 1), days=1, snapshots_per_minute=4)
+
+
+def _reference_signals(orderbook: pd.DataFrame, strategy: SimpleSpreadStrategy) -> list:
+    minutes = orderbook["timestamp"].dt.floor("min")
+    signals = []
+    for minute, group in orderbook.groupby(minutes):
+        signal = strategy.evaluate({"orderbook": group, "symbol": "BTC-USD"})
+        if signal is not None:
+            signals.append((minute, signal))
+    return signals
+
+
+def test_window_quotes_shape(multi_venue_orderbook: pd.DataFrame) -> None:
+    quotes = compute_window_quotes(multi_venue_orderbook)
+    assert len(quotes) == 24 * 60
+    assert quotes.venues == ["venue_0", "venue_1", "venue_2"]
+    assert quotes.best_bid.shape == (len(quotes), 3)
+    assert int(quotes.row_count.sum()) == len(multi_venue_orderbook)
+
+
+def test_scan_matches_per_window_evaluate(multi_venue_orderbook: pd.DataFrame) -> None:
+    strategy = SimpleSpreadStrategy(min_spread_bps=5.0)
+    expected = _reference_signals(multi_venue_orderbook, strategy)
+    scanned = scan_spreads(compute_window_quotes(multi_venue_orderbook), strategy)
+
+    assert len(expected) > 0
+    assert len(scanned) == len(expected)
+    for row, (minute, signal) in zip(scanned.itertuples(index=False), expected, strict=True):
+        assert row.window == minute
+        assert row.venue_buy == signal.venue_buy
+        assert row.venue_sell == signal.venue_sell
+        assert row.price_buy == signal.price_buy
+        assert row.price_sell == signal.price_sell
+        assert row.net_spread_bps == signal.expected_profit_bps
+
+
+def test_scan_no_signal_with_one_snapshot_per_window() -> None:
+    gen = SyntheticMarketGenerator(seed=42, n_venues=2)
+    ob = gen.generate_orderbook(datetime(2025, 1, 1), days=1)
+    assert scan_spreads(compute_window_quotes(ob), SimpleSpreadStrategy()).empty
+
+
+def test_run_backtest_matches_loop(multi_venue_orderbook: pd.DataFrame) -> None:
+    capital = 100_000.0
+    strategy = SimpleSpreadStrategy(min_spread_bps=5.0)
+
+    broker = PaperBroker(initial_capital=capital)
+    limits = RiskLimits(max_exposure=capital * 0.5, initial_capital=capital)
+    trades = 0
+    for minute, signal in _reference_signals(multi_venue_orderbook, strategy):
+        ok, _ = limits.check(signal, broker.capital)
+        if not ok:
+            continue
+        clock = SimClock()
+        clock.start(minute.to_pydatetime())
+        _, fill = broker.submit_order(signal, clock)
+        trades += fill is not None
+
+    result = run_backtest(multi_venue_orderbook, strategy, initial_capital=capital)
+    assert result.metrics.trade_count == trades
+    assert result.metrics.final_capital == pytest.approx(broker.capital)
+    assert len(result.fills) == trades
+
+
+def test_batch_fills_match_per_order_path(
+    multi_venue_orderbook: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    strategy = SimpleSpreadStrategy(min_spread_bps=0.0, fee_rate=0.0)
+
+    def run() -> BacktestResult:
+        broker = PaperBroker(initial_capital=100_000.0, fill_model=FillModel(fill_probability=0.8))
+        return run_backtest(multi_venue_orderbook, strategy, 100_000.0, broker=broker)
+
+    monkeypatch.setattr(engine, "BATCH_MIN_SIGNALS", 1)
+    batched = run()
+    monkeypatch.setattr(engine, "BATCH_MIN_SIGNALS", 10**9)
+    per_order = run()
+
+    assert len(batched.signals) > 10
+    assert batched.metrics.final_capital == pytest.approx(per_order.metrics.final_capital)
+    assert [f.fill_id for f in batched.fills] == [f.fill_id for f in per_order.fills]
+    assert batched.signals["executed"].equals(per_order.signals["executed"])
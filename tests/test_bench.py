@@ -0,0 +1,51 @@
+"""Tests for the benchmark suite."""
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from ai_arb_lab.bench import compare, run_case, to_dict
+
+STAGES = ["generate", "load", "evaluate", "on_orderbook", "publish", "backtest"]
+
+
+def test_run_case_times_every_stage(tmp_path: Path) -> None:
+    case = run_case(1, 3, tmp_path, repeat=1, max_calls=100)
+
+    assert case.name == "1d_3v"
+    assert case.rows == 1440 * 3
+    assert list(case.stages) == STAGES
+    assert case.stages["backtest"].items == case.rows
+    assert case.stages["on_orderbook"].items == 100
+    for stage in case.stages.values():
+        assert stage.throughput > 0
+    publish = case.stages["publish"]
+    assert publish.p50_us is not None and publish.p99_us is not None
+    assert 0 < publish.p50_us <= publish.p99_us
+
+
+def test_compare_flags_regressions() -> None:
+    baseline = {
+        "cases": {
+            "1d_2v": {
+                "stages": {
+                    "load": {"throughput": 1000.0, "p99_us": None, "peak_rss_mb": 100.0},
+                    "publish": {"throughput": 1000.0, "p99_us": 10.0, "peak_rss_mb": 100.0},
+                }
+            }
+        }
+    }
+    current = copy.deepcopy(baseline)
+    stages = current["cases"]["1d_2v"]["stages"]
+    stages["load"]["throughput"] = 950.0
+    stages["publish"].update(throughput=800.0, p99_us=12.0)
+
+    regressions = compare(current, baseline, threshold=0.1)
+    assert [(r.stage, r.metric) for r in regressions] == [
+        ("publish", "throughput"),
+        ("publish", "p99_us"),
+    ]
+    assert regressions[0].change == pytest.approx(-0.2)
+    assert compare(current, baseline, threshold=0.25) == []
+    assert compare(to_dict([]), baseline) == []
@@ -0,0 +1,157 @@
+"""Tests for the L2 order book and depth-aware fills."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from ai_arb_lab.core.book import BookSide, OrderBookL2, level_arrays
+from ai_arb_lab.core.clock import SimClock
+from ai_arb_lab.core.events import BookDepth, OrderbookEvent
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.strategies.base import Signal
+
+
+def _asks() -> BookSide:
+    side = BookSide("ask", capacity=2)
+    for price, size in [(102.0, 2.0), (100.0, 1.0), (101.0, 1.5), (103.0, 5.0)]:
+        side.update(price, size)
+    return side
+
+
+def test_book_side_keeps_levels_sorted_best_first() -> None:
+    asks = _asks()
+    prices, sizes = asks.levels()
+    assert prices.tolist() == [100.0, 101.0, 102.0, 103.0]
+    assert sizes.tolist() == [1.0, 1.5, 2.0, 5.0]
+    assert asks.best() == (100.0, 1.0)
+
+    bids = BookSide("bid")
+    bids.set_levels([99.0, 98.0, 99.5], [1.0, 2.0, 0.0])
+    assert bids.levels()[0].tolist() == [99.0, 98.0]
+
+
+def test_book_side_update_and_remove() -> None:
+    asks = _asks()
+    asks.update(101.0, 4.0)
+    asks.update(100.0, 0.0)
+    asks.update(99.0, 0.0)  # removing a missing level is a no-op
+    prices, sizes = asks.levels(2)
+    assert prices.tolist() == [101.0, 102.0]
+    assert sizes.tolist() == [4.0, 2.0]
+    assert len(asks) == 3
+
+
+def test_sweep_vwap_across_levels() -> None:
+    result = _asks().sweep(3.0)
+    assert result.filled == 3.0
+    assert result.levels == 3
+    assert result.worst_price == 102.0
+    assert result.vwap == pytest.approx((100.0 * 1.0 + 101.0 * 1.5 + 102.0 * 0.5) / 3.0)
+    assert result.remaining == 0.0
+
+
+def test_sweep_partial_when_liquidity_or_limit_runs_out() -> None:
+    asks = _asks()
+    exhausted = asks.sweep(20.0)
+    assert exhausted.filled == pytest.approx(9.5)
+    assert exhausted.remaining == pytest.approx(10.5)
+
+    limited = asks.sweep(20.0, limit_price=101.0)
+    assert limited.filled == pytest.approx(2.5)
+    assert limited.worst_price == 101.0
+
+    assert asks.sweep(1.0, limit_price=99.0).filled == 0.0
+
+
+def test_sweep_deep_book_matches_naive_walk() -> None:
+    rng = np.random.default_rng(0)
+    prices = 100.0 + np.arange(500) * 0.01
+    sizes = rng.uniform(0.1, 2.0, 500)
+    asks = BookSide("ask")
+    asks.set_levels(prices, sizes)
+    target = float(sizes[:300].sum()) + 0.05
+    result = asks.sweep(target)
+    assert result.levels == 301
+    expected = float(prices[:300] @ sizes[:300]) + 0.05 * prices[300]
+    assert result.cost == pytest.approx(expected)
+
+
+def test_consume_removes_taken_liquidity() -> None:
+    asks = _asks()
+    asks.consume(2.0)
+    assert asks.best() == (101.0, pytest.approx(0.5))
+    assert len(asks) == 3
+
+
+def test_order_book_applies_depth_snapshot() -> None:
+    book = OrderBookL2("venue_0", "BTC-USD")
+    event = OrderbookEvent(
+        timestamp=datetime(2025, 1, 1),
+        venue="venue_0",
+        symbol="BTC-USD",
+        bid_price=99.0,
+        ask_price=100.0,
+        bid_size=1.0,
+        ask_size=1.0,
+        depth=BookDepth(bids=[(99.0, 1.0), (98.0, 3.0)], asks=[(100.0, 1.0), (101.0, 2.0)]),
+    )
+    book.apply(event)
+    assert book.best_bid() == (99.0, 1.0)
+    assert book.sweep("sell", 2.0).vwap == pytest.approx(98.5)
+    assert book.to_depth() == event.depth
+
+
+def test_depth_fill_is_partial_at_vwap() -> None:
+    book = OrderBookL2.from_levels("v", "BTC-USD", [99.0], [1.0], [100.0, 101.0], [1.0, 1.0])
+    model = FillModel(mode="depth", fee_rate=0.0)
+    fill = model.simulate_fill("o1", "BTC-USD", "buy", "v", 100.0, 3.0, SimClock(), book=book)
+    assert fill is not None
+    assert fill.price == pytest.approx(100.5)
+    assert fill.size == pytest.approx(2.0)
+    assert fill.remaining_size == pytest.approx(1.0)
+
+
+def test_paper_broker_fills_against_venue_book() -> None:
+    broker = PaperBroker(initial_capital=10_000.0, fill_model=FillModel(mode="depth"))
+    broker.on_orderbook(
+        OrderbookEvent(
+            timestamp=datetime(2025, 1, 1),
+            venue="a",
+            symbol="BTC-USD",
+            bid_price=99.0,
+            ask_price=100.0,
+            bid_size=1.0,
+            ask_size=0.5,
+            depth=BookDepth(bids=[(99.0, 1.0)], asks=[(100.0, 0.5), (100.2, 10.0)]),
+        )
+    )
+    signal = Signal(
+        symbol="BTC-USD",
+        side="buy",
+        venue_buy="a",
+        venue_sell="b",
+        price_buy=100.0,
+        price_sell=101.0,
+        size=1.0,
+        expected_profit_bps=100.0,
+    )
+    _, fill = broker.submit_order(signal, SimClock())
+    assert fill is not None
+    assert fill.price == pytest.approx(100.1)
+
+
+def test_generator_depth_levels_extend_top_of_book() -> None:
+    start = datetime(2025, 1, 1)
+    top = SyntheticMarketGenerator(seed=3, n_venues=2).generate_orderbook(start, days=1)
+    deep = SyntheticMarketGenerator(seed=3, n_venues=2).generate_orderbook(
+        start, days=1, depth_levels=4
+    )
+    assert deep[top.columns].equals(top)
+    bid_p, bid_s, ask_p, ask_s = level_arrays(deep)
+    assert bid_p.shape == (len(deep), 4)
+    assert (np.diff(bid_p, axis=1) < 0).all()
+    assert (np.diff(ask_p, axis=1) > 0).all()
+    assert (bid_s > 0).all() and (ask_s > 0).all()
@@ -0,0 +1,180 @@
+"""Tests for the event bus."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from ai_arb_lab.core.bus import EventBus
+from ai_arb_lab.core.events import Event, OrderbookEvent, TradeEvent
+
+
+def _trade(price: float = 100.0) -> TradeEvent:
+    return TradeEvent(
+        timestamp=datetime(2025, 1, 1),
+        venue="v0",
+        symbol="BTC-USD",
+        price=price,
+        size=1,
+        side="buy",
+    )
+
+
+def _book(venue: str, bid: float) -> OrderbookEvent:
+    return OrderbookEvent(
+        timestamp=datetime(2025, 1, 1),
+        venue=venue,
+        symbol="BTC-USD",
+        bid_price=bid,
+        ask_price=bid + 1,
+        bid_size=1,
+        ask_size=1,
+    )
+
+
+async def test_direct_dispatch_routes_subclasses() -> None:
+    bus = EventBus()
+    seen: list[Event] = []
+
+    async def on_any(event: Event) -> None:
+        seen.append(event)
+
+    bus.subscribe(Event, on_any)
+    await bus.publish(_trade())
+    await bus.publish(_book("v0", 100))
+    assert [type(e) for e in seen] == [TradeEvent, OrderbookEvent]
+
+
+async def test_queued_slow_subscriber_does_not_stall_fast_one() -> None:
+    bus = EventBus(dispatch="queued")
+    fast: list[TradeEvent] = []
+    release = asyncio.Event()
+
+    async def on_fast(event: TradeEvent) -> None:
+        fast.append(event)
+
+    async def on_slow(_: TradeEvent) -> None:
+        await release.wait()
+
+    bus.subscribe(TradeEvent, on_fast)
+    slow = bus.subscribe(TradeEvent, on_slow, name="reporting")
+    await bus.publish_many([_trade(i) for i in range(5)])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert len(fast) == 5
+    assert slow is not None
+    assert slow.stats().lag == 5
+    release.set()
+    await bus.drain()
+    assert slow.stats().lag == 0
+    assert slow.stats().delivered == 5
+    await bus.close()
+
+
+async def test_queued_batch_delivery() -> None:
+    bus = EventBus(dispatch="queued")
+    batches: list[list[TradeEvent]] = []
+
+    async def on_batch(events: list[TradeEvent]) -> None:
+        batches.append(events)
+
+    bus.subscribe(TradeEvent, on_batch, batch=True, max_batch=4)
+    await bus.publish_many([_trade(i) for i in range(10)])
+    await bus.drain()
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert [e.price for b in batches for e in b] == list(range(10))
+    await bus.close()
+
+
+async def test_drop_oldest_backpressure() -> None:
+    bus = EventBus(dispatch="queued", maxsize=3, backpressure="drop_oldest")
+    prices: list[float] = []
+
+    async def on_trade(event: TradeEvent) -> None:
+        prices.append(event.price)
+
+    sub = bus.subscribe(TradeEvent, on_trade)
+    await bus.publish_many([_trade(i) for i in range(10)])
+    await bus.drain()
+    assert prices == [7, 8, 9]
+    assert sub is not None
+    assert sub.stats().dropped == 7
+    await bus.close()
+
+
+async def test_coalesce_latest_per_venue() -> None:
+    bus = EventBus(dispatch="queued", backpressure="coalesce")
+    books: list[OrderbookEvent] = []
+
+    async def on_book(event: OrderbookEvent) -> None:
+        books.append(event)
+
+    sub = bus.subscribe(OrderbookEvent, on_book)
+    await bus.publish_many([_book("v0", 1), _book("v1", 2), _book("v0", 3), _book("v1", 4)])
+    await bus.drain()
+    assert [(b.venue, b.bid_price) for b in books] == [("v0", 3), ("v1", 4)]
+    assert sub is not None
+    assert sub.stats().coalesced == 2
+    await bus.close()
+
+
+async def test_block_backpressure_waits_for_consumer() -> None:
+    bus = EventBus(dispatch="queued", maxsize=2, backpressure="block")
+    prices: list[float] = []
+
+    async def on_trade(event: TradeEvent) -> None:
+        prices.append(event.price)
+
+    sub = bus.subscribe(TradeEvent, on_trade)
+    for i in range(10):
+        await bus.publish(_trade(i))
+    await bus.drain()
+    assert prices == list(range(10))
+    assert sub is not None
+    assert sub.stats().max_depth <= 2
+    assert sub.stats().dropped == 0
+    await bus.close()
+
+
+async def test_handler_errors_are_counted() -> None:
+    bus = EventBus(dispatch="queued")
+
+    async def boom(_: TradeEvent) -> None:
+        raise RuntimeError("boom")
+
+    sub = bus.subscribe(TradeEvent, boom)
+    await bus.publish(_trade())
+    await bus.drain()
+    assert sub is not None
+    assert sub.stats().errors == 1
+    await bus.close()
+
+
+async def test_handler_error_does_not_drop_rest_of_pass() -> None:
+    bus = EventBus(dispatch="queued")
+    seen: list[float] = []
+
+    async def fails_once(event: TradeEvent) -> None:
+        if event.price == 101.0:
+            raise RuntimeError("boom")
+        seen.append(event.price)
+
+    sub = bus.subscribe(TradeEvent, fails_once)
+    assert sub is not None
+    # Queued before the consumer runs, so all five arrive in one pass
+    for i in range(5):
+        sub.offer_one(_trade(100.0 + i))
+    await bus.drain()
+    stats = sub.stats()
+    assert seen == [100.0, 102.0, 103.0, 104.0]
+    assert (stats.errors, stats.delivered, stats.lag) == (1, 5, 0)
+    await bus.close()
+
+
+def test_batch_requires_queued_dispatch() -> None:
+    async def handler(events: list[TradeEvent]) -> None:
+        pass
+
+    with pytest.raises(ValueError):
+        EventBus().subscribe(TradeEvent, handler, batch=True)
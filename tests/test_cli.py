@@ -1,7 +1,9 @@
 """Tests for CLI commands."""
 
+import json
 from pathlib import Path
 
+import pandas as pd
 from typer.testing import CliRunner
 
 from ai_arb_lab.cli import app
@@ -32,6 +34,9 @@ def test_backtest(sample_data_dir: Path, tmp_path: Path) -> None:
     assert result.exit_code == 0
     assert (tmp_path / "backtest_report.md").exists()
     assert (tmp_path / "backtest_metrics.json").exists()
+    latency = json.loads((tmp_path / "backtest_latency.json").read_text())
+    assert latency["counters"]["events"] > 0
+    assert "data_load" in latency["stages"]
 
 
 def test_paper_run(sample_data_dir: Path) -> None:
@@ -39,6 +44,44 @@ def test_paper_run(sample_data_dir: Path) -> None:
         app, ["paper-run", "--data-dir", str(sample_data_dir), "--duration", "10"]
     )
     assert result.exit_code == 0
+    assert "events/s" in result.output
+
+
+def test_paper_run_paced(sample_data_dir: Path) -> None:
+    result = runner.invoke(
+        app,
+        [
+            "paper-run",
+            "--data-dir",
+            str(sample_data_dir),
+            "--duration",
+            "180",
+            "--mode",
+            "paced",
+            "--speed",
+            "3600",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Clock drift" in result.output
+
+
+def test_paper_run_async_orders(sample_data_dir: Path) -> None:
+    result = runner.invoke(
+        app,
+        [
+            "paper-run",
+            "--data-dir",
+            str(sample_data_dir),
+            "--duration",
+            "600",
+            "--async-orders",
+            "--latency-ms",
+            "25",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Async legs" in result.output
 
 
 def test_report(sample_data_dir: Path, tmp_path: Path) -> None:
@@ -52,3 +95,106 @@ def test_report(sample_data_dir: Path, tmp_path: Path) -> None:
     )
     assert result.exit_code == 0
     assert (tmp_path / "summary.md").exists()
+
+
+def test_generate_data_parquet_dataset(tmp_path: Path) -> None:
+    result = runner.invoke(app, ["generate-data", "--output", str(tmp_path), "--format", "parquet"])
+    assert result.exit_code == 0
+    assert any((tmp_path / "orderbook").glob("symbol=*/date=*/venue=*/*.parquet"))
+
+    result = runner.invoke(
+        app, ["backtest", "--data-dir", str(tmp_path), "--output", str(tmp_path / "reports")]
+    )
+    assert result.exit_code == 0
+
+
+def test_sweep(sample_data_dir: Path, tmp_path: Path) -> None:
+    result = runner.invoke(
+        app,
+        [
+            "sweep",
+            "--data-dir",
+            str(sample_data_dir),
+            "--output",
+            str(tmp_path),
+            "-p",
+            "min_spread_bps=5,15",
+            "-p",
+            "fee_rate=0.001",
+            "--workers",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Swept 2 points" in result.stdout
+    assert (tmp_path / "sweep_results.csv").exists()
+
+
+def test_walk_forward(sample_data_dir: Path, tmp_path: Path) -> None:
+    result = runner.invoke(
+        app,
+        [
+            "walk-forward",
+            "--data-dir",
+            str(sample_data_dir),
+            "--output",
+            str(tmp_path),
+            "-p",
+            "min_spread_bps=5,15",
+            "--train",
+            "6h",
+            "--test",
+            "6h",
+            "--workers",
+            "1",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "3 splits" in result.stdout
+    assert (tmp_path / "walk_forward.csv").exists()
+    assert (tmp_path / "walk_forward_trials.csv").exists()
+
+
+def test_bench_compares_against_baseline(tmp_path: Path) -> None:
+    args = ["bench", "--days", "1", "--venues", "2", "--repeat", "1", "--max-calls", "50"]
+    first = tmp_path / "baseline.json"
+    result = runner.invoke(app, [*args, "--output", str(first)])
+    assert result.exit_code == 0
+    assert "1d_2v" in result.stdout
+
+    # A baseline far faster than anything measurable must report regressions
+    data = json.loads(first.read_text())
+    for stage in data["cases"]["1d_2v"]["stages"].values():
+        stage["throughput"] *= 1000
+    first.write_text(json.dumps(data))
+    result = runner.invoke(
+        app, [*args, "--output", str(tmp_path / "bench.json"), "--baseline", str(first)]
+    )
+    assert result.exit_code == 1
+    assert "regression" in result.stdout
+
+
+def test_compare(sample_data_dir: Path, tmp_path: Path) -> None:
+    result = runner.invoke(
+        app,
+        [
+            "compare",
+            "--data-dir",
+            str(sample_data_dir),
+            "--output",
+            str(tmp_path),
+            "-s",
+            "simple_spread",
+            "-s",
+            "simple_spread:min_spread_bps=5",
+            "-s",
+            "stat_arb:window=50,mode=ewm",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    summary = pd.read_csv(tmp_path / "compare_results.csv")
+    assert summary["strategy"].tolist()[1] == "simple_spread:min_spread_bps=5"
+    assert (summary["signal_count"] > 0).all()
+
+    bad = runner.invoke(app, ["compare", "--data-dir", str(sample_data_dir), "-s", "nope"])
+    assert bad.exit_code != 0
@@ -0,0 +1,93 @@
+"""Tests for the simulation clock modes and paper sessions."""
+
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pandas as pd
+
+from ai_arb_lab.core.clock import SimClock, from_ns, to_ns
+from ai_arb_lab.core.events import OrderbookEvent
+from ai_arb_lab.core.scheduler import EventScheduler
+from ai_arb_lab.execution.session import PaperSession
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+T0 = datetime(2025, 1, 1)
+
+
+def test_time_is_stored_as_int_nanoseconds() -> None:
+    clock = SimClock(current_time=T0)
+    assert clock.now_ns == pd.Timestamp(T0).value
+    assert to_ns(datetime(2025, 1, 1, tzinfo=UTC)) == clock.now_ns
+    assert from_ns(clock.now_ns + 1_500) == T0 + timedelta(microseconds=1)
+
+    clock.speed_multiplier = 10.0
+    assert clock.advance_seconds(1.5) == T0 + timedelta(seconds=15)
+    clock.current_time = T0
+    assert clock.now() == T0
+
+
+async def test_afap_jumps_and_paced_sleeps() -> None:
+    clock = SimClock(current_time=T0)
+    target = clock.now_ns + 3_600 * 10**9
+    t0 = time.monotonic()
+    await clock.wait_until(target)
+    assert time.monotonic() - t0 < 0.05
+    assert clock.now_ns == target
+    assert clock.drift().waits == 0
+
+    clock.set_mode("paced", speed_multiplier=600.0)  # 60s of data in 0.1s
+    t0 = time.monotonic()
+    for step in range(1, 7):
+        await clock.wait_until(target + step * 10 * 10**9)
+    elapsed = time.monotonic() - t0
+    assert 0.09 <= elapsed < 0.5
+    drift = clock.drift()
+    assert drift.waits == 6
+    assert drift.max_lag_ms >= drift.mean_lag_ms >= 0.0
+
+
+async def test_scheduler_run_async_paces_events() -> None:
+    clock = SimClock(current_time=T0, speed_multiplier=100.0, mode="paced")
+    scheduler = EventScheduler(clock)
+    fired: list[float] = []
+    for seconds in (5, 10):
+        scheduler.schedule_in(timedelta(seconds=seconds), lambda: fired.append(time.monotonic()))
+    t0 = time.monotonic()
+    assert await scheduler.run_async() == 2
+    assert 0.09 <= fired[-1] - t0 < 0.5
+
+
+def _events(n: int) -> list[OrderbookEvent]:
+    return [
+        OrderbookEvent(
+            timestamp=T0 + timedelta(seconds=i),
+            venue=f"venue_{i % 2}",
+            symbol="BTC-USD",
+            bid_price=100.0 + (i % 2),
+            ask_price=100.2 + (i % 2) * 0.6,
+            bid_size=1.0,
+            ask_size=1.0,
+        )
+        for i in range(n)
+    ]
+
+
+async def test_paper_session_switches_mode_mid_run() -> None:
+    session = PaperSession(SimpleSpreadStrategy(min_spread_bps=0.0, fee_rate=0.0))
+    events = _events(20)
+
+    async def stream() -> AsyncIterator[OrderbookEvent]:
+        for i, event in enumerate(events):
+            if i == 10:
+                session.set_mode("paced", speed_multiplier=100.0)  # 9s of data in 0.09s
+            yield event
+
+    t0 = time.monotonic()
+    stats = await session.run(stream(), until=T0 + timedelta(seconds=19))
+    elapsed = time.monotonic() - t0
+    assert stats.events == 19
+    assert stats.signals > 0 and stats.fills == stats.orders
+    assert 0.08 <= elapsed < 0.5
+    assert stats.drift is not None and stats.drift.waits == 9
+    assert session.clock.now() == T0 + timedelta(seconds=18)
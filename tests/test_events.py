@@ -0,0 +1,92 @@
+"""Tests for columnar event batches."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from ai_arb_lab.core.batch import EventBatch
+from ai_arb_lab.core.bus import EventBus
+from ai_arb_lab.core.events import FillEvent, OrderbookEvent, TradeEvent
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+
+
+def _trades(n: int = 10) -> list[TradeEvent]:
+    start = datetime(2025, 1, 1)
+    return [
+        TradeEvent(
+            timestamp=start + timedelta(seconds=i),
+            venue=f"venue_{i % 3}",
+            symbol="BTC-USD",
+            price=50000.0 + i,
+            size=0.1 * (i + 1),
+            side="buy" if i % 2 else "sell",
+        )
+        for i in range(n)
+    ]
+
+
+def test_batch_roundtrip_trades() -> None:
+    events = _trades()
+    batch = EventBatch.from_events(events)
+    assert len(batch) == 10
+    assert batch.timestamps.dtype == np.int64
+    assert batch.floats["price"].dtype == np.float64
+    assert batch.categories["venue"] == ("venue_0", "venue_1", "venue_2")
+    assert batch.to_events() == events
+
+
+def test_batch_roundtrip_fills_with_optional_fields() -> None:
+    fill = FillEvent(
+        timestamp=datetime(2025, 1, 1),
+        order_id="ord-1",
+        fill_id="fill-1",
+        symbol="BTC-USD",
+        side="buy",
+        venue="venue_0",
+        price=100.0,
+        size=1.0,
+        fee=0.1,
+    )
+    batch = EventBatch.from_events([fill])
+    assert batch.codes["correlation_id"][0] == -1
+    assert batch.to_events() == [fill]
+
+
+def test_batch_slice_is_view() -> None:
+    batch = EventBatch.from_events(_trades(100))
+    window = batch[10:20]
+    assert len(window) == 10
+    assert np.shares_memory(window.timestamps, batch.timestamps)
+    assert np.shares_memory(window.floats["price"], batch.floats["price"])
+    assert window.column("price")[0] == 50010.0
+
+
+def test_batch_from_orderbook_frame() -> None:
+    ob = SyntheticMarketGenerator(seed=42).generate_orderbook(datetime(2025, 1, 1), days=1)
+    batch = EventBatch.from_frame(ob, OrderbookEvent)
+    assert len(batch) == len(ob)
+    assert np.array_equal(batch.floats["bid_price"], ob["bid_price"].to_numpy())
+    first = batch[:1].to_events()[0]
+    assert isinstance(first, OrderbookEvent)
+    assert first.venue == ob["venue"].iloc[0]
+    assert first.timestamp == ob["timestamp"].iloc[0]
+
+
+def test_batch_from_frame_missing_required_column() -> None:
+    ob = SyntheticMarketGenerator(seed=42).generate_orderbook(datetime(2025, 1, 1), days=1)
+    with pytest.raises(ValueError, match="ask_price"):
+        EventBatch.from_frame(ob.drop(columns=["ask_price"]), OrderbookEvent)
+
+
+async def test_bus_publishes_batches() -> None:
+    bus = EventBus()
+    received: list[EventBatch] = []
+
+    async def handler(batch: EventBatch) -> None:
+        received.append(batch)
+
+    bus.subscribe(EventBatch, handler)
+    await bus.publish(EventBatch.from_events(_trades()))
+    assert len(received) == 1
+    assert received[0].event_type is TradeEvent
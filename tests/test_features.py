@@ -0,0 +1,120 @@
+"""Tests for the incremental feature store."""
+
+import math
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_arb_lab.backtest.event_driven import run_event_backtest
+from ai_arb_lab.core.batch import EventBatch
+from ai_arb_lab.core.events import OrderbookEvent, TradeEvent
+from ai_arb_lab.data.features import EMA, RSI, FeatureStore, Mid
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.strategies.base import BaseStrategy, Signal
+
+START = datetime(2025, 1, 1)
+
+
+def _replay(store: FeatureStore, frame: pd.DataFrame, event_type: type) -> pd.DataFrame:
+    """Feature values after each row, fed one event at a time."""
+    rows = []
+    for event in EventBatch.from_frame(frame, event_type).iter_events():
+        store.update(event)
+        rows.append(store.values(event.venue, event.symbol))
+    return pd.DataFrame(rows, index=frame.index)
+
+
+def test_backfill_matches_incremental_updates() -> None:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    orderbook = gen.generate_orderbook(START, days=1, snapshots_per_minute=2)
+    trades = gen.generate_trades(START, days=1)
+    store = FeatureStore()
+
+    for frame, source, event_type in (
+        (orderbook, "orderbook", OrderbookEvent),
+        (trades, "trades", TradeEvent),
+    ):
+        batch = store.backfill(frame, source)
+        live = _replay(store, frame, event_type)[batch.columns]
+        # Bit-identical, NaN warm-up rows included
+        pd.testing.assert_frame_equal(batch, live, check_exact=True)
+
+    last = orderbook.iloc[-1]
+    values = store.values(last["venue"], last["symbol"])
+    assert 0 <= values["rsi_14"] <= 100
+    assert -1 <= values["book_imbalance"] <= 1 and -1 <= values["tfi_50"] <= 1
+    assert values["rv_20"] > 0
+
+
+def _quote(venue: str, bid: float, ask: float) -> OrderbookEvent:
+    return OrderbookEvent(
+        venue=venue, symbol="X-USD", bid_price=bid, bid_size=1.0, ask_price=ask, ask_size=1.0
+    )
+
+
+def test_store_keeps_streams_apart_and_warms_up() -> None:
+    store = FeatureStore([Mid(), EMA(3), RSI(3)])
+    for i, price in enumerate([100.0, 101.0, 102.0, 103.0]):
+        store.update(_quote("a", price - 1, price + 1))
+        store.update(_quote("b", 9.0, 11.0))
+        assert math.isnan(store.get("rsi_3", "a", "X-USD")) == (i < 3)
+    assert store.get("mid", "a", "X-USD") == 103.0
+    assert store.get("mid", "b", "X-USD") == 10.0
+    assert store.get("rsi_3", "a", "X-USD") == 100.0
+    assert math.isnan(store.get("ema_3", "c", "X-USD"))
+    with pytest.raises(KeyError):
+        store.get("nope", "a", "X-USD")
+    with pytest.raises(ValueError):
+        store.register(Mid())
+
+    store.reset()
+    assert math.isnan(store.get("mid", "a", "X-USD"))
+
+
+def test_materialize_caches_by_fingerprint(tmp_path: Path) -> None:
+    gen = SyntheticMarketGenerator(seed=6, n_venues=2)
+    orderbook = gen.generate_orderbook(START, days=1)
+    store = FeatureStore()
+
+    first = store.materialize(orderbook, tmp_path)
+    files = list(tmp_path.glob("orderbook-*.parquet"))
+    assert len(files) == 1
+    again = store.materialize(orderbook, tmp_path)
+    pd.testing.assert_frame_equal(again, first)
+    assert list(tmp_path.glob("orderbook-*.parquet")) == files
+
+    # Different data or different features get their own entry
+    changed = orderbook.assign(bid_price=orderbook["bid_price"] * 1.01)
+    assert store.fingerprint(changed) != store.fingerprint(orderbook)
+    store.register(EMA(5))
+    store.materialize(orderbook, tmp_path)
+    assert len(list(tmp_path.glob("orderbook-*.parquet"))) == 2
+
+
+class _MidCross(BaseStrategy):
+    """Records the EMA it reads from the store on every update."""
+
+    def __init__(self) -> None:
+        self.seen: list[float] = []
+
+    def evaluate(self, market_data: dict[str, object]) -> Signal | None:  # noqa: ARG002
+        return None
+
+    def on_orderbook(self, event: OrderbookEvent) -> Signal | None:
+        self.seen.append(self.feature("ema_20", event.venue, event.symbol))
+        return None
+
+
+def test_event_backtest_updates_strategy_features() -> None:
+    orderbook = SyntheticMarketGenerator(seed=7).generate_orderbook(START, days=1)
+    strategy = _MidCross()
+    assert math.isnan(strategy.feature("ema_20", "venue_0", "BTC-USD"))
+    strategy.features = FeatureStore()
+
+    run_event_backtest(orderbook, strategy, 10_000.0)
+
+    expected = strategy.features.backfill(orderbook)["ema_20"].to_numpy()
+    np.testing.assert_array_equal(np.array(strategy.seen), expected)
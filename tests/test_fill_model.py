@@ -0,0 +1,84 @@
+"""Tests for seeded and batched fill simulation."""
+
+import numpy as np
+import pytest
+
+from ai_arb_lab.core.clock import SimClock
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.strategies.base import Signal
+
+PRICES = [100.0, 101.0, 99.5, 102.0, 100.5, 98.0]
+SIDES = ["buy", "sell", "buy", "buy", "sell", "sell"]
+
+
+def test_batch_matches_per_order_fills() -> None:
+    single = FillModel(fill_probability=0.6, seed=11)
+    batched = FillModel(fill_probability=0.6, seed=11)
+    clock = SimClock()
+    expected = [
+        single.simulate_fill(f"o{i}", "BTC-USD", side, "v", price, 0.5, clock)
+        for i, (side, price) in enumerate(zip(SIDES, PRICES, strict=True))
+    ]
+    batch = batched.simulate_fills(SIDES, PRICES, np.full(len(PRICES), 0.5))
+
+    assert batch.filled.tolist() == [fill is not None for fill in expected]
+    assert 0 < batch.filled.sum() < len(PRICES)
+    for i, fill in enumerate(expected):
+        if fill is None:
+            assert batch.size[i] == 0.0 and batch.fill_seq[i] == -1
+            continue
+        assert batch.price[i] == pytest.approx(fill.price)
+        assert batch.fee[i] == pytest.approx(fill.fee)
+        assert batch.fill_id(i) == fill.fill_id
+
+
+def test_same_seed_same_fills() -> None:
+    def run(seed: int) -> list[bool]:
+        return (
+            FillModel(fill_probability=0.5, seed=seed)
+            .simulate_fills(SIDES * 10, PRICES * 10, 1.0)
+            .filled.tolist()
+        )
+
+    assert run(3) == run(3)
+    assert run(3) != run(4)
+
+
+def test_paper_broker_batch_matches_submit_order() -> None:
+    signals = [
+        Signal(
+            symbol="BTC-USD",
+            side="buy",
+            venue_buy="a",
+            venue_sell="b",
+            price_buy=price,
+            price_sell=price * 1.002,
+            size=0.01,
+            expected_profit_bps=20.0,
+        )
+        for price in PRICES
+    ]
+    model = {"fill_probability": 0.7, "seed": 2}
+    sequential = PaperBroker(10_000.0, FillModel(**model))
+    clock = SimClock()
+    expected = [sequential.submit_order(signal, clock)[1] for signal in signals]
+
+    batched = PaperBroker(10_000.0, FillModel(**model))
+    pair = batched.simulate_batch(
+        [s.price_buy for s in signals], [s.price_sell for s in signals], 0.01
+    )
+    events = batched.settle_batch(
+        pair,
+        np.ones(len(signals), dtype=bool),
+        [s.symbol for s in signals],
+        [s.venue_buy for s in signals],
+        [s.venue_sell for s in signals],
+        [clock.now()] * len(signals),
+    )
+
+    assert batched.capital == pytest.approx(sequential.capital)
+    assert batched.ledger.realized_pnl == pytest.approx(sequential.ledger.realized_pnl)
+    assert batched.ledger.net_exposure == pytest.approx(sequential.ledger.net_exposure)
+    filled = [fill for fill in expected if fill is not None]
+    assert [(e.order_id, e.fill_id) for e in events] == [(f.order_id, f.fill_id) for f in filled]
@@ -0,0 +1,56 @@
+"""Tests for CLI startup cost."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import ai_arb_lab
+
+SRC = str(Path(ai_arb_lab.__file__).parents[1])
+
+# Import budget for the CLI module, excluding Typer itself (a fixed cost)
+BUDGET_US = 50_000
+
+HEAVY = {"numpy", "pandas", "pyarrow", "pydantic", "structlog", "dotenv", "asyncio"}
+
+
+def _importtime(statement: str) -> dict[str, int]:
+    """Cumulative import time in microseconds per module for `statement`."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([SRC, os.environ.get("PYTHONPATH", "")])}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_imports_no_heavy_dependencies() -> None:
+    imported = {name.split(".")[0] for name in _importtime("import ai_arb_lab.cli")}
+    assert not imported & HEAVY
+
+
+def test_cli_import_within_budget() -> None:
+    # Typer (and the stdlib it pulls in) is imported first so it is not charged
+    # to the CLI; best of three runs, so one slow start does not fail
+    costs = [_importtime("import typer; import ai_arb_lab.cli")["ai_arb_lab.cli"] for _ in range(3)]
+    assert min(costs) < BUDGET_US
+
+
+def test_config_reads_settings_on_first_access() -> None:
+    code = (
+        "import sys, ai_arb_lab.config as c; "
+        "assert 'dotenv' not in sys.modules; "
+        "assert c.METRICS_PORT == 9191 and 'dotenv' in sys.modules"
+    )
+    env = {**os.environ, "PYTHONPATH": SRC, "METRICS_PORT": "9191"}
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -0,0 +1,121 @@
+"""Tests for the position ledger and ledger-backed risk limits."""
+
+import numpy as np
+import pytest
+
+from ai_arb_lab.core.ledger import PositionLedger
+from ai_arb_lab.risk.limits import RiskLimits
+from ai_arb_lab.strategies.base import Signal
+
+DAY = 24 * 3600 * 10**9
+
+
+def _signal(size: float = 1.0) -> Signal:
+    return Signal(
+        symbol="BTC-USD",
+        side="buy",
+        venue_buy="v1",
+        venue_sell="v2",
+        price_buy=100.0,
+        price_sell=101.0,
+        size=size,
+        expected_profit_bps=10.0,
+    )
+
+
+def test_average_cost_and_realized_pnl() -> None:
+    ledger = PositionLedger()
+    ledger.apply("v1", "BTC-USD", "buy", 100.0, 2.0)
+    ledger.apply("v1", "BTC-USD", "buy", 110.0, 2.0, fee=1.0)
+    position = ledger.position("v1", "BTC-USD")
+    assert position is not None
+    assert position.avg_cost == pytest.approx(105.0)
+
+    ledger.apply("v1", "BTC-USD", "sell", 120.0, 3.0)
+    assert position.quantity == pytest.approx(1.0)
+    assert ledger.realized_pnl == pytest.approx(3 * 15.0 - 1.0)
+
+    # Selling through zero opens a short at the fill price
+    ledger.apply("v1", "BTC-USD", "sell", 90.0, 2.0)
+    assert position.quantity == pytest.approx(-1.0)
+    assert position.avg_cost == pytest.approx(90.0)
+    assert ledger.realized_pnl == pytest.approx(44.0 - 15.0)
+
+
+def test_running_totals_match_positions() -> None:
+    rng = np.random.default_rng(1)
+    ledger = PositionLedger()
+    for _ in range(500):
+        venue = str(rng.choice(["v1", "v2", "v3"]))
+        symbol = str(rng.choice(["BTC-USD", "ETH-USD"]))
+        price = float(rng.uniform(90, 110))
+        if rng.random() < 0.3:
+            ledger.mark(venue, symbol, price)
+        else:
+            side = "buy" if rng.random() < 0.5 else "sell"
+            ledger.apply(venue, symbol, side, price, float(rng.uniform(0.1, 2)), fee=0.01)
+
+    positions = list(ledger)
+    assert ledger.unrealized_pnl == pytest.approx(sum(p.unrealized_pnl for p in positions))
+    assert ledger.gross_exposure == pytest.approx(sum(p.exposure for p in positions))
+    assert ledger.venue_exposure("v2") == pytest.approx(
+        sum(p.exposure for p in positions if p.venue == "v2")
+    )
+    assert ledger.realized_pnl == pytest.approx(sum(p.realized_pnl for p in positions))
+    net = sum(p.quantity for p in positions if p.symbol == "ETH-USD")
+    assert ledger.net_quantity("ETH-USD") == pytest.approx(net)
+
+
+def test_balanced_legs_have_no_net_exposure() -> None:
+    ledger = PositionLedger()
+    ledger.apply("v1", "BTC-USD", "buy", 100.0, 1.0)
+    ledger.apply("v2", "BTC-USD", "sell", 101.0, 1.0)
+    assert ledger.net_exposure == pytest.approx(0.0)
+    assert ledger.gross_exposure == pytest.approx(201.0)
+    assert ledger.inventory("v2") == {"BTC-USD": -1.0}
+
+
+def test_daily_pnl_rolls_over() -> None:
+    ledger = PositionLedger()
+    ledger.apply("v1", "BTC-USD", "buy", 100.0, 1.0, ts_ns=DAY // 2)
+    ledger.mark("v1", "BTC-USD", 90.0, ts_ns=DAY - 1)
+    assert ledger.daily_pnl == pytest.approx(-10.0)
+
+    ledger.mark("v1", "BTC-USD", 95.0, ts_ns=DAY + 1)
+    assert ledger.daily_pnl == pytest.approx(5.0)
+    assert ledger.total_pnl == pytest.approx(-5.0)
+
+
+def test_limits_read_ledger() -> None:
+    ledger = PositionLedger()
+    limits = RiskLimits(max_exposure=1_000.0, max_daily_loss=50.0, ledger=ledger)
+    assert limits.check(_signal(), 100_000.0)[0]
+
+    # A one-legged fill is directional exposure
+    ledger.apply("v1", "BTC-USD", "buy", 100.0, 8.0)
+    ok, reason = limits.check(_signal(), 100_000.0)
+    assert not ok and "Exposure" in reason
+
+    ledger.mark("v1", "BTC-USD", 90.0)
+    ledger.apply("v2", "BTC-USD", "sell", 90.0, 8.0)
+    ok, reason = limits.check(_signal(), 100_000.0)
+    assert not ok and "Daily loss" in reason
+
+
+def test_position_limit_per_venue() -> None:
+    ledger = PositionLedger()
+    limits = RiskLimits(max_position=2.5, ledger=ledger)
+    ledger.apply("v1", "BTC-USD", "buy", 100.0, 2.0)
+    assert limits.check(_signal(0.5), 100_000.0)[0]
+    ok, reason = limits.check(_signal(1.0), 100_000.0)
+    assert not ok and "Position" in reason
+
+
+def test_check_batch_matches_check() -> None:
+    ledger = PositionLedger()
+    ledger.apply("v1", "BTC-USD", "buy", 100.0, 3.0)
+    limits = RiskLimits(max_exposure=1_000.0, ledger=ledger)
+    sizes = np.array([0.5, 1.0, 2.0, 4.0])
+    batch = limits.check_batch(np.full(4, 100.0), np.full(4, 101.0), sizes, 100_000.0)
+    assert batch.tolist() == [limits.check(_signal(s), 100_000.0)[0] for s in sizes]
+    assert batch.tolist() == [True, True, True, False]
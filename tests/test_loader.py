@@ -0,0 +1,85 @@
+"""Tests for data loading and the partitioned dataset layout."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ai_arb_lab.data.dataset import load_dataset, write_dataset
+from ai_arb_lab.data.loader import load_data_dir
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+
+START = datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def dataset_dir(tmp_path: Path) -> Path:
+    gen = SyntheticMarketGenerator(seed=42, n_venues=3)
+    gen.generate_all(tmp_path, start=START, days=2, fmt="parquet")
+    return tmp_path
+
+
+def test_load_data_dir_csv(sample_data_dir: Path) -> None:
+    data = load_data_dir(sample_data_dir)
+    assert set(data) == {"trades", "orderbook", "candles"}
+    assert pd.api.types.is_datetime64_any_dtype(data["orderbook"]["timestamp"])
+
+
+def test_dataset_matches_csv(tmp_path: Path) -> None:
+    gen = SyntheticMarketGenerator(seed=42, n_venues=3)
+    gen.generate_all(tmp_path / "csv", start=START, days=1)
+    gen = SyntheticMarketGenerator(seed=42, n_venues=3)
+    gen.generate_all(tmp_path / "pq", start=START, days=1, fmt="parquet")
+
+    csv = load_data_dir(tmp_path / "csv")
+    pq = load_data_dir(tmp_path / "pq")
+    for kind in ("trades", "orderbook"):
+        expected = csv[kind]
+        actual = pq[kind][expected.columns]
+        pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+
+
+def test_dataset_partition_layout(dataset_dir: Path) -> None:
+    dates = sorted(p.name for p in (dataset_dir / "orderbook" / "symbol=BTC-USD").iterdir())
+    assert dates == ["date=2025-01-01", "date=2025-01-02"]
+    venues = sorted(
+        p.name for p in (dataset_dir / "orderbook/symbol=BTC-USD/date=2025-01-01").iterdir()
+    )
+    assert venues == ["venue=venue_0", "venue=venue_1", "venue=venue_2"]
+
+
+def test_dataset_filters(dataset_dir: Path) -> None:
+    start = START + timedelta(days=1, hours=5)
+    end = start + timedelta(hours=1)
+    df = load_dataset(
+        dataset_dir / "orderbook", "orderbook", start=start, end=end, venues=["venue_1"]
+    )
+    assert len(df) == 20
+    assert (df["venue"] == "venue_1").all()
+    assert df["timestamp"].min() >= start
+    assert df["timestamp"].max() < end
+    assert df["timestamp"].is_monotonic_increasing
+
+
+def test_load_data_dir_filters_csv_and_dataset_agree(tmp_path: Path) -> None:
+    SyntheticMarketGenerator(seed=1, n_venues=2).generate_all(tmp_path / "a", start=START)
+    SyntheticMarketGenerator(seed=1, n_venues=2).generate_all(
+        tmp_path / "b", start=START, fmt="parquet"
+    )
+    kwargs = {
+        "start": START + timedelta(hours=3),
+        "end": START + timedelta(hours=4),
+        "venues": ["venue_0"],
+    }
+    a = load_data_dir(tmp_path / "a", **kwargs)["orderbook"]
+    b = load_data_dir(tmp_path / "b", **kwargs)["orderbook"]
+    assert len(a) == len(b) == 30
+    assert a["bid_price"].tolist() == pytest.approx(b["bid_price"].tolist())
+
+
+def test_write_dataset_appends_parts(tmp_path: Path) -> None:
+    ob = SyntheticMarketGenerator(seed=3).generate_orderbook(START, days=1)
+    write_dataset(ob.iloc[:700], tmp_path, "orderbook", part=0)
+    write_dataset(ob.iloc[700:], tmp_path, "orderbook", part=1)
+    assert len(load_dataset(tmp_path / "orderbook", "orderbook")) == len(ob)
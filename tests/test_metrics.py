@@ -0,0 +1,102 @@
+"""Tests for streaming backtest metrics."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from ai_arb_lab.backtest.engine import run_backtest
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.reporting.metrics import BacktestMetrics, EquityCurve, MetricsAccumulator
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+
+def _equity_path(n: int = 2000, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 1000.0 * np.cumprod(1.0 + rng.normal(0.0002, 0.01, n))
+
+
+def test_accumulator_matches_full_history() -> None:
+    equity = _equity_path()
+    acc = MetricsAccumulator(1000.0, periods_per_year=252)
+    for value in equity.tolist():
+        acc.mark(value)
+
+    returns = np.diff(np.concatenate(([1000.0], equity))) / np.concatenate(([1000.0], equity[:-1]))
+    peaks = np.maximum.accumulate(np.concatenate(([1000.0], equity)))[1:]
+    downside = np.sqrt((np.minimum(returns, 0.0) ** 2).mean())
+    assert acc.max_drawdown_pct == pytest.approx(((peaks - equity) / peaks).max())
+    assert acc.sharpe_ratio == pytest.approx(returns.mean() / returns.std() * np.sqrt(252))
+    assert acc.sortino_ratio == pytest.approx(returns.mean() / downside * np.sqrt(252))
+
+
+def test_mark_many_matches_mark() -> None:
+    equity = _equity_path()
+    one = MetricsAccumulator(1000.0, periods_per_year=252, curve_points=64)
+    many = MetricsAccumulator(1000.0, periods_per_year=252, curve_points=64)
+    for value in equity.tolist():
+        one.mark(value)
+    for chunk in np.array_split(equity, 7):
+        many.mark_many(chunk)
+
+    assert many.max_drawdown_pct == pytest.approx(one.max_drawdown_pct)
+    assert many.sharpe_ratio == pytest.approx(one.sharpe_ratio)
+    assert many.sortino_ratio == pytest.approx(one.sortino_ratio)
+    assert one.curve is not None and many.curve is not None
+    assert one.curve.to_frame().equals(many.curve.to_frame())
+
+
+def test_equity_curve_is_bounded_and_evenly_spaced() -> None:
+    curve = EquityCurve(max_points=100)
+    for i in range(10_001):
+        curve.append(i, float(i))
+
+    frame = curve.to_frame()
+    assert len(curve) <= 100
+    assert frame["equity"].iloc[-1] == 10_000.0
+    steps = np.diff(frame["equity"].to_numpy()[:-1])
+    assert (steps == curve.stride).all()
+
+
+def test_trades_and_annualization() -> None:
+    acc = MetricsAccumulator(100.0)
+    acc.record_trade(5.0)
+    acc.record_trades([-2.0, 3.0, 0.0])
+    assert (acc.trade_count, acc.win_count) == (4, 2)
+    assert acc.win_rate == pytest.approx(0.5)
+    assert acc.profit_factor == pytest.approx(4.0)
+
+    # 366 daily marks (returns) spanning 365 days: 366 periods per year
+    day = 24 * 3600 * 10**9
+    equity = _equity_path(366)
+    timed = MetricsAccumulator(1000.0)
+    timed.mark_many(equity, np.arange(366) * day)
+    daily = MetricsAccumulator(1000.0, periods_per_year=366)
+    daily.mark_many(equity)
+    assert timed.sharpe_ratio == pytest.approx(daily.sharpe_ratio)
+
+
+def test_from_results_uses_returns_path() -> None:
+    metrics = BacktestMetrics.from_results(100.0, 105.0, 4, 3, returns=[0.1, -0.2, 0.05, 0.25])
+    assert metrics.max_drawdown_pct == pytest.approx(0.2)
+    assert metrics.sharpe_ratio is not None
+    assert metrics.win_rate == pytest.approx(0.75)
+
+
+def test_backtest_counts_profitable_trades() -> None:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    orderbook = gen.generate_orderbook(datetime(2025, 1, 1), days=1, snapshots_per_minute=4)
+    strategy = SimpleSpreadStrategy(min_spread_bps=0.0, fee_rate=0.0)
+    broker = PaperBroker(initial_capital=100_000.0, fill_model=FillModel(fee_rate=0.002))
+    result = run_backtest(orderbook, strategy, 100_000.0, broker=broker)
+    metrics = result.metrics
+
+    assert metrics.trade_count == len(result.fills) > 0
+    assert 0 < metrics.win_count < metrics.trade_count
+    assert metrics.final_capital == pytest.approx(broker.capital)
+    assert metrics.max_drawdown_pct > 0
+    assert metrics.sharpe_ratio is not None
+    assert result.equity_curve is not None
+    assert result.equity_curve["equity"].iloc[-1] == pytest.approx(broker.capital)
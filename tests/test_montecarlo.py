@@ -0,0 +1,69 @@
+"""Tests for Monte Carlo stress testing."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_arb_lab.backtest.engine import BacktestResult, run_backtest
+from ai_arb_lab.backtest.montecarlo import StressScenario, stress_test
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.reporting.render import render_markdown_report
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+CAPITAL = 100_000.0
+
+
+@pytest.fixture
+def backtest() -> BacktestResult:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    ob = gen.generate_orderbook(datetime(2025, 1, 1), days=1, snapshots_per_minute=4)
+    strategy = SimpleSpreadStrategy(min_spread_bps=0.0, fee_rate=0.0, slippage_bps=0.0)
+    return run_backtest(ob, strategy, initial_capital=CAPITAL)
+
+
+def test_deterministic_scenario_matches_broker(backtest: BacktestResult) -> None:
+    assert backtest.signals["executed"].sum() > 10
+    scenario = StressScenario(
+        slippage_bps=5.0, slippage_std_bps=0.0, fill_probability=1.0, latency_ms=0.0
+    )
+    mc = stress_test(backtest.signals, CAPITAL, scenario, n_paths=50)
+    assert np.all(mc.pnl == mc.pnl[0])
+    assert mc.pnl[0] == pytest.approx(backtest.metrics.total_return)
+    assert mc.summary().fill_rate == 1.0
+
+
+def test_seeded_paths_are_reproducible(backtest: BacktestResult) -> None:
+    a = stress_test(backtest.signals, CAPITAL, n_paths=500, seed=1)
+    b = stress_test(backtest.signals, CAPITAL, n_paths=500, seed=1)
+    c = stress_test(backtest.signals, CAPITAL, n_paths=500, seed=2)
+    np.testing.assert_array_equal(a.pnl, b.pnl)
+    assert not np.array_equal(a.pnl, c.pnl)
+
+
+def test_summary_risk_measures(backtest: BacktestResult) -> None:
+    scenario = StressScenario(fill_probability=0.8, latency_ms=200.0, volatility_bps=50.0)
+    mc = stress_test(backtest.signals, CAPITAL, scenario, n_paths=2000, seed=3)
+    stats = mc.summary(confidence=0.95, ruin_fraction=1e-4)
+    assert stats.paths == 2000
+    assert stats.cvar >= stats.var
+    assert stats.percentiles["p5"] == pytest.approx(-stats.var)
+    assert stats.fill_rate == pytest.approx(0.8, abs=0.01)
+    assert 0.0 < stats.ruin_probability <= 1.0
+    assert np.all(mc.min_equity_pnl <= 0)
+
+
+def test_no_executed_signals() -> None:
+    signals = pd.DataFrame({"price_buy": [100.0], "price_sell": [101.0], "executed": [False]})
+    mc = stress_test(signals, CAPITAL, n_paths=10)
+    assert mc.n_signals == 0
+    assert np.all(mc.pnl == 0)
+
+
+def test_report_includes_stress_section(backtest: BacktestResult) -> None:
+    stats = stress_test(backtest.signals, CAPITAL, n_paths=200).summary()
+    md = render_markdown_report(backtest.metrics, stress=stats)
+    assert "## Stress Test (Monte Carlo)" in md
+    assert "CVaR (95%)" in md
+    assert "| p50 |" in md
@@ -0,0 +1,105 @@
+"""Tests for the quantile sketch and the assistive policy module."""
+
+import pickle
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from ai_arb_lab.ai import PolicyModule, explain_suggestion
+from ai_arb_lab.core.sketch import QuantileSketch
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+
+QS = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def _rank_errors(sketch: QuantileSketch, values: np.ndarray) -> np.ndarray:
+    ordered = np.sort(values)
+    ranks = np.searchsorted(ordered, sketch.quantiles(QS), side="right") / len(values)
+    return np.abs(ranks - np.array(QS))
+
+
+def test_sketch_is_exact_while_small() -> None:
+    values = [5.0, 1.0, 4.0, 2.0, 3.0, float("nan")]
+    sketch = QuantileSketch()
+    sketch.update_many(values)
+    ordered = sorted(v for v in values if v == v)
+    for q in (0.0, 0.2, 0.5, 0.75, 0.99):
+        assert sketch.quantile(q) == ordered[int(q * len(ordered))]
+    assert (sketch.count, sketch.min, sketch.max, sketch.rank_error) == (5, 1.0, 5.0, 0.0)
+    assert sketch.quantile(1.0) == 5.0
+    assert sketch.rank(2.5) == pytest.approx(0.4)
+    assert np.isnan(QuantileSketch().quantile(0.5))
+
+
+def test_sketch_error_and_memory_are_bounded() -> None:
+    values = np.random.default_rng(1).lognormal(0.0, 1.0, 1_000_000)
+    sketch = QuantileSketch(k=200)
+    for chunk in np.array_split(values, 300):
+        sketch.update_many(chunk)
+    for value in values[:1000]:
+        sketch.update(value)
+    values = np.concatenate([values, values[:1000]])
+
+    assert sketch.count == len(values)
+    assert sketch.retained <= 3 * sketch.k + sketch.k
+    assert 0 < sketch.rank_error < 0.02
+    assert _rank_errors(sketch, values).max() <= sketch.rank_error
+    assert (sketch.min, sketch.max) == (values.min(), values.max())
+
+
+def test_sketches_merge_across_parts_and_processes() -> None:
+    values = np.random.default_rng(2).normal(10.0, 3.0, 400_000)
+    merged = QuantileSketch()
+    for i, part in enumerate(np.array_split(values, 8)):
+        sketch = QuantileSketch(seed=i)
+        sketch.update_many(part)
+        # Sketches travel between worker processes by pickling
+        merged.merge(pickle.loads(pickle.dumps(sketch)))
+
+    assert merged.count == len(values)
+    assert merged.retained <= 4 * merged.k
+    assert _rank_errors(merged, values).max() <= merged.rank_error
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(k=100))
+
+
+def test_policy_falls_back_and_keeps_percentile_heuristic() -> None:
+    spreads = [12.0, 30.0, 18.0, 25.0, 40.0, 22.0, 15.0, 35.0]
+    disabled = PolicyModule(enabled=False).suggest_min_spread(spreads)
+    assert (disabled.value, disabled.confidence, disabled.bounds) == (20.0, 1.0, None)
+    assert PolicyModule().suggest("slippage_bps").value == 5.0
+
+    suggestion = PolicyModule().suggest_min_spread(spreads)
+    assert suggestion.value == sorted(spreads)[int(len(spreads) * 0.75)]
+    # Eight samples cannot pin down a 75th percentile
+    assert suggestion.confidence < 0.1
+    with pytest.raises(ValueError):
+        PolicyModule().suggest("max_leverage")
+
+
+def test_policy_suggests_from_merged_orderbook_sketches() -> None:
+    gen = SyntheticMarketGenerator(seed=3, n_venues=3)
+    orderbook = gen.generate_orderbook(datetime(2025, 1, 1), days=2, snapshots_per_minute=4)
+    policy = PolicyModule()
+    for _, day in orderbook.groupby(orderbook["timestamp"].dt.date):
+        partial = PolicyModule()
+        partial.observe_orderbook(day)
+        policy.merge(partial)
+    whole = PolicyModule()
+    whole.observe_orderbook(orderbook)
+
+    suggestions = {s.parameter: s for s in policy.suggest_all()}
+    assert set(suggestions) == {"min_spread_bps", "slippage_bps", "max_order_size"}
+    for name, suggestion in suggestions.items():
+        assert suggestion.bounds is not None
+        low, high = suggestion.bounds
+        assert low <= suggestion.value <= high
+        assert 0.5 < suggestion.confidence < 1.0
+        assert suggestion.value == pytest.approx(whole.suggest(name).value, rel=0.05)
+    assert "Range:" in explain_suggestion(suggestions["max_order_size"])
+
+    # More history, narrower rank band, higher confidence
+    one_day = PolicyModule()
+    one_day.observe_orderbook(orderbook[orderbook["timestamp"] < datetime(2025, 1, 1, 6)])
+    assert one_day.suggest("max_order_size").confidence < suggestions["max_order_size"].confidence
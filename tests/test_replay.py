@@ -0,0 +1,62 @@
+"""Tests for the historical replay connector."""
+
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+from ai_arb_lab.connectors.replay import ReplayConnector
+from ai_arb_lab.core.clock import SimClock
+from ai_arb_lab.core.events import OrderbookEvent, TradeEvent
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+
+START = datetime(2025, 1, 1)
+
+
+def _orderbook() -> pd.DataFrame:
+    return SyntheticMarketGenerator(seed=42).generate_orderbook(START, days=1)
+
+
+async def test_replay_csv_streams_all_events(sample_data_dir: Path) -> None:
+    connector = ReplayConnector(sample_data_dir / "orderbook.csv", chunk_size=100)
+    events = [e async for e in connector.stream_events()]
+    expected = pd.read_csv(sample_data_dir / "orderbook.csv")
+    assert len(events) == len(expected)
+    assert all(isinstance(e, OrderbookEvent) for e in events)
+    assert events[-1].bid_price == expected["bid_price"].iloc[-1]
+    assert connector.clock.now() == events[-1].timestamp
+
+
+async def test_replay_infers_trades(sample_data_dir: Path) -> None:
+    connector = ReplayConnector(sample_data_dir / "trades.csv")
+    connector.connect()
+    assert connector.event_type is TradeEvent
+
+
+async def test_replay_parquet_time_filter(tmp_path: Path) -> None:
+    path = tmp_path / "orderbook.parquet"
+    _orderbook().to_parquet(path, index=False, row_group_size=60)
+    start = START + timedelta(hours=2)
+    end = START + timedelta(hours=3)
+    connector = ReplayConnector(path, start=start, end=end, chunk_size=25)
+
+    batches = [b async for b in connector.stream_batches()]
+    events = [e for b in batches for e in b.to_events()]
+    assert len(events) == 60
+    assert events[0].timestamp == start
+    assert all(start <= e.timestamp < end for e in events)
+    assert max(len(b) for b in batches) <= 25
+
+
+async def test_replay_paced_respects_speed(tmp_path: Path) -> None:
+    path = tmp_path / "orderbook.csv"
+    _orderbook().head(3).to_csv(path, index=False)  # 2 minutes of data
+    clock = SimClock(speed_multiplier=1200.0)  # 120s / 1200 = 0.1s
+    connector = ReplayConnector(path, clock=clock, mode="paced")
+
+    t0 = time.monotonic()
+    events = [e async for e in connector.stream_events()]
+    elapsed = time.monotonic() - t0
+    assert len(events) == 3
+    assert 0.09 <= elapsed < 1.0
@@ -0,0 +1,188 @@
+"""Tests for the discrete-event scheduler and latency-aware execution."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_arb_lab.backtest.event_driven import run_event_backtest, run_multi_backtest
+from ai_arb_lab.core.events import FillEvent, OrderbookEvent
+from ai_arb_lab.core.scheduler import EventScheduler
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.execution.fill_model import FillModel
+from ai_arb_lab.execution.latency import LatencyModel, VenueLatency
+from ai_arb_lab.execution.paper_broker import PaperBroker
+from ai_arb_lab.strategies.base import BaseStrategy, Signal
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+from ai_arb_lab.strategies.stat_arb import StatArbStrategy
+from ai_arb_lab.strategies.top_of_book import TopOfBookIndex
+
+T0 = datetime(2025, 1, 1)
+
+
+def _scheduler() -> EventScheduler:
+    scheduler = EventScheduler()
+    scheduler.clock.start(T0)
+    return scheduler
+
+
+def test_events_run_in_time_then_insertion_order() -> None:
+    scheduler = _scheduler()
+    seen: list[tuple[str, datetime]] = []
+
+    def record(name: str) -> None:
+        seen.append((name, scheduler.now()))
+
+    scheduler.schedule_in(timedelta(seconds=5), record, "late")
+    scheduler.schedule_in(timedelta(seconds=1), record, "first")
+    scheduler.schedule_in(timedelta(seconds=1), record, "second")
+    cancelled = scheduler.schedule_in(timedelta(seconds=2), record, "cancelled")
+    cancelled.cancel()
+
+    assert scheduler.run() == 3
+    assert seen == [
+        ("first", T0 + timedelta(seconds=1)),
+        ("second", T0 + timedelta(seconds=1)),
+        ("late", T0 + timedelta(seconds=5)),
+    ]
+
+
+def test_run_until_stops_at_end_and_callbacks_can_schedule() -> None:
+    scheduler = _scheduler()
+    ticks: list[datetime] = []
+
+    def tick() -> None:
+        ticks.append(scheduler.now())
+        scheduler.schedule_in(timedelta(seconds=10), tick)
+
+    scheduler.schedule_at(T0, tick)
+    assert scheduler.run_until(T0 + timedelta(seconds=25)) == 3
+    assert scheduler.now() == T0 + timedelta(seconds=25)
+    assert scheduler.next_time() == T0 + timedelta(seconds=30)
+    with pytest.raises(ValueError, match="before now"):
+        scheduler.schedule_at(T0, tick)
+
+
+def test_latency_model_per_venue_and_seeded() -> None:
+    venues = {"slow": VenueLatency(order_entry_ms=50, market_data_ms=10)}
+    model = LatencyModel(venues, default=VenueLatency(order_entry_ms=5))
+    assert model.order_delay("slow") == timedelta(milliseconds=50)
+    assert model.market_data_delay("slow") == timedelta(milliseconds=10)
+    assert model.order_delay("other") == timedelta(milliseconds=5)
+    assert model.market_data_delay("other") == timedelta(0)
+
+    jittery = VenueLatency(order_entry_ms=20, jitter_ms=5, distribution="lognormal")
+    a = LatencyModel(default=jittery, seed=1)
+    b = LatencyModel(default=jittery, seed=1)
+    samples = [a.order_delay("x").total_seconds() * 1000 for _ in range(5000)]
+    assert samples[:10] == [b.order_delay("x").total_seconds() * 1000 for _ in range(10)]
+    assert np.mean(samples) == pytest.approx(20, rel=0.05)
+    assert np.std(samples) == pytest.approx(5, rel=0.1)
+
+
+def _quote(venue: str, bid: float, ask: float, when: datetime) -> OrderbookEvent:
+    return OrderbookEvent(
+        timestamp=when,
+        venue=venue,
+        symbol="BTC-USD",
+        bid_price=bid,
+        ask_price=ask,
+        bid_size=1.0,
+        ask_size=1.0,
+    )
+
+
+def test_order_legs_fill_against_book_on_arrival() -> None:
+    scheduler = _scheduler()
+    broker = PaperBroker(10_000.0, FillModel(slippage_bps=0.0, fee_rate=0.0))
+    broker.on_orderbook(_quote("a", 99.0, 100.0, T0))
+    broker.on_orderbook(_quote("b", 101.0, 102.0, T0))
+    latency = LatencyModel(
+        {"a": VenueLatency(order_entry_ms=10), "b": VenueLatency(order_entry_ms=30)}
+    )
+    signal = Signal(
+        symbol="BTC-USD",
+        side="buy",
+        venue_buy="a",
+        venue_sell="b",
+        price_buy=100.0,
+        price_sell=101.0,
+        size=0.5,
+        expected_profit_bps=100.0,
+    )
+    fills: list[FillEvent] = []
+    broker.schedule_order(signal, scheduler, latency, on_fill=fills.append)
+    # Venue b's bid drops before the sell leg lands
+    scheduler.schedule_in(
+        timedelta(milliseconds=20), broker.on_orderbook, _quote("b", 100.5, 102.0, T0)
+    )
+    scheduler.run()
+
+    assert [(f.side, f.price, f.timestamp) for f in fills] == [
+        ("buy", 100.0, T0 + timedelta(milliseconds=10)),
+        ("sell", 100.5, T0 + timedelta(milliseconds=30)),
+    ]
+    assert broker.capital == pytest.approx(10_000.0 + 0.5 * (100.5 - 100.0))
+
+
+def test_event_backtest_latency_delays_fills() -> None:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    orderbook = gen.generate_orderbook(T0, days=1, snapshots_per_minute=4)
+    strategy = SimpleSpreadStrategy(min_spread_bps=5.0)
+
+    instant = run_event_backtest(orderbook, strategy, 100_000.0)
+    assert instant.signals["executed"].any()
+    assert instant.metrics.trade_count > 0
+    first = instant.signals.iloc[0]
+    assert instant.fills[0].timestamp == first["timestamp"]
+
+    latency = LatencyModel(default=VenueLatency(order_entry_ms=3_000, market_data_ms=1_000))
+    delayed = run_event_backtest(orderbook, strategy, 100_000.0, latency=latency)
+    signal_time = pd.Timestamp(delayed.signals.iloc[0]["timestamp"])
+    assert delayed.fills[0].timestamp == signal_time + pd.Timedelta(seconds=3)
+    assert (signal_time - pd.Timestamp(orderbook["timestamp"].min())).total_seconds() >= 1
+
+
+def test_multi_backtest_matches_separate_runs() -> None:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    orderbook = gen.generate_orderbook(T0, days=1, snapshots_per_minute=4)
+    latency = LatencyModel(default=VenueLatency(order_entry_ms=500, market_data_ms=200))
+
+    def strategies(book: TopOfBookIndex | None = None) -> list[BaseStrategy]:
+        return [
+            SimpleSpreadStrategy(min_spread_bps=5.0, book=book),
+            SimpleSpreadStrategy(min_spread_bps=20.0, book=book),
+            StatArbStrategy(window=100, fee_rate=0.0, slippage_bps=0.0),
+        ]
+
+    # The spread strategies share one top-of-book index in the joint run
+    multi = run_multi_backtest(
+        orderbook,
+        strategies(TopOfBookIndex()),
+        100_000.0,
+        latency=latency,
+        fill_model=FillModel(fill_probability=0.7, seed=3),
+    )
+    assert list(multi.results) == ["simple_spread-1", "simple_spread-2", "stat_arb"]
+    summary = multi.summary()
+    assert summary["strategy"].tolist() == list(multi.results)
+
+    for name, strategy in zip(multi.results, strategies(), strict=True):
+        alone = run_event_backtest(
+            orderbook,
+            strategy,
+            100_000.0,
+            latency=latency,
+            broker=PaperBroker(100_000.0, fill_model=FillModel(fill_probability=0.7, seed=3)),
+        )
+        pd.testing.assert_frame_equal(multi[name].signals, alone.signals)
+        assert multi[name].fills == alone.fills
+        assert multi[name].metrics == alone.metrics
+    assert (
+        multi["simple_spread-1"].metrics.trade_count > multi["simple_spread-2"].metrics.trade_count
+    )
+
+    with pytest.raises(ValueError):
+        shared = SimpleSpreadStrategy()
+        run_multi_backtest(orderbook, {"a": shared, "b": shared}, 100_000.0)
@@ -1,8 +1,13 @@
 """Tests for strategies."""
 
+import numpy as np
 import pandas as pd
 
+from ai_arb_lab.core.events import OrderbookEvent
 from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+from ai_arb_lab.strategies.stat_arb import EwmPairStats, RollingPairStats, StatArbStrategy
+from ai_arb_lab.strategies.top_of_book import TopOfBookIndex
+from ai_arb_lab.strategies.triangular import TriangularArbStrategy
 
 
 def test_simple_spread_no_signal_when_single_venue() -> None:
@@ -47,3 +52,202 @@ def test_simple_spread_rejects_small_spread() -> None:
     )
     signal = strategy.evaluate({"orderbook": ob, "symbol": "BTC-USD"})
     assert signal is None or signal.expected_profit_bps < 200.0
+
+
+def _book(venue: str, bid: float, ask: float, symbol: str = "BTC-USD") -> OrderbookEvent:
+    return OrderbookEvent(
+        venue=venue, symbol=symbol, bid_price=bid, ask_price=ask, bid_size=1, ask_size=1
+    )
+
+
+def test_top_of_book_tracks_best_across_updates() -> None:
+    index = TopOfBookIndex()
+    index.update(_book("v0", 100, 101))
+    index.update(_book("v1", 102, 103))
+    index.update(_book("v2", 99, 100))
+    assert index.best_bid("BTC-USD").venue == "v1"
+    assert index.best_ask("BTC-USD").venue == "v2"
+
+    index.update(_book("v1", 98, 99))  # v1 moves down: best bid and best ask both change
+    assert index.best_bid("BTC-USD").venue == "v0"
+    assert index.best_ask("BTC-USD").venue == "v1"
+    assert index.venue_count("BTC-USD") == 3
+    assert index.best_bid("ETH-USD") is None
+
+
+def test_top_of_book_runner_up_when_same_venue() -> None:
+    index = TopOfBookIndex()
+    index.update(_book("v0", 105, 100))  # crossed venue holds both best bid and best ask
+    index.update(_book("v1", 103, 104))
+    index.update(_book("v2", 101, 102))
+    ask, bid = index.best_cross("BTC-USD")
+    assert (ask.venue, bid.venue) == ("v0", "v1")
+
+
+def test_top_of_book_matches_brute_force_under_churn() -> None:
+    rng = np.random.default_rng(0)
+    index = TopOfBookIndex()
+    latest: dict[str, tuple[float, float]] = {}
+    for _ in range(2000):
+        venue = f"v{rng.integers(0, 8)}"
+        bid = float(rng.normal(100, 1))
+        latest[venue] = (bid, bid + 0.1)
+        index.update(_book(venue, bid, bid + 0.1))
+        assert index.best_bid("BTC-USD").price == max(b for b, _ in latest.values())
+        assert index.best_ask("BTC-USD").price == min(a for _, a in latest.values())
+
+
+def test_simple_spread_on_orderbook_matches_evaluate() -> None:
+    strategy = SimpleSpreadStrategy(min_spread_bps=5.0, fee_rate=0, slippage_bps=0)
+    assert strategy.on_orderbook(_book("venue_0", 50050, 50000)) is None
+    signal = strategy.on_orderbook(_book("venue_1", 50100, 50150))
+    ob = pd.DataFrame(
+        {
+            "venue": ["venue_0", "venue_1"],
+            "bid_price": [50050, 50100],
+            "ask_price": [50000, 50150],
+        }
+    )
+    assert signal == strategy.evaluate({"orderbook": ob, "symbol": "BTC-USD"})
+
+    strategy.reset()
+    assert strategy.book.venue_count("BTC-USD") == 0
+
+
+def _triangle(eth_btc_ask: float) -> list[OrderbookEvent]:
+    # ETH costs 3000 USD and BTC 50000 USD, so ETH-BTC is fair at 0.06
+    return [
+        _book("v0", 49990, 50010, "BTC-USD"),
+        _book("v1", 2999, 3001, "ETH-USD"),
+        _book("v0", eth_btc_ask - 0.0001, eth_btc_ask, "ETH-BTC"),
+    ]
+
+
+def test_triangular_detects_mispriced_cross_rate() -> None:
+    strategy = TriangularArbStrategy(min_profit_bps=5.0, fee_rate=0, slippage_bps=0)
+    *first, last = _triangle(0.0594)  # ETH-BTC 1% cheap
+    assert [strategy.on_orderbook(e) for e in first] == [None, None]
+    signal = strategy.on_orderbook(last)
+
+    assert signal is not None
+    # Buy ETH with BTC, sell ETH for USD, buy BTC back with USD
+    assert signal.symbol == "BTC->ETH->USD->BTC"
+    assert [(leg.symbol, leg.side, leg.venue) for leg in signal.legs] == [
+        ("ETH-BTC", "buy", "v0"),
+        ("ETH-USD", "sell", "v1"),
+        ("BTC-USD", "buy", "v0"),
+    ]
+    expected = (1 / 0.0594 * 2999 / 50010 - 1) * 10000
+    assert abs(signal.expected_profit_bps - expected) < 1e-6
+    assert signal == strategy.evaluate(
+        {"orderbook": pd.DataFrame([e.model_dump() for e in first + [last]])}
+    )
+
+
+def test_triangular_costs_and_consistent_rates_give_no_signal() -> None:
+    fair = TriangularArbStrategy(fee_rate=0, slippage_bps=0)
+    assert all(fair.on_orderbook(e) is None for e in _triangle(0.06))
+    # A 1% edge does not survive 0.5% costs on each of three legs
+    costly = TriangularArbStrategy(fee_rate=0.005, slippage_bps=0)
+    assert all(costly.on_orderbook(e) is None for e in _triangle(0.0594))
+
+
+def test_triangular_only_rechecks_changed_edges() -> None:
+    strategy = TriangularArbStrategy(fee_rate=0, slippage_bps=0)
+    for event in _triangle(0.06):
+        strategy.on_orderbook(event)
+    # A worse quote on another venue leaves both best rates unchanged
+    assert strategy.graph.update(_book("v9", 49000, 51000, "BTC-USD")) == []
+    assert len(strategy.graph.update(_book("v9", 49995, 51000, "BTC-USD"))) == 1
+
+    strategy.reset()
+    assert strategy.graph.edges == {}
+
+
+def test_triangular_incremental_matches_full_scan() -> None:
+    rng = np.random.default_rng(1)
+    strategy = TriangularArbStrategy(min_profit_bps=0.0, fee_rate=0.001, slippage_bps=0)
+    graph = strategy.graph
+    prices = {"USD": 1.0, "BTC": 50000.0, "ETH": 3000.0, "SOL": 150.0, "XRP": 0.5}
+    names = list(prices)
+    profitable = False
+    for _ in range(3000):
+        i, j = sorted(rng.choice(len(names), 2, replace=False))
+        mid = prices[names[j]] / prices[names[i]] * (1 + rng.normal(0, 0.001))
+        event = _book("v0", mid * 0.9999, mid * 1.0001, f"{names[j]}-{names[i]}")
+        signal = strategy.on_orderbook(event)
+        full = graph.best_cycle()
+        now_profitable = full is not None and full.weight < 0
+        # A cycle that just became profitable must go through a changed edge
+        if now_profitable and not profitable:
+            assert signal is not None
+        if signal is not None:
+            assert full is not None and signal.expected_profit_bps <= full.profit_bps + 1e-9
+        profitable = now_profitable
+
+
+def test_rolling_pair_stats_match_last_window() -> None:
+    rng = np.random.default_rng(2)
+    x = 10.8 + rng.normal(0, 1e-4, 1234).cumsum()
+    y = 0.5 * x + rng.normal(0, 1e-4, 1234)
+    stats = RollingPairStats(window=50)
+    for i, (a, b) in enumerate(zip(x, y, strict=True)):
+        stats.update(a, b)
+        if i in (10, 49, 777, 1233):
+            xs, ys = x[max(0, i - 49) : i + 1], y[max(0, i - 49) : i + 1]
+            assert stats.ready == (i >= 49)
+            assert np.isclose(stats.mean_x, xs.mean(), rtol=0, atol=1e-12)
+            assert np.isclose(stats.var_y, ys.var(), rtol=1e-9, atol=0)
+            assert np.isclose(stats.cov, np.cov(xs, ys, ddof=0)[0, 1], rtol=1e-9, atol=0)
+
+
+def test_ewm_pair_stats_match_pandas() -> None:
+    rng = np.random.default_rng(3)
+    x = pd.Series(rng.normal(size=300))
+    y = x + pd.Series(rng.normal(size=300))
+    stats = EwmPairStats(window=20)
+    for a, b in zip(x, y, strict=True):
+        stats.update(a, b)
+    ewm = x.ewm(span=20, adjust=False)
+    assert np.isclose(stats.mean_x, ewm.mean().iloc[-1])
+    assert np.isclose(stats.var_x, ewm.var(bias=True).iloc[-1])
+    assert np.isclose(stats.cov, ewm.cov(y, bias=True).iloc[-1])
+
+
+def _pair_ticks(spread_bps: list[float]) -> list[OrderbookEvent]:
+    # venue_1 quotes venue_0's price shifted by spread_bps, one tick each
+    events = []
+    for i, bps in enumerate(spread_bps):
+        price = 50000 + 10 * np.sin(i / 7)
+        events.append(_book("venue_0", price - 1, price + 1))
+        shifted = price * (1 + bps / 10000)
+        events.append(_book("venue_1", shifted - 1, shifted + 1))
+    return events
+
+
+def test_stat_arb_enters_on_divergence_and_exits_on_reversion() -> None:
+    rng = np.random.default_rng(4)
+    noise = list(rng.normal(0, 1, 200))
+    strategy = StatArbStrategy(window=100, entry_z=3.0, exit_z=0.5, fee_rate=0, slippage_bps=0)
+    ticks = _pair_ticks(noise + [25.0] + [0.0] * 50)
+    signals = [s for e in ticks if (s := strategy.on_orderbook(e))]
+
+    entry, exit_ = signals
+    # venue_1 jumps rich against venue_0: buy venue_0, sell venue_1
+    assert (entry.side, entry.venue_buy, entry.venue_sell) == ("buy", "venue_0", "venue_1")
+    assert [leg.side for leg in entry.legs] == ["buy", "sell"]
+    assert entry.expected_profit_bps > 0
+    # Back to the mean: unwind both legs
+    assert (exit_.side, exit_.venue_buy, exit_.venue_sell) == ("sell", "venue_1", "venue_0")
+    assert strategy.position == "flat"
+
+    strategy.reset()
+    assert strategy.stats.count == 0 and strategy.leg_a is None
+    # evaluate keeps rolling state: the same ticks give the same z-score
+    window = pd.DataFrame([e.model_dump() for e in ticks[:300]])
+    strategy.evaluate({"orderbook": window})
+    streamed = StatArbStrategy(window=100, entry_z=3.0, exit_z=0.5)
+    for event in ticks[:300]:
+        streamed.on_orderbook(event)
+    assert strategy.zscore == streamed.zscore
+    assert strategy.stats.count == 100
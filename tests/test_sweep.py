@@ -0,0 +1,66 @@
+"""Tests for parallel parameter sweeps."""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ai_arb_lab.backtest.engine import WindowQuotes, compute_window_quotes
+from ai_arb_lab.backtest.sweep import (
+    SharedQuotes,
+    expand_grid,
+    parse_param,
+    run_point,
+    run_sweep,
+)
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+
+
+@pytest.fixture
+def quotes() -> WindowQuotes:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    ob = gen.generate_orderbook(datetime(2025, 1, 1), days=1, snapshots_per_minute=4)
+    return compute_window_quotes(ob)
+
+
+def test_expand_grid() -> None:
+    points = expand_grid({"min_spread_bps": [1, 2], "fee_rate": [0.0, 0.001, 0.002]})
+    assert len(points) == 6
+    assert points[0] == {"min_spread_bps": 1, "fee_rate": 0.0}
+    assert points[-1] == {"min_spread_bps": 2, "fee_rate": 0.002}
+    with pytest.raises(ValueError):
+        expand_grid({"not_a_param": [1]})
+
+
+def test_parse_param() -> None:
+    assert parse_param("min_spread_bps=5,10.5") == ("min_spread_bps", [5.0, 10.5])
+    with pytest.raises(ValueError):
+        parse_param("min_spread_bps")
+    with pytest.raises(ValueError):
+        parse_param("fee_rate=a,b")
+
+
+def test_shared_quotes_roundtrip(quotes: WindowQuotes) -> None:
+    with SharedQuotes.create(quotes) as shared:
+        attached = SharedQuotes.attach(shared.spec)
+        view = attached.quotes()
+        assert view.windows.equals(quotes.windows)
+        assert view.venues == quotes.venues
+        assert list(view.symbols) == list(quotes.symbols)
+        np.testing.assert_array_equal(view.best_bid, quotes.best_bid)
+        np.testing.assert_array_equal(view.present, quotes.present)
+        del view
+        attached.close()
+
+
+def test_parallel_sweep_matches_serial(quotes: WindowQuotes) -> None:
+    grid = {"min_spread_bps": [0.0, 2.0, 5.0], "fee_rate": [0.0, 0.0005], "slippage_bps": [0.0]}
+    parallel = run_sweep(quotes, grid, initial_capital=100_000, workers=2)
+    serial = run_sweep(quotes, grid, initial_capital=100_000, workers=1)
+
+    assert list(parallel["point"]) == list(range(6))
+    assert parallel["signal_count"].max() > 0
+    pd.testing.assert_frame_equal(parallel, serial)
+    expected = run_point(quotes, expand_grid(grid)[4], 100_000)
+    assert parallel.iloc[4]["signal_count"] == expected["signal_count"]
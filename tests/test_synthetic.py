@@ -1,10 +1,12 @@
 """Tests for synthetic market generator."""
 
 from datetime import datetime
+from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator, cross_symbols
 
 
 def test_synthetic_generator_creates_trades() -> None:
@@ -45,3 +47,53 @@ def test_synthetic_generate_all(tmp_path: str) -> None:
     assert paths["trades"].exists()
     assert paths["orderbook"].exists()
     assert paths["candles"].exists()
+
+
+def test_synthetic_chunk_size_does_not_change_output() -> None:
+    gen = SyntheticMarketGenerator(seed=7, n_venues=3)
+    start = datetime(2025, 1, 1)
+    whole = gen.generate_orderbook(start, days=1)
+    chunked = pd.concat(gen.iter_orderbook(start, days=1, chunk_size=97), ignore_index=True)
+    pd.testing.assert_frame_equal(chunked, whole, check_exact=True)
+
+    trades = pd.concat(gen.iter_trades(start, days=1, chunk_size=1000), ignore_index=True)
+    pd.testing.assert_frame_equal(trades, gen.generate_trades(start, days=1), check_exact=True)
+
+
+def test_synthetic_generate_all_streams_chunks(tmp_path: Path) -> None:
+    gen = SyntheticMarketGenerator(seed=7)
+    start = datetime(2025, 1, 1)
+    gen.generate_all(tmp_path / "a", start=start, days=2)
+    gen.generate_all(tmp_path / "b", start=start, days=2, chunk_size=333)
+    for name in ("trades.csv", "orderbook.csv"):
+        assert (tmp_path / "a" / name).read_bytes() == (tmp_path / "b" / name).read_bytes()
+    candles = pd.read_parquet(tmp_path / "b" / "candles.parquet")
+    assert len(candles) == 2 * 24 * 4
+    assert candles["timestamp"].is_monotonic_increasing
+
+
+def test_synthetic_venues_are_categorical() -> None:
+    ob = SyntheticMarketGenerator(seed=1, n_venues=3).generate_orderbook(datetime(2025, 1, 1))
+    assert isinstance(ob["venue"].dtype, pd.CategoricalDtype)
+    assert list(ob["venue"].iloc[:4]) == ["venue_0", "venue_1", "venue_2", "venue_0"]
+
+
+def test_synthetic_cross_orderbook_has_consistent_rates() -> None:
+    gen = SyntheticMarketGenerator(seed=3, n_venues=2, volatility=0.001)
+    start = datetime(2025, 1, 1)
+    currencies = {"USD": 1.0, "BTC": 50000.0, "ETH": 3000.0}
+    assert cross_symbols(list(currencies)) == ["BTC-USD", "ETH-USD", "ETH-BTC"]
+    ob = gen.generate_cross_orderbook(start, days=1, currencies=currencies, snapshots_per_minute=6)
+    assert set(ob["symbol"]) == {"BTC-USD", "ETH-USD", "ETH-BTC"}
+
+    # One round quotes every symbol on every venue at the same cross rates
+    mid = ((ob["bid_price"] + ob["ask_price"]) / 2).to_numpy().reshape(-1, 3, 2)
+    assert np.allclose(mid[:, 1] / mid[:, 0], mid[:, 2], rtol=1e-12)
+
+    chunked = pd.concat(
+        gen.iter_cross_orderbook(
+            start, days=1, currencies=currencies, snapshots_per_minute=6, chunk_size=7
+        ),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(chunked, ob, check_exact=True)
@@ -0,0 +1,101 @@
+"""Tests for pipeline telemetry."""
+
+import urllib.request
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+
+from ai_arb_lab.core.bus import EventBus
+from ai_arb_lab.core.telemetry import (
+    BUS_PUBLISH,
+    RISK_CHECK,
+    TELEMETRY,
+    LatencyHistogram,
+    MetricsServer,
+    Telemetry,
+)
+from ai_arb_lab.risk.limits import RiskLimits
+from ai_arb_lab.strategies.base import Signal
+
+
+@pytest.fixture
+def telemetry() -> Iterator[Telemetry]:
+    TELEMETRY.enable()
+    yield TELEMETRY
+    TELEMETRY.disable()
+    TELEMETRY.reset()
+
+
+def test_quantiles_within_bucket_precision() -> None:
+    values = np.random.default_rng(1).lognormal(9.0, 1.5, 50_000).astype(np.int64)
+    hist = LatencyHistogram()
+    for value in values.tolist():
+        hist.record(value)
+
+    qs = hist.quantiles()
+    for q in (0.5, 0.9, 0.99):
+        exact = np.quantile(values, q, method="inverted_cdf")
+        assert hist.quantile(q) == qs[q]
+        assert qs[q] == pytest.approx(exact, rel=1 / 32)
+    assert (hist.count, hist.min, hist.max) == (len(values), values.min(), values.max())
+    assert hist.quantile(1.0) == values.max()
+
+
+def test_small_values_are_exact_and_merge() -> None:
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for value in range(64):
+        (a if value % 2 else b).record(value)
+    a.merge(b)
+
+    assert a.count == 64 and a.min == 0 and a.max == 63
+    assert a.quantile(0.5) == 31
+    assert a.mean == pytest.approx(31.5)
+
+
+def test_disabled_telemetry_records_nothing() -> None:
+    registry = Telemetry()
+    stage = registry.stage("work")
+    stage.stop(stage.start())
+    registry.count("events")
+    assert stage.histogram.count == 0 and registry.counters == {}
+
+    registry.enable()
+    stage.stop(stage.start())
+    registry.count("events", 3)
+    assert stage.histogram.count == 1 and registry.counters == {"events": 3}
+
+
+async def test_pipeline_stages_are_timed(telemetry: Telemetry) -> None:
+    bus = EventBus()
+    await bus.publish_many([])
+    signal = Signal(
+        symbol="BTC-USD",
+        side="buy",
+        venue_buy="v1",
+        venue_sell="v2",
+        price_buy=100.0,
+        price_sell=101.0,
+        size=1.0,
+        expected_profit_bps=100.0,
+    )
+    RiskLimits().check(signal, 100_000.0)
+
+    summary = telemetry.to_dict()
+    assert summary["stages"][BUS_PUBLISH]["count"] == 1
+    assert summary["stages"][RISK_CHECK]["p99_us"] > 0
+
+
+def test_metrics_endpoint_serves_prometheus_text() -> None:
+    registry = Telemetry(enabled=True)
+    registry.stage("risk_check").record(2_000)
+    registry.count("events", 5)
+
+    with MetricsServer(0, telemetry=registry) as server:
+        url = f"http://127.0.0.1:{server.port}/metrics"
+        body = urllib.request.urlopen(url, timeout=5).read().decode()
+
+    assert 'ai_arb_lab_stage_latency_seconds{stage="risk_check",quantile="0.99"} 2e-06' in body
+    assert 'ai_arb_lab_stage_latency_seconds_count{stage="risk_check"} 1' in body
+    assert "ai_arb_lab_events_total 5" in body
+    assert "ai_arb_lab_events_per_second" in body
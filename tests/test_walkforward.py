@@ -0,0 +1,79 @@
+"""Tests for walk-forward optimization."""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from ai_arb_lab.backtest.engine import WindowQuotes, compute_window_quotes, scan_spreads
+from ai_arb_lab.backtest.sweep import run_point
+from ai_arb_lab.backtest.walkforward import run_walk_forward, walk_forward_splits
+from ai_arb_lab.data.synthetic import SyntheticMarketGenerator
+from ai_arb_lab.strategies.simple_spread import SimpleSpreadStrategy
+
+START = datetime(2025, 1, 1)
+GRID = {"min_spread_bps": [0.0, 2.0, 50.0], "fee_rate": [0.0], "slippage_bps": [0.0]}
+
+
+@pytest.fixture
+def quotes() -> WindowQuotes:
+    gen = SyntheticMarketGenerator(seed=5, n_venues=3, volatility=0.001)
+    ob = gen.generate_orderbook(START, days=1, snapshots_per_minute=4)
+    return compute_window_quotes(ob)
+
+
+def _uncached_slice(quotes: WindowQuotes, part: WindowQuotes) -> WindowQuotes:
+    lo = int(quotes.windows.searchsorted(part.windows[0]))
+    uncached = WindowQuotes(
+        windows=quotes.windows,
+        symbols=quotes.symbols,
+        venues=quotes.venues,
+        best_bid=quotes.best_bid,
+        best_ask=quotes.best_ask,
+        present=quotes.present,
+        row_count=quotes.row_count,
+    )
+    return uncached.slice(lo, lo + len(part))
+
+
+def test_rolling_and_anchored_splits() -> None:
+    rolling = walk_forward_splits(START, datetime(2025, 1, 11), "3D", "2D")
+    assert len(rolling) == 3
+    assert rolling[1].train_start == pd.Timestamp("2025-01-03")
+    assert rolling[1].test_start == pd.Timestamp("2025-01-06")
+    assert rolling[-1].test_end == pd.Timestamp("2025-01-10")
+
+    anchored = walk_forward_splits(START, datetime(2025, 1, 11), "3D", "2D", mode="anchored")
+    assert {s.train_start for s in anchored} == {pd.Timestamp(START)}
+    assert [s.test_start for s in anchored] == [s.test_start for s in rolling]
+
+
+def test_slices_share_cached_spreads(quotes: WindowQuotes) -> None:
+    spreads = quotes.spreads()
+    part = quotes.between(datetime(2025, 1, 1, 6), datetime(2025, 1, 1, 12))
+    assert len(part) == 6 * 60
+    assert part.spreads().spread_bps.base is spreads.spread_bps
+    strategy = SimpleSpreadStrategy(min_spread_bps=0.0, fee_rate=0.0, slippage_bps=0.0)
+    fresh = _uncached_slice(quotes, part)
+    pd.testing.assert_frame_equal(scan_spreads(part, strategy), scan_spreads(fresh, strategy))
+
+
+def test_walk_forward_picks_best_train_candidate(quotes: WindowQuotes) -> None:
+    result = run_walk_forward(quotes, GRID, 100_000, train="6h", test="2h", workers=1)
+    assert len(result.splits) == 9
+    assert len(result.trials) == 9 * 3
+
+    first = result.splits.iloc[0]
+    trials = result.trials[result.trials["split"] == 0]
+    assert first["train_total_return"] == trials["total_return"].max()
+    test = quotes.between(first["test_start"], first["test_end"])
+    params = {name: first[name] for name in GRID}
+    assert first["test_trade_count"] == run_point(test, params, 100_000)["trade_count"]
+
+
+def test_walk_forward_parallel_matches_serial(quotes: WindowQuotes) -> None:
+    kwargs = {"train": "8h", "test": "4h", "mode": "anchored"}
+    serial = run_walk_forward(quotes, GRID, 100_000, workers=1, **kwargs)
+    parallel = run_walk_forward(quotes, GRID, 100_000, workers=2, **kwargs)
+    pd.testing.assert_frame_equal(serial.splits, parallel.splits)
+    pd.testing.assert_frame_equal(serial.trials, parallel.trials)